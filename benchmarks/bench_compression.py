@@ -0,0 +1,156 @@
+"""响应压缩基准：各编码在不同负载大小下的压缩耗时，以及中间件的延迟分布与 CPU 开销。
+
+``run.py`` 收录各编码的单次压缩耗时；直接运行本文件输出并发场景下的延迟报告::
+
+    python benchmarks/bench_compression.py
+
+报告以开环方式按固定间隔发送请求（压缩需求约占单核 80%），对比在事件循环中直接压缩
+（inline）与交给线程池压缩（offload）：从到达到完成的 p50/p99 延迟、1ms 定时器的 p99
+唤醒延迟（事件循环响应性）、每个响应消耗的 CPU 时间与压缩率。
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from harness import benchmark, quantile  # noqa: E402
+
+SIZES = {"1k": 1 << 10, "64k": 1 << 16, "1m": 1 << 20}
+
+
+def _payload(size: int) -> bytes:
+    """生成接近 ``size`` 字节的 Envelope JSON。"""
+
+    items = []
+    total = 0
+    index = 0
+    while total < size:
+        item = {"id": f"urn:sf:entity:{index}", "label": f"Entity {index}", "score": index % 97 / 97}
+        items.append(item)
+        total += len(json.dumps(item)) + 1
+        index += 1
+    envelope = {"code": 2000, "message": "请求成功", "data": items, "traceId": "bench", "meta": {"version": "v1"}}
+    return json.dumps(envelope, ensure_ascii=False).encode("utf-8")
+
+
+def _codecs():
+    from common.config.settings import CompressionConfig
+    from common.utils.compression import build_codecs
+
+    return build_codecs(CompressionConfig())
+
+
+def _register(codec_name: str, size_name: str, size: int) -> None:
+    @benchmark(f"compression.{codec_name}.{size_name}")
+    def factory():
+        codec = _codecs()[codec_name]
+        data = _payload(size)
+        return lambda: codec.compress(data)
+
+
+# 仅注册已安装的编码，zstd/br 依赖可选包
+for _name in _codecs():
+    for _size_name, _size in SIZES.items():
+        _register(_name, _size_name, _size)
+
+
+def _app(body: bytes):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+async def _request(middleware, encoding: str) -> tuple[float, int]:
+    scope = {"type": "http", "method": "GET", "headers": [(b"accept-encoding", encoding.encode())]}
+    sent = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    started = time.perf_counter()
+    await middleware(scope, receive, send)
+    return time.perf_counter() - started, sent
+
+
+async def _scenario(codec_name: str, size: int, *, offload: bool, requests: int, utilisation: float) -> dict[str, float]:
+    from common.config.settings import CompressionConfig
+    from common.utils.compression import CompressionMiddleware
+
+    payload = _payload(size)
+    config = CompressionConfig(minimum_size=0, offload_size=0 if offload else 1 << 62)
+    middleware = CompressionMiddleware(_app(payload), config=config)
+    codec = _codecs()[codec_name]
+    started = time.perf_counter()
+    for _ in range(5):
+        codec.compress(payload)
+    # 开环到达：按单次压缩耗时设定到达间隔，使压缩需求约占单核的 utilisation
+    interval = (time.perf_counter() - started) / 5 / utilisation
+    latencies: list[float] = []
+    lags: list[float] = []
+    compressed = 0
+    done = False
+
+    async def one(arrival: float) -> None:
+        nonlocal compressed
+        await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+        _, sent = await _request(middleware, codec_name)
+        latencies.append(time.perf_counter() - arrival)
+        compressed = sent
+
+    async def probe() -> None:
+        # 事件循环响应性：1ms 定时器的实际唤醒延迟
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - before - 0.001)
+
+    await _request(middleware, codec_name)  # 预热线程池与编码器
+    probe_task = asyncio.create_task(probe())
+    cpu = time.process_time()
+    origin = time.perf_counter() + 0.01
+    await asyncio.gather(*(one(origin + i * interval) for i in range(requests)))
+    cpu = time.process_time() - cpu
+    done = True
+    await probe_task
+    await middleware.aclose()
+    latencies.sort()
+    lags.sort()
+    return {
+        "p50_ms": quantile(latencies, 0.5) * 1000,
+        "p99_ms": quantile(latencies, 0.99) * 1000,
+        "lag_p99_ms": quantile(lags, 0.99) * 1000 if lags else 0.0,
+        "cpu_ms": cpu / requests * 1000,
+        "ratio": compressed / len(payload),
+    }
+
+
+def report(*, requests: int = 200, utilisation: float = 0.8) -> None:
+    codecs = _codecs()
+    print(f"{'codec':<6} {'size':>5} {'mode':<8} {'p50_ms':>9} {'p99_ms':>9} {'lag_p99':>9} {'cpu_ms':>8} {'ratio':>6}")
+    for codec_name in codecs:
+        for size_name, size in SIZES.items():
+            for offload in (False, True):
+                stats = asyncio.run(
+                    _scenario(codec_name, size, offload=offload, requests=requests, utilisation=utilisation)
+                )
+                mode = "offload" if offload else "inline"
+                print(
+                    f"{codec_name:<6} {size_name:>5} {mode:<8} {stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f} "
+                    f"{stats['lag_p99_ms']:>9.3f} {stats['cpu_ms']:>8.3f} {stats['ratio']:>6.3f}"
+                )
+
+
+if __name__ == "__main__":
+    report()
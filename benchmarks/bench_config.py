@@ -0,0 +1,62 @@
+"""配置加载与访问基准。"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from fixtures import BENCH_ENV, ensure_config
+from harness import benchmark
+
+_SRC = str(Path(__file__).resolve().parents[1] / "src")
+_COLD_SCRIPT = (
+    "import time; t=time.perf_counter(); "
+    "from common.config import load_config; "
+    f"load_config(env={BENCH_ENV!r}); "
+    "print(time.perf_counter()-t)"
+)
+
+
+@benchmark("config.load_config.cold", budget=0.25, external=True)
+def load_config_cold():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_SRC, env.get("PYTHONPATH")]))
+
+    def run() -> float:
+        proc = subprocess.run(
+            [sys.executable, "-c", _COLD_SCRIPT],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        return float(proc.stdout.strip().splitlines()[-1])
+
+    return run
+
+
+@benchmark("config.load_config.warm")
+def load_config_warm():
+    from common.config import load_config
+
+    load_config(env=BENCH_ENV)
+    return lambda: load_config(env=BENCH_ENV)
+
+
+@benchmark("config.manager.get")
+def manager_get():
+    manager = ensure_config()
+    return lambda: manager.get("rdf.timeout.default")
+
+
+@benchmark("config.manager.get.miss")
+def manager_get_miss():
+    manager = ensure_config()
+    return lambda: manager.get("rdf.timeout.unknown", 0)
+
+
+@benchmark("config.manager.snapshot")
+def manager_snapshot():
+    manager = ensure_config()
+    return manager.snapshot
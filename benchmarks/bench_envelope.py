@@ -0,0 +1,30 @@
+"""响应 Envelope 构造与序列化基准。"""
+from __future__ import annotations
+
+from fixtures import ensure_config
+from harness import benchmark
+
+_TRACE_ID = "0f8fad5b-d9cb-469f-a165-70867728950e"
+
+
+def _page(size: int) -> list[dict[str, object]]:
+    return [{"id": f"urn:sf:entity:{i}", "label": f"Entity {i}", "score": i / size} for i in range(size)]
+
+
+@benchmark("envelope.success.json_ready.small")
+def success_small():
+    from common.models.envelope import Envelope, EnvelopeMeta
+
+    ensure_config()
+    data = {"id": "urn:sf:entity:1", "label": "Entity"}
+    return lambda: Envelope.success(data=data, trace_id=_TRACE_ID, meta=EnvelopeMeta()).json_ready()
+
+
+@benchmark("envelope.success.json_ready.page500")
+def success_page():
+    from common.models.envelope import Envelope, EnvelopeMeta, PagingMeta
+
+    ensure_config()
+    data = _page(500)
+    paging = PagingMeta(total=5000, offset=0, size=500, next_offset=500)
+    return lambda: Envelope.success(data=data, trace_id=_TRACE_ID, meta=EnvelopeMeta(paging=paging)).json_ready()
@@ -0,0 +1,39 @@
+"""异常构造、抛出与违规合并基准。"""
+from __future__ import annotations
+
+from harness import benchmark
+
+
+def _raise_and_catch(factory):
+    from common.exceptions.api import ContractViolation
+
+    def fail():
+        raise factory()
+
+    def op():
+        try:
+            fail()
+        except ContractViolation:
+            pass
+
+    return op
+
+
+@benchmark("errors.contract_violation.new")
+def contract_violation_new():
+    from common.exceptions.api import ContractViolation
+
+    return _raise_and_catch(lambda: ContractViolation("契约校验失败"))
+
+
+@benchmark("errors.violation_collector.1000")
+def violation_collector():
+    from common.exceptions.api import ViolationCollector
+
+    def op():
+        collector = ViolationCollector()
+        for index in range(1000):
+            collector.add("value out of range", loc=(index, "score"))
+        return collector.build()
+
+    return op
@@ -0,0 +1,63 @@
+"""异常处理器基准，直接以构造的 Request 调用处理函数。"""
+from __future__ import annotations
+
+from fixtures import ensure_config, run_sync
+from harness import benchmark
+
+
+def _request():
+    from starlette.requests import Request
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/bench",
+        "headers": [(b"x-trace-id", b"0f8fad5b-d9cb-469f-a165-70867728950e")],
+        "query_string": b"",
+    }
+    return Request(scope)
+
+
+@benchmark("handlers.api_error")
+def api_error():
+    from common.exceptions.api import ContractViolation
+    from common.exceptions.handlers import api_error_handler
+
+    ensure_config()
+    request = _request()
+    exc = ContractViolation("payload invalid", details={"field": "name"})
+    return lambda: run_sync(api_error_handler(request, exc))
+
+
+@benchmark("handlers.validation_error")
+def validation_error():
+    from fastapi.exceptions import RequestValidationError
+
+    from common.exceptions.handlers import validation_error_handler
+
+    ensure_config()
+    request = _request()
+    exc = RequestValidationError([{"loc": ("body", "name"), "msg": "field required", "type": "missing"}])
+    return lambda: run_sync(validation_error_handler(request, exc))
+
+
+@benchmark("handlers.http_exception")
+def http_exception():
+    from starlette.exceptions import HTTPException
+
+    from common.exceptions.handlers import http_exception_handler
+
+    ensure_config()
+    request = _request()
+    exc = HTTPException(status_code=404, detail="not found")
+    return lambda: run_sync(http_exception_handler(request, exc))
+
+
+@benchmark("handlers.unhandled")
+def unhandled():
+    from common.exceptions.handlers import unhandled_exception_handler
+
+    ensure_config()
+    request = _request()
+    exc = RuntimeError("boom")
+    return lambda: run_sync(unhandled_exception_handler(request, exc))
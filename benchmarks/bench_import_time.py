@@ -0,0 +1,124 @@
+"""基于 ``python -X importtime`` 的导入耗时回归检查。
+
+每个目标模块在全新解释器中导入多次，取累计耗时中位数与 ``import_budgets.json`` 中的预算比较；
+同时检查导入链中不得出现的重依赖（如轻量模块不应拉起 pydantic/FastAPI）。
+
+预算不是绝对毫秒数，而是相对参照耗时的倍数（``budget_ratio``）：参照为同一解释器执行
+``python -S -c pass`` 的墙钟耗时中位数（``-S`` 不加载 site，参照不受已安装包的 ``.pth`` 影响），
+因此预算随机器快慢等比缩放，可以在开发机与 CI 之间共用。
+
+用法::
+
+    python benchmarks/bench_import_time.py            # 校验预算，超出时退出码为 1
+    python benchmarks/bench_import_time.py --update   # 以当前测量值重写预算
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET_FILE = Path(__file__).with_name("import_budgets.json")
+
+
+def _measure_once(module: str) -> tuple[float, set[str]]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    env.pop("PYTHONWARNINGS", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative_us: float | None = None
+    imported: set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = float(parts[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"未在 importtime 输出中找到模块: {module}")
+    return cumulative_us / 1000.0, imported
+
+
+def measure_reference(repeat: int) -> float:
+    """返回 ``python -S -c pass`` 的墙钟耗时中位数（毫秒）。"""
+
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-S", "-c", "pass"], check=True)
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+def measure(module: str, repeat: int) -> tuple[float, set[str]]:
+    """返回目标模块累计导入耗时中位数（毫秒）与导入链涉及的顶层包。"""
+
+    samples: list[float] = []
+    imported: set[str] = set()
+    for _ in range(repeat):
+        elapsed, names = _measure_once(module)
+        samples.append(elapsed)
+        imported |= names
+    return statistics.median(samples), imported
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="以当前测量值（含余量）重写预算文件")
+    parser.add_argument("--repeat", type=int, default=None, help="每个模块的测量次数")
+    args = parser.parse_args(argv)
+
+    config = json.loads(BUDGET_FILE.read_text(encoding="utf-8"))
+    repeat = args.repeat or config.get("repeat", 7)
+    headroom = config.get("headroom", 1.5)
+    min_ratio = config.get("min_budget_ratio", 0.3)
+    failures: list[str] = []
+
+    reference_ms = measure_reference(repeat)
+    print(f"参照 python -S -c pass: {reference_ms:.1f}ms")
+    print(f"{'module':<32} {'median_ms':>10} {'ratio':>7} {'budget':>7}  status")
+    for module, spec in config["targets"].items():
+        median_ms, imported = measure(module, repeat)
+        ratio = median_ms / reference_ms
+        leaked = sorted(set(spec.get("forbid", ())) & imported)
+        budget = spec["budget_ratio"]
+        status = "ok"
+        if leaked:
+            status = f"FORBIDDEN {','.join(leaked)}"
+            failures.append(f"{module} 导入了禁止的依赖: {', '.join(leaked)}")
+        elif ratio > budget and not args.update:
+            status = "OVER BUDGET"
+            failures.append(
+                f"{module} 导入耗时 {median_ms:.1f}ms（参照的 {ratio:.2f} 倍）超出预算 {budget} 倍"
+                f"（{budget * reference_ms:.1f}ms）"
+            )
+        if args.update:
+            spec["budget_ratio"] = max(min_ratio, math.ceil(ratio * headroom * 100) / 100)
+        print(f"{module:<32} {median_ms:>10.1f} {ratio:>7.2f} {budget:>7}  {status}")
+
+    if args.update:
+        BUDGET_FILE.write_text(json.dumps(config, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
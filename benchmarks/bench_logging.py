@@ -0,0 +1,18 @@
+"""日志格式化基准。"""
+from __future__ import annotations
+
+import logging
+
+from harness import benchmark
+
+
+@benchmark("logging.json_formatter.format")
+def json_formatter_format():
+    from common.logging.logger_factory import JsonFormatter
+
+    formatter = JsonFormatter()
+    record = logging.LogRecord("bench", logging.INFO, __file__, 1, "fuseki query %s took %.3fs", ("select", 0.125), None)
+    record.trace_id = "0f8fad5b-d9cb-469f-a165-70867728950e"
+    record.operation = "query"
+    record.status = 200
+    return lambda: formatter.format(record)
@@ -0,0 +1,11 @@
+"""Prometheus 埋点基准。"""
+from __future__ import annotations
+
+from harness import benchmark
+
+
+@benchmark("metrics.observe_fuseki_response")
+def observe_fuseki_response():
+    from common.observability.metrics import observe_fuseki_response
+
+    return lambda: observe_fuseki_response("query", 200, 0.125)
@@ -0,0 +1,20 @@
+"""进程内令牌桶限流基准。"""
+from __future__ import annotations
+
+import itertools
+
+from harness import benchmark
+
+_CLIENTS = 50_000
+
+
+@benchmark("ratelimit.token_bucket.take.50k_clients")
+def token_bucket_take():
+    from common.config.settings import RateLimitConfig
+    from common.utils.ratelimit import TokenBucketLimiter
+
+    limiter = TokenBucketLimiter(RateLimitConfig(max_clients=_CLIENTS))
+    clients = itertools.cycle([f"client-{i}" for i in range(_CLIENTS)])
+    for _ in range(_CLIENTS):
+        limiter.take(next(clients))
+    return lambda: limiter.take(next(clients))
@@ -0,0 +1,67 @@
+"""RDF 批量写入基准：逐实体 UPDATE vs 分块并发写入，使用带固定事务开销的本地替身端点。"""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from harness import benchmark
+
+_ENTITIES = 500
+_TRIPLES_PER_ENTITY = 10
+_GRAPH = "urn:sf:bench:v1:testing"
+_REQUEST_OVERHEAD = 0.002
+
+
+def _store():
+    from common.rdf.memory import InMemorySparqlStore
+
+    class LatencyStore(InMemorySparqlStore):
+        """模拟 Fuseki 每次请求的事务开销。"""
+
+        async def update(self, sparql: str, *, timeout: float | None = None) -> None:
+            await asyncio.sleep(_REQUEST_OVERHEAD)
+            await super().update(sparql, timeout=timeout)
+
+    return LatencyStore()
+
+
+def _entity(i: int) -> list[tuple[str, str, object]]:
+    from common.rdf.terms import Literal
+
+    subject = f"http://example.org/entity/{i}"
+    return [(subject, f"http://example.org/p{j}", Literal(f"value {i}-{j}")) for j in range(_TRIPLES_PER_ENTITY)]
+
+
+@benchmark("rdf.bulk_5000.per_entity_update", external=True)
+def per_entity():
+    from common.rdf import sparql
+    from common.rdf.terms import triple_line
+
+    async def run() -> None:
+        store = _store()
+        for i in range(_ENTITIES):
+            await store.update(sparql.insert_data(_GRAPH, [triple_line(*t) for t in _entity(i)]))
+
+    def measure() -> float:
+        started = time.perf_counter()
+        asyncio.run(run())
+        return time.perf_counter() - started
+
+    return measure
+
+
+@benchmark("rdf.bulk_5000.bulk_writer", external=True)
+def bulk_writer():
+    from common.config.settings import RetryConfig
+    from common.rdf.bulk import BulkWriter
+
+    async def run() -> None:
+        writer = BulkWriter(_store(), retry=RetryConfig(), chunk_bytes=64 * 1024, parallelism=4)
+        await writer.write((t for i in range(_ENTITIES) for t in _entity(i)), graph=_GRAPH)
+
+    def measure() -> float:
+        started = time.perf_counter()
+        asyncio.run(run())
+        return time.perf_counter() - started
+
+    return measure
@@ -0,0 +1,95 @@
+"""批量负载校验基准：整批 TypeAdapter 校验与逐条校验抛错循环对比。"""
+from __future__ import annotations
+
+from harness import benchmark
+
+_SIZE = 500
+
+
+def _schema():
+    from pydantic import BaseModel, Field
+
+    class Item(BaseModel):
+        id: str = Field(min_length=1)
+        label: str
+        score: float = Field(ge=0, le=1)
+        tags: list[str] = Field(default_factory=list)
+
+    return Item
+
+
+def _items(invalid_every: int | None = None) -> list[dict[str, object]]:
+    items: list[dict[str, object]] = []
+    for i in range(_SIZE):
+        score = 2.0 if invalid_every and i % invalid_every == invalid_every - 1 else i / _SIZE
+        items.append({"id": f"urn:sf:entity:{i}", "label": f"Entity {i}", "score": score, "tags": ["a", "b"]})
+    return items
+
+
+def _per_item(schema, items):
+    from pydantic import ValidationError
+
+    from common.exceptions.api import ContractViolation
+
+    def op():
+        result = []
+        for index, item in enumerate(items):
+            try:
+                result.append(schema.model_validate(item))
+            except ValidationError as exc:
+                raise ContractViolation("契约校验失败", details={"index": index, "errors": exc.errors()}) from None
+        return result
+
+    return op
+
+
+def _batched(schema, items):
+    from common.exceptions.api import ContractViolation
+    from common.models.validation import BatchValidator
+
+    validator = BatchValidator(schema, max_items=_SIZE)
+
+    def op():
+        try:
+            return validator.validate(items)
+        except ContractViolation as exc:
+            return exc
+
+    return op
+
+
+@benchmark("validation.per_item.valid500")
+def per_item_valid():
+    return _per_item(_schema(), _items())
+
+
+@benchmark("validation.batch.valid500")
+def batch_valid():
+    return _batched(_schema(), _items())
+
+
+@benchmark("validation.per_item.invalid500")
+def per_item_invalid():
+    # 逐条循环收集全部错误，与整批校验报告的内容相当
+    from pydantic import ValidationError
+
+    from common.exceptions.api import ViolationCollector
+
+    schema, items = _schema(), _items(invalid_every=5)
+
+    def op():
+        collector = ViolationCollector()
+        for index, item in enumerate(items):
+            try:
+                schema.model_validate(item)
+            except ValidationError as exc:
+                collector.extend(exc.errors(include_url=False, include_context=False, include_input=False), prefix=(index,))
+        return collector.build()
+
+    return op
+
+
+@benchmark("validation.batch.invalid500")
+def batch_invalid():
+    # 整批校验报告全部 100 条错误
+    return _batched(_schema(), _items(invalid_every=5))
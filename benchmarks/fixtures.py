@@ -0,0 +1,29 @@
+"""基准测试共用的准备工具。"""
+from __future__ import annotations
+
+from typing import Any, Coroutine
+
+BENCH_ENV = "testing"
+
+
+def ensure_config() -> Any:
+    """确保 ConfigManager 已按测试环境初始化。"""
+
+    from common.config import ConfigManager
+    from common.config.exceptions import ConfigError
+
+    try:
+        return ConfigManager.current()
+    except ConfigError:
+        return ConfigManager.load(env=BENCH_ENV)
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """同步驱动不含真实等待的协程，避免事件循环调度开销干扰计时。"""
+
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("coroutine awaited a real future; use an event loop instead")
@@ -0,0 +1,161 @@
+"""基准测试框架：注册、计时、统计与基线比较。
+
+每个基准由工厂函数注册，工厂完成准备工作并返回无参的被测操作。计时按轮进行，
+每轮自动校准迭代次数使单轮耗时不低于 ``min_round_seconds``，以单次操作耗时的
+中位数作为代表值，四分位距（IQR）作为噪声估计。
+"""
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+from typing import Any, Callable, NamedTuple
+
+Operation = Callable[[], Any]
+Factory = Callable[[], Operation]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    factory: Factory
+    budget: float | None
+    external: bool
+
+
+class Stats(NamedTuple):
+    """单个基准的统计结果，时间单位为秒/次。"""
+
+    median: float
+    minimum: float
+    p90: float
+    iqr: float
+    rounds: int
+    number: int
+
+    @property
+    def noise(self) -> float:
+        """相对噪声：IQR 与中位数之比。"""
+
+        return self.iqr / self.median if self.median else 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return self._asdict()
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+    change: float
+    threshold: float
+    regressed: bool
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, budget: float | None = None, external: bool = False) -> Callable[[Factory], Factory]:
+    """注册基准。
+
+    ``budget`` 为允许的相对退化比例（如 0.2 表示 20%），缺省使用运行参数中的默认值；
+    ``external=True`` 表示被测操作自行计时并返回单次耗时（秒），用于子进程冷启动等场景。
+    """
+
+    def decorator(factory: Factory) -> Factory:
+        if name in REGISTRY:
+            raise ValueError(f"duplicate benchmark: {name}")
+        REGISTRY[name] = Benchmark(name, factory, budget, external)
+        return factory
+
+    return decorator
+
+
+def quantile(sorted_values: list[float], q: float) -> float:
+    """对已排序的样本按线性插值取 ``q`` 分位数。"""
+
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q
+    low = int(pos)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (pos - low)
+
+
+def _summarise(samples: list[float], number: int) -> Stats:
+    ordered = sorted(samples)
+    return Stats(
+        median=statistics.median(ordered),
+        minimum=ordered[0],
+        p90=quantile(ordered, 0.9),
+        iqr=quantile(ordered, 0.75) - quantile(ordered, 0.25),
+        rounds=len(ordered),
+        number=number,
+    )
+
+
+def _calibrate(operation: Operation, min_round_seconds: float) -> int:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_round_seconds or number >= 1 << 20:
+            return number
+        # 按比例放大，至少翻倍，避免在极快的操作上反复试探
+        number = max(number * 2, int(number * min_round_seconds / max(elapsed, 1e-9)))
+
+
+def measure(bench: Benchmark, *, rounds: int, min_round_seconds: float, warmup: int = 1) -> Stats:
+    """执行基准并返回统计结果。"""
+
+    operation = bench.factory()
+    if bench.external:
+        for _ in range(warmup):
+            operation()
+        return _summarise([float(operation()) for _ in range(rounds)], 1)
+
+    for _ in range(warmup):
+        operation()
+    number = _calibrate(operation, min_round_seconds)
+    samples: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(number):
+                operation()
+            samples.append((time.perf_counter() - started) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return _summarise(samples, number)
+
+
+def compare(
+    name: str,
+    baseline: dict[str, Any],
+    current: Stats,
+    *,
+    budget: float,
+    noise_factor: float,
+) -> Comparison:
+    """比较当前结果与基线：相对变化同时超过预算与噪声阈值时判定为退化。"""
+
+    base_median = float(baseline["median"])
+    base_noise = float(baseline["iqr"]) / base_median if base_median else 0.0
+    change = current.median / base_median - 1.0 if base_median else 0.0
+    threshold = max(budget, noise_factor * max(base_noise, current.noise))
+    return Comparison(name, base_median, current.median, change, threshold, change > threshold)
+
+
+def format_seconds(value: float) -> str:
+    """以合适单位格式化耗时。"""
+
+    if value >= 1.0:
+        return f"{value:.3f}s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.3f}ms"
+    return f"{value * 1e6:.2f}µs"
@@ -0,0 +1,30 @@
+"""子模块延迟导入工具，供各包 ``__init__`` 通过模块级 ``__getattr__`` 使用。"""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str,
+    namespace: dict[str, Any],
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """返回 ``(__getattr__, __dir__)``，首次访问导出名时才导入对应子模块。
+
+    ``exports`` 将导出名映射到相对子模块路径（如 ``".handlers"``），
+    解析结果写回 ``namespace``，后续访问不再经过 ``__getattr__``。
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(target, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
@@ -1,6 +1,22 @@
 """配置模块导出工具。"""
-from .loader import load_config
-from .registry import ConfigManager, load_settings
-from .settings import Settings
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from common._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from .loader import load_config
+    from .registry import ConfigManager, load_settings
+    from .settings import Settings
+
+_EXPORTS = {
+    "ConfigManager": ".registry",
+    "Settings": ".settings",
+    "load_config": ".loader",
+    "load_settings": ".registry",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = ["ConfigManager", "Settings", "load_config", "load_settings"]
@@ -0,0 +1,222 @@
+"""基于 Settings 模型结构的环境变量覆盖引擎。
+
+环境变量名由字段路径推导：各级字段名（去掉尾部下划线）转大写后以 ``_`` 连接，
+例如 ``rdf.timeout.default`` 对应 ``RDF_TIMEOUT_DEFAULT``。两个字段路径推导出同一变量名时
+构建绑定表即抛出 ``ConfigError``，不会静默丢弃其中一个。变量名、写入路径与类型转换器
+按模型类型构建一次并缓存，加载时只对 ``os.environ`` 做一次快照。
+
+取值按字段类型转换：
+
+* ``bool`` 接受 ``true/1/yes/on`` 与 ``false/0/no/off``（不区分大小写）；
+* ``int``/``float`` 按 Python 字面量解析，字符串与 ``Literal`` 字段去掉首尾空白；``int`` 字段只接受
+  整数字面量，``8000.0`` 这类带小数的写法会报错（旧实现先按 ``float`` 解析再由 pydantic 取整）；
+* 列表字段接受 JSON 数组（``'["a", "b"]'``）或逗号分隔值（``a,b``），两种写法都逐项按元素类型转换；
+* ``dict`` 字段必须是 JSON 对象，整体替换配置中的原值，例如
+  ``SECURITY_RATE_LIMIT_CLIENTS='{"svc-a": {"rate": 10, "burst": 20}}'``；
+* 可为空的字段中 ``''``、``null``、``none`` 表示 ``None``。
+
+无法转换时抛出 ``ConfigError``，错误信息包含变量名与期望类型。
+"""
+from __future__ import annotations
+
+import json
+import os
+import types
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Literal, NamedTuple, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .exceptions import ConfigError
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+_NULL_VALUES = frozenset({"", "null", "none"})
+
+Converter = Callable[[str], Any]
+
+
+class EnvBinding(NamedTuple):
+    """单个环境变量到配置路径的绑定。"""
+
+    path: tuple[str, ...]
+    converter: Converter
+    type_name: str
+
+
+def _to_bool(raw: str) -> bool:
+    lowered = raw.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid boolean: {raw!r}")
+
+
+def _to_str(raw: str) -> str:
+    return raw.strip()
+
+
+def _to_int(raw: str) -> int:
+    return int(raw.strip())
+
+
+def _to_float(raw: str) -> float:
+    return float(raw.strip())
+
+
+def _to_json(raw: str) -> Any:
+    return json.loads(raw)
+
+
+def _list_converter(item: Converter) -> Converter:
+    def convert(raw: str) -> list[Any]:
+        stripped = raw.strip()
+        if stripped.startswith("["):
+            # JSON 中的非字符串元素（数字、布尔值）转回文本后同样交给元素转换器
+            return [item(value if isinstance(value, str) else json.dumps(value)) for value in json.loads(stripped)]
+        return [item(part) for part in stripped.split(",") if part.strip()]
+
+    return convert
+
+
+def _optional_converter(inner: Converter) -> Converter:
+    def convert(raw: str) -> Any:
+        if raw.strip().lower() in _NULL_VALUES:
+            return None
+        return inner(raw)
+
+    return convert
+
+
+def _unwrap(annotation: Any) -> tuple[Any, bool]:
+    """剥离 Annotated 与 Optional，返回 (实际类型, 是否可为空)。"""
+
+    optional = False
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            annotation = get_args(annotation)[0]
+        elif origin is Union or origin is types.UnionType:
+            members = [arg for arg in get_args(annotation) if arg is not type(None)]
+            optional = optional or len(members) != len(get_args(annotation))
+            if len(members) != 1:
+                return Any, optional
+            annotation = members[0]
+        else:
+            return annotation, optional
+
+
+def _converter_for(annotation: Any) -> tuple[Converter, str]:
+    target, optional = _unwrap(annotation)
+    origin = get_origin(target)
+    if target is bool:
+        converter, name = _to_bool, "bool"
+    elif target is int:
+        converter, name = _to_int, "int"
+    elif target is float:
+        converter, name = _to_float, "float"
+    elif origin in (list, tuple, set, frozenset):
+        args = get_args(target)
+        item, item_name = _converter_for(args[0]) if args else (_to_str, "str")
+        converter, name = _list_converter(item), f"list[{item_name}]"
+    elif origin is dict or target is dict:
+        converter, name = _to_json, "json"
+    elif origin is Literal:
+        converter, name = _to_str, "literal"
+    else:
+        converter, name = _to_str, "str"
+    if optional:
+        converter = _optional_converter(converter)
+    return converter, name
+
+
+def _is_model(annotation: Any) -> bool:
+    target, _ = _unwrap(annotation)
+    return isinstance(target, type) and issubclass(target, BaseModel)
+
+
+def _walk(
+    model: type[BaseModel],
+    env_prefix: tuple[str, ...],
+    key_prefix: tuple[str, ...],
+    bindings: dict[str, EnvBinding],
+) -> None:
+    for field_name, field in model.model_fields.items():
+        env_path = (*env_prefix, field_name.rstrip("_").upper())
+        # 未开启 populate_by_name 的模型只接受别名，统一以别名写入可兼容两种情况
+        key_path = (*key_prefix, field.alias or field_name)
+        if _is_model(field.annotation):
+            _walk(_unwrap(field.annotation)[0], env_path, key_path, bindings)
+            continue
+        converter, type_name = _converter_for(field.annotation)
+        env_key = "_".join(env_path)
+        existing = bindings.get(env_key)
+        if existing is not None:
+            raise ConfigError(
+                f"环境变量名冲突: {env_key} 同时对应 {'.'.join(existing.path)} 与 {'.'.join(key_path)}"
+            )
+        bindings[env_key] = EnvBinding(key_path, converter, type_name)
+
+
+@lru_cache(maxsize=None)
+def build_env_bindings(model: type[BaseModel]) -> dict[str, EnvBinding]:
+    """从模型结构推导环境变量绑定表，结果按模型类型缓存。"""
+
+    bindings: dict[str, EnvBinding] = {}
+    _walk(model, (), (), bindings)
+    return bindings
+
+
+def _set_in_mapping(mapping: dict[str, Any], path: tuple[str, ...], value: Any) -> None:
+    """沿路径写入值，途经的嵌套字典会被复制，避免修改调用方传入的数据。"""
+
+    cursor = mapping
+    *parents, final_key = path
+    for key in parents:
+        child = cursor.get(key)
+        child = dict(child) if isinstance(child, dict) else {}
+        cursor[key] = child
+        cursor = child
+    cursor[final_key] = value
+
+
+def apply_env_overrides(
+    config_dict: dict[str, Any],
+    model: type[BaseModel],
+    *,
+    aliases: dict[str, str] | None = None,
+    environ: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """按模型推导的绑定表将环境变量覆盖到配置字典，返回新字典。
+
+    ``aliases`` 为兼容旧变量名的映射（变量名 -> 模型绑定中的环境变量名），
+    同一配置项同时设置时以推导出的标准变量名为准。别名指向不存在的标准变量名、
+    或与某个标准变量名重名时抛出 ``ConfigError``。
+    """
+
+    bindings = build_env_bindings(model)
+    snapshot = dict(os.environ if environ is None else environ)
+    result = dict(config_dict)
+    pending: list[tuple[str, str, EnvBinding]] = []
+    if aliases:
+        for alias, canonical in aliases.items():
+            binding = bindings.get(canonical)
+            if binding is None:
+                raise ConfigError(f"环境变量别名 {alias} 指向未知的变量名: {canonical}")
+            if alias in bindings:
+                raise ConfigError(f"环境变量别名 {alias} 与标准变量名重名")
+            raw = snapshot.get(alias)
+            if raw is not None:
+                pending.append((alias, raw, binding))
+    for env_key, binding in bindings.items():
+        raw = snapshot.get(env_key)
+        if raw is not None:
+            pending.append((env_key, raw, binding))
+    for env_key, raw, binding in pending:
+        try:
+            value = binding.converter(raw)
+        except ValueError as exc:
+            raise ConfigError(f"环境变量 {env_key} 无法解析为 {binding.type_name}: {raw!r}", cause=exc) from exc
+        _set_in_mapping(result, binding.path, value)
+    return result
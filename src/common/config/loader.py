@@ -3,49 +3,34 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 
 import yaml
 from dotenv import load_dotenv
 from pydantic import ValidationError
 
+from .env_overrides import apply_env_overrides
 from .exceptions import ConfigError
 from .settings import Settings
 
-# 环境变量到配置键路径的映射表
-ENV_KEY_MAP: dict[str, tuple[str, ...]] = {
-    "APP_NAME": ("app", "name"),
-    "APP_ENV": ("app", "env"),
-    "APP_PORT": ("app", "port"),
-    "APP_DEBUG": ("app", "debug"),
-    "CORS_ORIGINS": ("cors", "origins"),
-    "RDF_ENDPOINT": ("rdf", "endpoint"),
-    "RDF_DATASET": ("rdf", "dataset"),
-    "RDF_USERNAME": ("rdf", "auth", "username"),
-    "RDF_PASSWORD": ("rdf", "auth", "password"),
-    "RDF_TIMEOUT_DEFAULT": ("rdf", "timeout", "default"),
-    "RDF_TIMEOUT_MAX": ("rdf", "timeout", "max"),
-    "RDF_RETRY_MAX": ("rdf", "retries", "max_attempts"),
-    "RDF_RETRY_BACKOFF": ("rdf", "retries", "backoff_seconds"),
-    "RDF_RETRY_MULTIPLIER": ("rdf", "retries", "backoff_multiplier"),
-    "RDF_RETRY_JITTER": ("rdf", "retries", "jitter_seconds"),
-    "POSTGRES_DSN": ("postgres", "dsn"),
-    "POSTGRES_SCHEMA": ("postgres", "schema"),
-    "REDIS_URL": ("redis", "url"),
-    "REDIS_NAMESPACE": ("redis", "namespace"),
-    "QDRANT_HTTP_URL": ("qdrant", "http_url"),
-    "QDRANT_GRPC_URL": ("qdrant", "grpc_url"),
-    "LOG_LEVEL": ("logging", "level"),
-    "LOG_FORMAT": ("logging", "format"),
-    "CONTRACT_ENVELOPE_VERSION": ("contract", "envelope_version"),
-    "CONTRACT_DEFAULT_TIMEOUT": ("contract", "default_timeout"),
-    "CONTRACT_DEFAULT_PAGE_SIZE": ("contract", "pagination", "default_size"),
-    "CONTRACT_MAX_PAGE_SIZE": ("contract", "pagination", "max_size"),
-    "TRACE_HEADER": ("security", "trace_header"),
-    "CLIENT_HEADER": ("security", "client_header"),
-    "IDEMPOTENCY_HEADER": ("security", "idempotency_header"),
-    "REQUIRE_API_KEY": ("security", "require_api_key"),
-    "API_KEY_HEADER": ("security", "api_key_header"),
+# 旧版环境变量名到标准变量名的兼容映射；标准变量名由 Settings 结构自动推导，
+# 如 ``rdf.timeout.default`` -> ``RDF_TIMEOUT_DEFAULT``，新增字段无需在此登记。
+ENV_KEY_ALIASES: dict[str, str] = {
+    "RDF_USERNAME": "RDF_AUTH_USERNAME",
+    "RDF_PASSWORD": "RDF_AUTH_PASSWORD",
+    "RDF_RETRY_MAX": "RDF_RETRIES_MAX_ATTEMPTS",
+    "RDF_RETRY_BACKOFF": "RDF_RETRIES_BACKOFF_SECONDS",
+    "RDF_RETRY_MULTIPLIER": "RDF_RETRIES_BACKOFF_MULTIPLIER",
+    "RDF_RETRY_JITTER": "RDF_RETRIES_JITTER_SECONDS",
+    "LOG_LEVEL": "LOGGING_LEVEL",
+    "LOG_FORMAT": "LOGGING_FORMAT",
+    "CONTRACT_DEFAULT_PAGE_SIZE": "CONTRACT_PAGINATION_DEFAULT_SIZE",
+    "CONTRACT_MAX_PAGE_SIZE": "CONTRACT_PAGINATION_MAX_SIZE",
+    "TRACE_HEADER": "SECURITY_TRACE_HEADER",
+    "CLIENT_HEADER": "SECURITY_CLIENT_HEADER",
+    "IDEMPOTENCY_HEADER": "SECURITY_IDEMPOTENCY_HEADER",
+    "REQUIRE_API_KEY": "SECURITY_REQUIRE_API_KEY",
+    "API_KEY_HEADER": "SECURITY_API_KEY_HEADER",
 }
 
 
@@ -84,40 +69,8 @@ def _deep_merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, An
     return result
 
 
-def _set_in_mapping(mapping: dict[str, Any], path: Iterable[str], value: Any) -> None:
-    cursor = mapping
-    *parents, final_key = tuple(path)
-    for key in parents:
-        if key not in cursor or not isinstance(cursor[key], dict):
-            cursor[key] = {}
-        cursor = cursor[key]
-    cursor[final_key] = value
-
-
-def _parse_env_value(raw: str) -> Any:
-    value = raw.strip()
-    lowered = value.lower()
-    if lowered in {"true", "false"}:
-        return lowered == "true"
-    try:
-        if value.startswith("0") and value != "0":  # keep strings like 0123 intact
-            raise ValueError
-        return int(value)
-    except ValueError:
-        try:
-            return float(value)
-        except ValueError:
-            return value
-
-
 def _apply_env_overrides(config_dict: dict[str, Any]) -> dict[str, Any]:
-    result = dict(config_dict)
-    for env_key, path in ENV_KEY_MAP.items():
-        env_value = os.getenv(env_key)
-        if env_value is None:
-            continue
-        _set_in_mapping(result, path, _parse_env_value(env_value))
-    return result
+    return apply_env_overrides(config_dict, Settings, aliases=ENV_KEY_ALIASES)
 
 
 def load_config(*, env: str | None = None, override_path: str | os.PathLike[str] | None = None) -> Settings:
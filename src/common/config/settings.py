@@ -119,6 +119,7 @@ class GraphNamingConfig(BaseModel):
 
     graph_format: str = Field(default="urn:sf:{model}:{version}:{env}")
     snapshot_format: str = Field(default="urn:sf:{model}:{version}:{env}:snapshot:{ts}")
+    snapshot_retention: int = Field(default=5, ge=1, le=100)
 
 
 class RDFConfig(BaseModel):
@@ -202,6 +203,36 @@ class ContractConfig(BaseModel):
     pagination: PaginationConfig = Field(default_factory=PaginationConfig)
 
 
+class ApiKeyCacheConfig(BaseModel):
+
+    model_config = ConfigDict(extra="ignore")
+
+    ttl_seconds: float = Field(default=300.0, gt=0, le=86400)
+    negative_ttl_seconds: float = Field(default=30.0, ge=0, le=3600)
+    max_entries: int = Field(default=10000, ge=1, le=1000000)
+    negative_max_entries: int = Field(default=1000, ge=1, le=1000000)
+
+
+class RateLimitRule(BaseModel):
+
+    model_config = ConfigDict(extra="ignore")
+
+    rate: float = Field(default=50.0, gt=0, le=100000)
+    burst: int = Field(default=100, ge=1, le=1000000)
+
+
+class RateLimitConfig(BaseModel):
+
+    model_config = ConfigDict(extra="ignore")
+
+    enabled: bool = Field(default=False)
+    backend: Literal["memory", "redis"] = Field(default="memory")
+    default: RateLimitRule = Field(default_factory=RateLimitRule)
+    clients: dict[str, RateLimitRule] = Field(default_factory=dict)
+    max_clients: int = Field(default=100000, ge=100, le=10000000)
+    window_seconds: float = Field(default=1.0, gt=0, le=3600)
+
+
 class SecurityConfig(BaseModel):
 
     model_config = ConfigDict(extra="ignore")
@@ -211,6 +242,33 @@ class SecurityConfig(BaseModel):
     idempotency_header: str = Field(default="Idempotency-Key")
     require_api_key: bool = Field(default=False)
     api_key_header: str = Field(default="X-API-Key")
+    api_key_table: str = Field(default="api_keys")
+    api_key_cache: ApiKeyCacheConfig = Field(default_factory=ApiKeyCacheConfig)
+    deadline_header: str = Field(default="X-Request-Timeout")
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+
+
+class CompressionConfig(BaseModel):
+
+    model_config = ConfigDict(extra="ignore")
+
+    enabled: bool = Field(default=True)
+    encodings: list[Literal["zstd", "br", "gzip"]] = Field(default_factory=lambda: ["zstd", "br", "gzip"])
+    minimum_size: int = Field(default=1024, ge=0)
+    offload_size: int = Field(default=65536, ge=0)
+    workers: int = Field(default=4, ge=1, le=64)
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    zstd_level: int = Field(default=3, ge=1, le=22)
+    brotli_quality: int = Field(default=4, ge=0, le=11)
+
+
+class LifecycleConfig(BaseModel):
+
+    model_config = ConfigDict(extra="ignore")
+
+    startup_timeout: float = Field(default=10.0, gt=0, le=600)
+    drain_timeout: float = Field(default=30.0, ge=0, le=600)
+    resource_timeouts: dict[str, float] = Field(default_factory=dict)
 
 
 class Settings(BaseModel):
@@ -227,5 +285,7 @@ class Settings(BaseModel):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     contract: ContractConfig = Field(default_factory=ContractConfig)
     security: SecurityConfig = Field(default_factory=SecurityConfig)
+    lifecycle: LifecycleConfig = Field(default_factory=LifecycleConfig)
+    compression: CompressionConfig = Field(default_factory=CompressionConfig)
 
 
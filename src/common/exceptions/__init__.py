@@ -1,15 +1,50 @@
-"""异常工具聚合，对外输出统一接口。"""
-from .api import APIError, ContractViolation, ExternalServiceError
-from .catalog import ErrorCatalog
-from .codes import DEFAULT_ERROR_CODE, ERROR_SPECS, ErrorCode
-from .handlers import register_exception_handlers
+"""异常工具聚合，对外输出统一接口。
+
+``codes`` 与 ``api`` 仅依赖标准库；``register_exception_handlers`` 首次访问时才导入 FastAPI。
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from common._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from .api import (
+        APIError,
+        ContractViolation,
+        DeadlineExceeded,
+        ExternalServiceError,
+        ViolationCollector,
+    )
+    from .catalog import ErrorCatalog
+    from .codes import DEFAULT_ERROR_CODE, ERROR_SPECS, ErrorCode, ErrorSpec
+    from .handlers import register_exception_handlers
+
+_EXPORTS = {
+    "APIError": ".api",
+    "ContractViolation": ".api",
+    "DeadlineExceeded": ".api",
+    "ExternalServiceError": ".api",
+    "ViolationCollector": ".api",
+    "ErrorCatalog": ".catalog",
+    "ErrorCode": ".codes",
+    "ErrorSpec": ".codes",
+    "DEFAULT_ERROR_CODE": ".codes",
+    "ERROR_SPECS": ".codes",
+    "register_exception_handlers": ".handlers",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = [
     "APIError",
     "ContractViolation",
+    "DeadlineExceeded",
     "ExternalServiceError",
+    "ViolationCollector",
     "ErrorCatalog",
     "ErrorCode",
+    "ErrorSpec",
     "DEFAULT_ERROR_CODE",
     "ERROR_SPECS",
     "register_exception_handlers",
@@ -1,9 +1,11 @@
 """应用层异常定义，统一携带错误码与扩展信息。"""
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable, Mapping, Sequence
 
-from .codes import DEFAULT_ERROR_CODE, ERROR_SPECS, ErrorCode
+from .codes import ErrorCode, spec_for
+
+DEFAULT_VIOLATION_LIMIT = 100
 
 
 class APIError(Exception):
@@ -17,7 +19,7 @@ class APIError(Exception):
         details: dict[str, Any] | None = None,
         http_status: int | None = None,
     ) -> None:
-        spec = ERROR_SPECS.get(code, ERROR_SPECS[DEFAULT_ERROR_CODE])
+        spec = spec_for(code)
         self.code = code
         self.message = message or spec.default_message
         self.details = details or {}
@@ -37,8 +39,81 @@ class ExternalServiceError(APIError):
         super().__init__(code, message, details=details)
 
 
+class DeadlineExceeded(ExternalServiceError):
+    """请求截止时间已到，上游调用或重试被提前终止时抛出的异常。"""
+
+    def __init__(self, message: str | None = None, *, details: dict[str, Any] | None = None) -> None:
+        super().__init__(ErrorCode.UPSTREAM_TIMEOUT, message or "请求截止时间已到", details=details)
+
+
 class ContractViolation(APIError):
     """请求负载违反契约约束时抛出的异常。"""
 
     def __init__(self, message: str, *, details: dict[str, Any] | None = None) -> None:
         super().__init__(ErrorCode.CONTRACT_VIOLATION, message, details=details)
+
+
+class ViolationCollector:
+    """收集多条契约违规，最终合并为一个 ``ContractViolation``。
+
+    条目格式与 pydantic 的 ``errors()`` 一致（``loc``/``msg``/``type``）。超出 ``limit`` 的
+    违规只计数不保存，避免错误详情随输入规模无限增长。
+    """
+
+    __slots__ = ("_errors", "_limit", "total")
+
+    def __init__(self, *, limit: int = DEFAULT_VIOLATION_LIMIT) -> None:
+        self._errors: list[dict[str, Any]] = []
+        self._limit = limit
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    @property
+    def errors(self) -> list[dict[str, Any]]:
+        """已保存的违规条目。"""
+
+        return self._errors
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > len(self._errors)
+
+    def add(self, message: str, *, loc: Sequence[str | int] = (), error_type: str = "contract_violation", **context: Any) -> None:
+        """记录一条违规。"""
+
+        self.total += 1
+        if len(self._errors) < self._limit:
+            entry: dict[str, Any] = {"loc": list(loc), "msg": message, "type": error_type}
+            if context:
+                entry.update(context)
+            self._errors.append(entry)
+
+    def extend(self, errors: Iterable[Mapping[str, Any]], *, prefix: Sequence[str | int] = ()) -> None:
+        """批量记录 pydantic 风格的错误条目，``prefix`` 会拼接到每条的 ``loc`` 前。"""
+
+        room = self._limit - len(self._errors)
+        for entry in errors:
+            self.total += 1
+            if room > 0:
+                item = dict(entry)
+                if prefix:
+                    item["loc"] = [*prefix, *item.get("loc", ())]
+                self._errors.append(item)
+                room -= 1
+
+    def build(self, message: str | None = None) -> ContractViolation:
+        """合并为单个 ``ContractViolation``。"""
+
+        details = {"errors": self._errors, "total": self.total, "truncated": self.truncated}
+        return ContractViolation(message or spec_for(ErrorCode.CONTRACT_VIOLATION).default_message, details=details)
+
+    def raise_if_any(self, message: str | None = None) -> None:
+        """存在违规时抛出合并后的 ``ContractViolation``。"""
+
+        if self.total:
+            raise self.build(message)
@@ -1,28 +1,31 @@
-﻿"""错误目录占位实现，统一维护业务错误码与说明。"""
+﻿"""错误目录，基于 ``ERROR_SPECS`` 提供错误码说明的查询与覆盖。"""
 from __future__ import annotations
 
-from typing import Dict
-
-from .codes import ErrorCode
+from .codes import ERROR_SPECS, ErrorCode, register_message, reset_messages, spec_for
 
 
 class ErrorCatalog:
-    """错误目录，提供错误码到说明的映射查询。"""
+    """错误目录，提供错误码到说明的映射查询。
 
-    _catalog: Dict[ErrorCode, str] = {
-        ErrorCode.OK: "请求成功",
-        ErrorCode.BAD_REQUEST: "请求参数校验失败",
-        ErrorCode.INTERNAL_ERROR: "服务内部错误",
-    }
+    说明统一登记在 ``ERROR_SPECS``，覆盖的说明保存在 ``codes`` 的覆盖层，本类不再维护独立副本。
+    """
 
     @classmethod
     def get_message(cls, code: ErrorCode) -> str:
-        """根据错误码返回默认说明，未配置时使用通用提示。"""
+        """根据错误码返回生效的说明，未配置时使用通用提示。"""
 
-        return cls._catalog.get(code, "未知错误，请联系管理员")
+        if code not in ERROR_SPECS:
+            return "未知错误，请联系管理员"
+        return spec_for(code).default_message
 
     @classmethod
     def register(cls, code: ErrorCode, message: str) -> None:
-        """注册新的错误码说明。"""
+        """覆盖错误码的默认说明。"""
+
+        register_message(code, message)
+
+    @classmethod
+    def reset(cls, *codes: ErrorCode) -> None:
+        """撤销说明覆盖，不传参数时撤销全部覆盖。"""
 
-        cls._catalog[code] = message
+        reset_messages(*codes)
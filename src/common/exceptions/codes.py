@@ -1,8 +1,20 @@
-"""RDF 防腐层统一错误码定义。"""
+"""RDF 防腐层统一错误码定义。
+
+``ERROR_SPECS`` 是错误码的唯一登记表：每个 ``ErrorCode`` 对应一个不可变的 ``ErrorSpec``，
+其中预先编码了 JSON 形式的默认消息，构造响应时无需重复编码。登记表只读，进程运行期间不变。
+
+``register_message`` 覆盖的消息保存在独立的覆盖层中，不修改 ``ERROR_SPECS``；
+构造异常与响应时统一通过 ``spec_for`` 取生效的规格（覆盖优先），``reset_messages`` 撤销覆盖。
+"""
 from __future__ import annotations
 
 from enum import IntEnum
-from typing import NamedTuple
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+
+# JSON 字符串转义表；codes 需保持零依赖导入，因此不引入 json 模块
+_JSON_ESCAPES = {ord('"'): '\\"', ord("\\"): "\\\\", **{i: f"\\u{i:04x}" for i in range(0x20)}}
 
 
 class ErrorCode(IntEnum):
@@ -14,10 +26,13 @@ class ErrorCode(IntEnum):
     NOT_FOUND = 4041
     IDEMPOTENCY_CONFLICT = 4201
     VERSION_CONFLICT = 4202
+    RESOURCE_BUSY = 4203
     CONTRACT_VIOLATION = 4211
+    RATE_LIMITED = 4291
     UPSTREAM_TIMEOUT = 4301
     UPSTREAM_ERROR = 4302
     INTERNAL_ERROR = 5001
+    SERVICE_UNAVAILABLE = 5002
     FUSEKI_CONNECT_ERROR = 5101
     FUSEKI_QUERY_ERROR = 5102
     POSTGRES_ERROR = 5103
@@ -25,27 +40,70 @@ class ErrorCode(IntEnum):
 
 
 class ErrorSpec(NamedTuple):
+    """错误码规格；``message_json`` 为默认消息的 JSON 字符串字面量（UTF-8，含引号）。"""
+
     http_status: int
     default_message: str
+    message_json: bytes = b""
 
+    @classmethod
+    def of(cls, http_status: int, default_message: str) -> ErrorSpec:
+        """创建规格并预编码消息。"""
 
-ERROR_SPECS: dict[ErrorCode, ErrorSpec] = {
-    ErrorCode.OK: ErrorSpec(200, "请求成功"),
-    ErrorCode.BAD_REQUEST: ErrorSpec(400, "请求参数校验失败"),
-    ErrorCode.DRY_RUN_OPTION_MISSING: ErrorSpec(400, "缺少 Dry-Run 必填选项"),
-    ErrorCode.UNAUTHENTICATED: ErrorSpec(401, "未认证"),
-    ErrorCode.FORBIDDEN: ErrorSpec(403, "无访问权限"),
-    ErrorCode.NOT_FOUND: ErrorSpec(404, "资源不存在"),
-    ErrorCode.IDEMPOTENCY_CONFLICT: ErrorSpec(409, "幂等冲突"),
-    ErrorCode.VERSION_CONFLICT: ErrorSpec(409, "版本冲突"),
-    ErrorCode.CONTRACT_VIOLATION: ErrorSpec(422, "契约校验失败"),
-    ErrorCode.UPSTREAM_TIMEOUT: ErrorSpec(504, "上游服务超时"),
-    ErrorCode.UPSTREAM_ERROR: ErrorSpec(502, "上游服务异常"),
-    ErrorCode.INTERNAL_ERROR: ErrorSpec(500, "服务内部错误"),
-    ErrorCode.FUSEKI_CONNECT_ERROR: ErrorSpec(500, "Fuseki 连接失败"),
-    ErrorCode.FUSEKI_QUERY_ERROR: ErrorSpec(500, "Fuseki 查询失败"),
-    ErrorCode.POSTGRES_ERROR: ErrorSpec(500, "PostgreSQL 操作失败"),
+        return cls(http_status, default_message, f'"{default_message.translate(_JSON_ESCAPES)}"'.encode("utf-8"))
+
+
+_SPECS: dict[ErrorCode, ErrorSpec] = {
+    ErrorCode.OK: ErrorSpec.of(200, "请求成功"),
+    ErrorCode.BAD_REQUEST: ErrorSpec.of(400, "请求参数校验失败"),
+    ErrorCode.DRY_RUN_OPTION_MISSING: ErrorSpec.of(400, "缺少 Dry-Run 必填选项"),
+    ErrorCode.UNAUTHENTICATED: ErrorSpec.of(401, "未认证"),
+    ErrorCode.FORBIDDEN: ErrorSpec.of(403, "无访问权限"),
+    ErrorCode.NOT_FOUND: ErrorSpec.of(404, "资源不存在"),
+    ErrorCode.IDEMPOTENCY_CONFLICT: ErrorSpec.of(409, "幂等冲突"),
+    ErrorCode.VERSION_CONFLICT: ErrorSpec.of(409, "版本冲突"),
+    ErrorCode.RESOURCE_BUSY: ErrorSpec.of(409, "资源正忙，请稍后重试"),
+    ErrorCode.CONTRACT_VIOLATION: ErrorSpec.of(422, "契约校验失败"),
+    ErrorCode.RATE_LIMITED: ErrorSpec.of(429, "请求过于频繁，请稍后重试"),
+    ErrorCode.UPSTREAM_TIMEOUT: ErrorSpec.of(504, "上游服务超时"),
+    ErrorCode.UPSTREAM_ERROR: ErrorSpec.of(502, "上游服务异常"),
+    ErrorCode.INTERNAL_ERROR: ErrorSpec.of(500, "服务内部错误"),
+    ErrorCode.SERVICE_UNAVAILABLE: ErrorSpec.of(503, "服务暂不可用，请稍后重试"),
+    ErrorCode.FUSEKI_CONNECT_ERROR: ErrorSpec.of(500, "Fuseki 连接失败"),
+    ErrorCode.FUSEKI_QUERY_ERROR: ErrorSpec.of(500, "Fuseki 查询失败"),
+    ErrorCode.POSTGRES_ERROR: ErrorSpec.of(500, "PostgreSQL 操作失败"),
+    ErrorCode.FUSEKI_CIRCUIT_OPEN: ErrorSpec.of(503, "Fuseki 熔断已打开，请稍后重试"),
 }
 
+if len(_SPECS) != len(ErrorCode):  # pragma: no cover - 新增错误码时必须同步登记
+    raise RuntimeError(f"ERROR_SPECS missing entries: {sorted(set(ErrorCode.__members__) - {c.name for c in _SPECS})}")
+
+ERROR_SPECS: Mapping[ErrorCode, ErrorSpec] = MappingProxyType(_SPECS)
 
 DEFAULT_ERROR_CODE = ErrorCode.INTERNAL_ERROR
+
+
+# 消息覆盖层，仅由 register_message/reset_messages 修改
+_OVERRIDES: dict[ErrorCode, ErrorSpec] = {}
+
+
+def spec_for(code: int) -> ErrorSpec:
+    """返回错误码生效的规格（覆盖优先），未登记的错误码使用 ``DEFAULT_ERROR_CODE`` 的规格。"""
+
+    spec = _OVERRIDES.get(code) or _SPECS.get(code)  # type: ignore[call-overload]
+    return spec if spec is not None else spec_for(DEFAULT_ERROR_CODE)
+
+
+def register_message(code: ErrorCode, message: str) -> None:
+    """覆盖错误码的默认消息，HTTP 状态码保持不变；``ERROR_SPECS`` 中的默认规格不受影响。"""
+
+    _OVERRIDES[code] = ErrorSpec.of(_SPECS[code].http_status, message)
+
+
+def reset_messages(*codes: ErrorCode) -> None:
+    """撤销指定错误码的消息覆盖，不传参数时撤销全部覆盖。"""
+
+    if not codes:
+        _OVERRIDES.clear()
+    for code in codes:
+        _OVERRIDES.pop(code, None)
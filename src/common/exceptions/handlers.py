@@ -11,10 +11,11 @@ from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from common.config import ConfigManager
+from common.logging.context import get_trace_id
 from common.models.envelope import Envelope, EnvelopeMeta
 
 from .api import APIError
-from .codes import ERROR_SPECS, ErrorCode
+from .codes import ErrorCode, spec_for
 
 _HTTP_ERROR_MAP: dict[int, ErrorCode] = {
     400: ErrorCode.BAD_REQUEST,
@@ -33,7 +34,7 @@ def _ensure_trace_id(request: Request) -> str:
 
     security = ConfigManager.current().security
     trace_header = security.trace_header
-    trace_id = getattr(request.state, 'trace_id', None) or request.headers.get(trace_header)
+    trace_id = getattr(request.state, 'trace_id', None) or request.headers.get(trace_header) or get_trace_id()
     if not trace_id:
         trace_id = str(uuid.uuid4())
         request.state.trace_id = trace_id
@@ -71,7 +72,7 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
         data={'errors': flattened},
         meta=EnvelopeMeta(),
     )
-    status_code = ERROR_SPECS[ErrorCode.BAD_REQUEST].http_status
+    status_code = spec_for(ErrorCode.BAD_REQUEST).http_status
     return _make_response(envelope, status_code, trace_id)
 
 
@@ -80,7 +81,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
 
     trace_id = _ensure_trace_id(request)
     code = _HTTP_ERROR_MAP.get(exc.status_code, ErrorCode.INTERNAL_ERROR)
-    message = exc.detail or ERROR_SPECS.get(code, ERROR_SPECS[ErrorCode.INTERNAL_ERROR]).default_message
+    message = exc.detail or spec_for(code).default_message
     envelope = Envelope.from_error(code, message=message, trace_id=trace_id, meta=EnvelopeMeta())
     return _make_response(envelope, exc.status_code, trace_id)
 
@@ -91,12 +92,12 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
     trace_id = _ensure_trace_id(request)
     envelope = Envelope.from_error(
         ErrorCode.INTERNAL_ERROR,
-        message=ERROR_SPECS[ErrorCode.INTERNAL_ERROR].default_message,
+        message=spec_for(ErrorCode.INTERNAL_ERROR).default_message,
         trace_id=trace_id,
         data={'error': str(exc)},
         meta=EnvelopeMeta(),
     )
-    status_code = ERROR_SPECS[ErrorCode.INTERNAL_ERROR].http_status
+    status_code = spec_for(ErrorCode.INTERNAL_ERROR).http_status
     return _make_response(envelope, status_code, trace_id)
 
 
@@ -1,4 +1,22 @@
 ﻿"""日志相关工具包。"""
-from .logger_factory import LoggerFactory
+from __future__ import annotations
 
-__all__ = ["LoggerFactory"]
+from typing import TYPE_CHECKING
+
+from common._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from .context import bind_trace_id, get_trace_id, reset_trace_id, trace_id_var
+    from .logger_factory import LoggerFactory
+
+_EXPORTS = {
+    "LoggerFactory": ".logger_factory",
+    "bind_trace_id": ".context",
+    "get_trace_id": ".context",
+    "reset_trace_id": ".context",
+    "trace_id_var": ".context",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+__all__ = ["LoggerFactory", "bind_trace_id", "get_trace_id", "reset_trace_id", "trace_id_var"]
@@ -0,0 +1,24 @@
+"""日志上下文变量，跨 await 传递 trace_id。"""
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+
+trace_id_var: ContextVar[str | None] = ContextVar("sf_trace_id", default=None)
+
+
+def get_trace_id() -> str | None:
+    """返回当前上下文绑定的 trace_id。"""
+
+    return trace_id_var.get()
+
+
+def bind_trace_id(trace_id: str | None) -> Token[str | None]:
+    """绑定 trace_id 到当前上下文，返回可用于 ``reset_trace_id`` 的令牌。"""
+
+    return trace_id_var.set(trace_id)
+
+
+def reset_trace_id(token: Token[str | None]) -> None:
+    """恢复绑定前的 trace_id。"""
+
+    trace_id_var.reset(token)
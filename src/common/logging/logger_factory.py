@@ -5,6 +5,8 @@ import json
 import logging
 from typing import Any
 
+from .context import trace_id_var
+
 _RESERVED_KEYS = {
     'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename', 'module',
     'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName', 'created', 'msecs',
@@ -35,6 +37,10 @@ class JsonFormatter(logging.Formatter):
         }
         if extras:
             payload.update(extras)
+        if "trace_id" not in payload:
+            trace_id = trace_id_var.get()
+            if trace_id:
+                payload["trace_id"] = trace_id
         return json.dumps(payload, ensure_ascii=False, indent=self._indent)
 
 
@@ -1,4 +1,23 @@
 """语义平台通用模型导出。"""
-from .envelope import Envelope, EnvelopeMeta, PagingMeta
+from __future__ import annotations
 
-__all__ = ['Envelope', 'EnvelopeMeta', 'PagingMeta']
+from typing import TYPE_CHECKING
+
+from common._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from .envelope import Envelope, EnvelopeMeta, PagingMeta
+    from .validation import BatchValidator, list_adapter, validate_batch
+
+_EXPORTS = {
+    "Envelope": ".envelope",
+    "EnvelopeMeta": ".envelope",
+    "PagingMeta": ".envelope",
+    "BatchValidator": ".validation",
+    "list_adapter": ".validation",
+    "validate_batch": ".validation",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+__all__ = ['Envelope', 'EnvelopeMeta', 'PagingMeta', 'BatchValidator', 'list_adapter', 'validate_batch']
@@ -4,10 +4,8 @@ from __future__ import annotations
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
-from pydantic.generics import GenericModel
 
-from common.config import ConfigManager
-from common.exceptions.codes import ERROR_SPECS, ErrorCode
+from common.exceptions.codes import ErrorCode, spec_for
 
 T = TypeVar('T')
 
@@ -23,16 +21,22 @@ class PagingMeta(BaseModel):
     next_offset: int | None = Field(default=None, alias='nextOffset')
 
 
+def _default_envelope_version() -> str:
+    from common.config.registry import ConfigManager  # 延迟导入，避免加载 YAML/dotenv 依赖
+
+    return ConfigManager.current().contract.envelope_version
+
+
 class EnvelopeMeta(BaseModel):
     """Additional metadata returned alongside data payloads."""
 
     model_config = ConfigDict(populate_by_name=True)
 
-    version: str = Field(default_factory=lambda: ConfigManager.current().contract.envelope_version)
+    version: str = Field(default_factory=_default_envelope_version)
     paging: PagingMeta | None = None
 
 
-class Envelope(GenericModel, Generic[T]):
+class Envelope(BaseModel, Generic[T]):
     """Standard response envelope wrapping business data with metadata."""
 
     model_config = ConfigDict(populate_by_name=True)
@@ -54,7 +58,7 @@ class Envelope(GenericModel, Generic[T]):
     ) -> 'Envelope[T]':
         """Create a success envelope."""
 
-        spec = ERROR_SPECS[ErrorCode.OK]
+        spec = spec_for(ErrorCode.OK)
         return cls(
             code=int(ErrorCode.OK),
             message=message or spec.default_message,
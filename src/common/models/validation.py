@@ -0,0 +1,110 @@
+"""批量负载校验：一次调用校验整个列表，并把逐条错误合并为单个 ``ContractViolation``。
+
+每个条目模式对应的 ``TypeAdapter(list[schema])`` 只编译一次并缓存，整批数据在 pydantic-core
+中一次完成校验，不再逐条构造模型、逐条抛出异常。错误条目的 ``loc`` 以条目下标开头，
+数量超过 ``error_limit`` 时只保留前若干条并在 ``details`` 中给出总数。
+
+性能收益主要来自无效输入：整批只产生一个 ``ValidationError``。全部有效时仅省去逐条调用的
+开销，与逐条 ``model_validate`` 相比的差距随环境与 pydantic 版本而变，可能接近持平，
+见 ``benchmarks/bench_validation.py``。
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Generic, Sequence, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+
+from common.exceptions.api import DEFAULT_VIOLATION_LIMIT, ContractViolation, ViolationCollector
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import ContractConfig
+
+T = TypeVar("T")
+
+BATCH_TOO_LARGE_MESSAGE = "批量条目数超出上限"
+
+
+@lru_cache(maxsize=256)
+def list_adapter(schema: Any) -> TypeAdapter[list[Any]]:
+    """返回 ``list[schema]`` 的缓存 ``TypeAdapter``。"""
+
+    return TypeAdapter(list[schema])
+
+
+class BatchValidator(Generic[T]):
+    """按条目模式批量校验列表负载。"""
+
+    def __init__(
+        self,
+        schema: type[T],
+        *,
+        max_items: int | None = None,
+        error_limit: int = DEFAULT_VIOLATION_LIMIT,
+    ) -> None:
+        self.schema = schema
+        self.max_items = max_items
+        self.error_limit = error_limit
+        self._adapter = list_adapter(schema)
+
+    @classmethod
+    def from_config(cls, schema: type[T], config: ContractConfig, **kwargs: Any) -> BatchValidator[T]:
+        """以 ``ContractConfig.pagination.max_size`` 作为批量上限创建校验器。"""
+
+        kwargs.setdefault("max_items", config.pagination.max_size)
+        return cls(schema, **kwargs)
+
+    def _check_size(self, size: int) -> None:
+        if self.max_items is not None and size > self.max_items:
+            raise ContractViolation(BATCH_TOO_LARGE_MESSAGE, details={"size": size, "max_size": self.max_items})
+
+    def _violation(self, exc: ValidationError) -> ContractViolation:
+        collector = ViolationCollector(limit=self.error_limit)
+        collector.extend(exc.errors(include_url=False, include_context=False, include_input=False))
+        return collector.build()
+
+    def validate(self, items: Sequence[Any]) -> list[T]:
+        """校验 Python 对象列表，返回模型列表；任一条目不合法时抛出合并后的 ``ContractViolation``。"""
+
+        self._check_size(len(items))
+        try:
+            return self._adapter.validate_python(items)
+        except ValidationError as exc:
+            raise self._violation(exc) from None
+
+    def validate_json(self, data: str | bytes) -> list[T]:
+        """直接校验 JSON 数组文本，省去中间的 Python 对象。
+
+        条目数在解析后才能得知，请求体大小应由上游限制。
+        """
+
+        try:
+            result = self._adapter.validate_json(data)
+        except ValidationError as exc:
+            raise self._violation(exc) from None
+        self._check_size(len(result))
+        return result
+
+
+@lru_cache(maxsize=256)
+def _cached_validator(schema: Any, max_items: int | None, error_limit: int) -> BatchValidator[Any]:
+    return BatchValidator(schema, max_items=max_items, error_limit=error_limit)
+
+
+def validate_batch(
+    schema: type[T],
+    items: Sequence[Any],
+    *,
+    max_items: int | None = None,
+    error_limit: int = DEFAULT_VIOLATION_LIMIT,
+) -> list[T]:
+    """使用缓存的校验器校验一批条目。
+
+    ``max_items`` 缺省时取当前配置的 ``contract.pagination.max_size``。
+    """
+
+    if max_items is None:
+        from common.config.registry import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+        max_items = ConfigManager.current().contract.pagination.max_size
+    return _cached_validator(schema, max_items, error_limit).validate(items)
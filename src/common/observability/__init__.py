@@ -1,13 +1,77 @@
-"""可观测性工具集。"""
+"""可观测性工具集。
 
-from .metrics import (
-    observe_fuseki_failure,
-    observe_fuseki_response,
-    set_fuseki_circuit_state,
-)
+Prometheus 指标在首次访问相关导出名时才注册，仅导入本包不会加载 prometheus_client。
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from common._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from .loop_monitor import EventLoopMonitor
+    from .metrics import (
+        observe_api_key_cache,
+        observe_compression,
+        observe_event_loop_blocked,
+        observe_event_loop_lag,
+        observe_fuseki_failure,
+        observe_fuseki_response,
+        observe_rate_limited,
+        observe_rdf_bulk_write,
+        observe_resource_startup,
+        set_fuseki_circuit_state,
+    )
+    from .profiler import (
+        ProfileResult,
+        ProfilerBusyError,
+        ProfileSession,
+        SamplingProfiler,
+        get_profiler,
+        install_profiler_signal,
+        register_profiler_route,
+    )
+
+_EXPORTS = {
+    "EventLoopMonitor": ".loop_monitor",
+    "ProfileResult": ".profiler",
+    "ProfilerBusyError": ".profiler",
+    "ProfileSession": ".profiler",
+    "SamplingProfiler": ".profiler",
+    "get_profiler": ".profiler",
+    "install_profiler_signal": ".profiler",
+    "observe_api_key_cache": ".metrics",
+    "observe_compression": ".metrics",
+    "observe_event_loop_blocked": ".metrics",
+    "observe_event_loop_lag": ".metrics",
+    "observe_fuseki_failure": ".metrics",
+    "observe_fuseki_response": ".metrics",
+    "observe_rate_limited": ".metrics",
+    "observe_rdf_bulk_write": ".metrics",
+    "observe_resource_startup": ".metrics",
+    "register_profiler_route": ".profiler",
+    "set_fuseki_circuit_state": ".metrics",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = [
+    "EventLoopMonitor",
+    "ProfileResult",
+    "ProfilerBusyError",
+    "ProfileSession",
+    "SamplingProfiler",
+    "get_profiler",
+    "install_profiler_signal",
+    "observe_api_key_cache",
+    "observe_compression",
+    "observe_event_loop_blocked",
+    "observe_event_loop_lag",
     "observe_fuseki_failure",
     "observe_fuseki_response",
+    "observe_rate_limited",
+    "observe_rdf_bulk_write",
+    "observe_resource_startup",
+    "register_profiler_route",
     "set_fuseki_circuit_state",
 ]
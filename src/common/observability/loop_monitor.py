@@ -0,0 +1,163 @@
+"""asyncio 事件循环延迟与阻塞调用监测。
+
+事件循环内的心跳协程按固定间隔休眠并测量实际唤醒延迟，写入 Prometheus 直方图；
+独立的看门狗线程检查心跳是否超时，若循环被单个回调阻塞超过阈值，则立即计数并抓取循环线程
+当前调用栈。看门狗线程不访问 asyncio 的任务状态：调用栈交回事件循环，待阻塞结束后在循环
+线程内按栈中最外层协程帧找到所属任务，连同任务名、任务上下文中的 trace_id 与阻塞总时长
+通过日志输出；任务在阻塞结束时已完成的，只输出其顶层协程名。
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+from typing import Any
+
+from common.logging.context import trace_id_var
+from common.logging.logger_factory import LoggerFactory
+
+from .metrics import observe_event_loop_blocked, observe_event_loop_lag
+
+DEFAULT_HEARTBEAT_INTERVAL = 0.25
+DEFAULT_BLOCK_THRESHOLD = 0.1
+DEFAULT_STACK_LIMIT = 32
+
+
+class EventLoopMonitor:
+    """事件循环监测器，需在目标事件循环内启动。"""
+
+    def __init__(
+        self,
+        *,
+        interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        block_threshold: float = DEFAULT_BLOCK_THRESHOLD,
+        stack_limit: int = DEFAULT_STACK_LIMIT,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._interval = interval
+        self._threshold = block_threshold
+        self._stack_limit = stack_limit
+        self._logger = logger
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._last_beat = 0.0
+
+    @property
+    def running(self) -> bool:
+        """监测器是否已启动。"""
+
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """在当前运行的事件循环中启动心跳与看门狗线程。"""
+
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._last_beat = time.monotonic()
+        self._task = self._loop.create_task(self._heartbeat(), name="sf-loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="sf-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """停止心跳与看门狗线程。"""
+
+        self._stopped.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        watchdog, self._watchdog = self._watchdog, None
+        if watchdog is not None:
+            await asyncio.to_thread(watchdog.join)
+
+    async def __aenter__(self) -> EventLoopMonitor:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._last_beat = time.monotonic()
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            observe_event_loop_lag(max(0.0, loop.time() - expected))
+
+    def _watch(self) -> None:
+        check_every = max(self._threshold / 2, 0.01)
+        reported_beat: float | None = None
+        while not self._stopped.wait(check_every):
+            beat = self._last_beat
+            stalled = time.monotonic() - beat - self._interval
+            if stalled >= self._threshold and beat != reported_beat:
+                # 同一次心跳只上报一次，避免长时间阻塞时刷屏
+                reported_beat = beat
+                self._report(beat)
+
+    def _report(self, beat: float) -> None:
+        """看门狗线程：计数并抓取循环线程的调用栈，日志交给事件循环输出。"""
+
+        observe_event_loop_blocked()
+        frame = sys._current_frames().get(self._loop_thread_id) if self._loop_thread_id else None
+        stack = "".join(traceback.format_stack(frame, limit=self._stack_limit)) if frame is not None else ""
+        root = _outermost_coroutine(frame)
+        del frame
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._log_blocked, beat, stack, root)
+        except RuntimeError:  # 事件循环已关闭
+            pass
+
+    def _log_blocked(self, beat: float, stack: str, root: FrameType | None) -> None:
+        """事件循环线程：按协程帧定位阻塞的任务并输出日志。"""
+
+        stalled = time.monotonic() - beat - self._interval
+        task = None
+        if root is not None:
+            for candidate in asyncio.all_tasks(self._loop):
+                if getattr(candidate.get_coro(), "cr_frame", None) is root:
+                    task = candidate
+                    break
+        trace_id = task.get_context().get(trace_id_var) if task is not None else None
+        if self._logger is None:
+            self._logger = LoggerFactory.create_default_logger("common.observability.loop")
+        self._logger.warning(
+            "事件循环阻塞 %.3fs",
+            stalled,
+            extra={
+                "blocked_seconds": round(stalled, 6),
+                "task": task.get_name() if task is not None else None,
+                "coroutine": root.f_code.co_qualname if root is not None else None,
+                "stack": stack,
+                "trace_id": trace_id,
+            },
+        )
+
+
+def _outermost_coroutine(frame: FrameType | None) -> FrameType | None:
+    """返回调用栈中最外层的协程帧，即当前运行任务的顶层协程。"""
+
+    root = None
+    while frame is not None:
+        if frame.f_code.co_flags & inspect.CO_COROUTINE:
+            root = frame
+        frame = frame.f_back
+    return root
@@ -29,6 +29,58 @@ _FUSEKI_CIRCUIT = Gauge(
     labelnames=('operation',),
 )
 
+_EVENT_LOOP_LAG = Histogram(
+    'sf_event_loop_lag_seconds',
+    '事件循环心跳调度延迟分布，单位秒',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+_EVENT_LOOP_BLOCKED = Counter(
+    'sf_event_loop_blocked_total',
+    '事件循环被单个回调阻塞超过阈值的次数',
+)
+
+_RDF_BULK_TRIPLES = Counter(
+    'sf_rdf_bulk_triples_total',
+    'RDF 批量写入提交的三元组总数',
+)
+
+_RDF_BULK_THROUGHPUT = Gauge(
+    'sf_rdf_bulk_triples_per_second',
+    '最近一次 RDF 批量写入的吞吐量，单位三元组/秒',
+)
+
+_RATE_LIMITED = Counter(
+    'sf_rate_limited_total',
+    '被限流拒绝的请求次数',
+    labelnames=('backend',),
+)
+
+_API_KEY_CACHE = Counter(
+    'sf_api_key_cache_requests_total',
+    'API Key 校验缓存查询次数，result 为 hit/negative_hit/miss',
+    labelnames=('result',),
+)
+
+_RESOURCE_STARTUP = Gauge(
+    'sf_resource_startup_seconds',
+    '外部资源启动（创建连接并通过就绪检查）耗时，单位秒',
+    labelnames=('resource',),
+)
+
+_COMPRESSION_SAVED = Counter(
+    'sf_compression_bytes_saved_total',
+    '响应压缩节省的字节数',
+    labelnames=('encoding',),
+)
+
+_COMPRESSION_DURATION = Histogram(
+    'sf_compression_duration_seconds',
+    '响应压缩耗时分布，单位秒',
+    labelnames=('encoding',),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5),
+)
+
 # 初始化 Gauge，确保默认状态为关闭。
 _FUSEKI_CIRCUIT.labels(operation='query').set(0)
 _FUSEKI_CIRCUIT.labels(operation='update').set(0)
@@ -52,3 +104,48 @@ def set_fuseki_circuit_state(operation: str, opened: bool) -> None:
     """更新熔断器状态指标。"""
 
     _FUSEKI_CIRCUIT.labels(operation=operation).set(1 if opened else 0)
+
+
+def observe_event_loop_lag(lag_seconds: float) -> None:
+    """记录一次事件循环心跳延迟。"""
+
+    _EVENT_LOOP_LAG.observe(lag_seconds)
+
+
+def observe_event_loop_blocked() -> None:
+    """记录一次事件循环阻塞事件。"""
+
+    _EVENT_LOOP_BLOCKED.inc()
+
+
+def observe_rdf_bulk_write(triples: int, duration_seconds: float) -> None:
+    """记录一次 RDF 批量写入的三元组数量与吞吐量。"""
+
+    _RDF_BULK_TRIPLES.inc(triples)
+    if duration_seconds > 0:
+        _RDF_BULK_THROUGHPUT.set(triples / duration_seconds)
+
+
+def observe_rate_limited(backend: str) -> None:
+    """记录一次被限流拒绝的请求。"""
+
+    _RATE_LIMITED.labels(backend=backend).inc()
+
+
+def observe_api_key_cache(result: str) -> None:
+    """记录一次 API Key 缓存查询结果，用于计算命中率。"""
+
+    _API_KEY_CACHE.labels(result=result).inc()
+
+
+def observe_resource_startup(resource: str, duration_seconds: float) -> None:
+    """记录外部资源的启动耗时。"""
+
+    _RESOURCE_STARTUP.labels(resource=resource).set(duration_seconds)
+
+
+def observe_compression(encoding: str, original_bytes: int, compressed_bytes: int, duration_seconds: float) -> None:
+    """记录一次响应压缩的节省字节数与耗时。"""
+
+    _COMPRESSION_SAVED.labels(encoding=encoding).inc(max(0, original_bytes - compressed_bytes))
+    _COMPRESSION_DURATION.labels(encoding=encoding).observe(duration_seconds)
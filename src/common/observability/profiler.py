@@ -0,0 +1,329 @@
+"""按需采样剖析器，输出火焰图可用的折叠栈文本。
+
+开销说明：
+- 关闭状态下不创建线程、不注册任何钩子，零运行时开销。
+- 开启后由单个守护线程按 ``interval`` 调用 ``sys._current_frames()``，单次采样成本与
+  线程数 × 栈深度成正比（典型 worker 约 20~100µs），默认 100Hz 下 CPU 占用低于 1%。
+- 单次会话时长受 ``MAX_DURATION_SECONDS`` 限制，采样频率受 ``MIN_INTERVAL_SECONDS`` 限制，
+  栈深度受 ``max_depth`` 截断，同一时刻最多只有一个会话在运行。
+"""
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from fastapi import FastAPI
+
+DEFAULT_INTERVAL_SECONDS = 0.01
+MIN_INTERVAL_SECONDS = 0.001
+DEFAULT_DURATION_SECONDS = 10.0
+MAX_DURATION_SECONDS = 60.0
+DEFAULT_MAX_DEPTH = 128
+SIGNAL_POLL_SECONDS = 0.1
+
+
+class ProfileResult(NamedTuple):
+    """一次采样会话的聚合结果。"""
+
+    stacks: Counter[str]
+    samples: int
+    duration_seconds: float
+    interval_seconds: float
+
+    def folded(self) -> str:
+        """以 ``frame;frame;frame count`` 格式输出折叠栈，可直接交给 flamegraph.pl。"""
+
+        lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+class ProfilerBusyError(RuntimeError):
+    """已有采样会话在运行时再次启动抛出。"""
+
+
+class ProfileSession:
+    """``SamplingProfiler.start`` 返回的会话句柄，结果只属于本次会话。"""
+
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.result: ProfileResult | None = None
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def stop(self) -> ProfileResult | None:
+        """提前结束本次会话并返回结果。"""
+
+        self._stop.set()
+        return self.wait()
+
+    def wait(self, timeout: float | None = None) -> ProfileResult | None:
+        """等待本次会话结束并返回结果，超时返回 ``None``。"""
+
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.result
+
+
+class SamplingProfiler:
+    """基于 ``sys._current_frames()`` 的统计采样剖析器。"""
+
+    def __init__(self, *, max_depth: int = DEFAULT_MAX_DEPTH) -> None:
+        self._max_depth = max_depth
+        self._lock = threading.Lock()
+        self._session: ProfileSession | None = None
+        self._labels: dict[CodeType, str] = {}
+
+    @property
+    def running(self) -> bool:
+        """当前是否有采样会话在运行。"""
+
+        session = self._session
+        return session is not None and session.running
+
+    def start(
+        self,
+        duration: float = DEFAULT_DURATION_SECONDS,
+        *,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        on_complete: Callable[[ProfileResult], None] | None = None,
+    ) -> ProfileSession:
+        """在后台启动一次有界采样会话，立即返回会话句柄；已有会话在运行时抛出 ``ProfilerBusyError``。
+
+        会获取线程锁并创建线程，不能在信号处理函数中直接调用，信号触发见 ``install_profiler_signal``。
+        """
+
+        interval = max(interval, MIN_INTERVAL_SECONDS)
+        duration = min(max(duration, interval), MAX_DURATION_SECONDS)
+        with self._lock:
+            if self.running:
+                raise ProfilerBusyError("采样剖析器正在运行")
+            session = ProfileSession()
+            session._thread = threading.Thread(
+                target=self._run,
+                args=(session, duration, interval, on_complete),
+                name="sf-sampling-profiler",
+                daemon=True,
+            )
+            session._thread.start()
+            self._session = session
+        return session
+
+    def stop(self) -> ProfileResult | None:
+        """提前结束当前会话并返回结果。"""
+
+        session = self._session
+        return session.stop() if session is not None else None
+
+    def wait(self, timeout: float | None = None) -> ProfileResult | None:
+        """等待当前会话结束，返回最近一次的结果。"""
+
+        session = self._session
+        return session.wait(timeout) if session is not None else None
+
+    def profile(self, duration: float = DEFAULT_DURATION_SECONDS, *, interval: float = DEFAULT_INTERVAL_SECONDS) -> ProfileResult:
+        """阻塞执行一次采样会话并返回结果。"""
+
+        result = self.start(duration, interval=interval).wait()
+        assert result is not None
+        return result
+
+    def _label(self, frame: FrameType) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            module = frame.f_globals.get("__name__", "?")
+            label = f"{module}:{code.co_qualname}".replace(";", ":").replace(" ", "_")
+            self._labels[code] = label
+        return label
+
+    def _collapse(self, frame: FrameType | None, thread_name: str) -> str:
+        parts: list[str] = []
+        depth = 0
+        while frame is not None and depth < self._max_depth:
+            parts.append(self._label(frame))
+            frame = frame.f_back
+            depth += 1
+        parts.append(thread_name.replace(";", ":").replace(" ", "_"))
+        parts.reverse()
+        return ";".join(parts)
+
+    def _run(
+        self,
+        session: ProfileSession,
+        duration: float,
+        interval: float,
+        on_complete: Callable[[ProfileResult], None] | None,
+    ) -> None:
+        own_ident = threading.get_ident()
+        stacks: Counter[str] = Counter()
+        samples = 0
+        started = time.perf_counter()
+        deadline = started + duration
+        next_tick = started
+        try:
+            while not session._stop.is_set():
+                if time.perf_counter() >= deadline:
+                    break
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                frames = sys._current_frames()
+                for ident, frame in frames.items():
+                    if ident == own_ident:
+                        continue
+                    stacks[self._collapse(frame, names.get(ident, f"thread-{ident}"))] += 1
+                del frames
+                samples += 1
+                next_tick += interval
+                delay = next_tick - time.perf_counter()
+                if delay < 0:
+                    # 采样落后时直接跳过错过的节拍，避免追赶造成突发开销
+                    next_tick = time.perf_counter()
+                    delay = 0.0
+                session._stop.wait(delay)
+        finally:
+            self._labels.clear()
+            session.result = ProfileResult(
+                stacks=stacks,
+                samples=samples,
+                duration_seconds=time.perf_counter() - started,
+                interval_seconds=interval,
+            )
+        if on_complete is not None:
+            on_complete(session.result)
+
+
+_DEFAULT_PROFILER = SamplingProfiler()
+
+
+def get_profiler() -> SamplingProfiler:
+    """返回进程级共享的剖析器，路由与信号触发共用，保证同一时刻只有一个会话。"""
+
+    return _DEFAULT_PROFILER
+
+
+class _SignalTrigger:
+    """无事件循环时的信号触发：处理函数只置位标志，由守护线程在信号上下文之外启动会话。"""
+
+    def __init__(self, start: Callable[[], None]) -> None:
+        self._start = start
+        self._pending = False
+        self._closed = threading.Event()
+        threading.Thread(target=self._poll, name="sf-profiler-signal", daemon=True).start()
+
+    def handle(self, _signum: int, _frame: FrameType | None) -> None:
+        # 仅做属性赋值，不获取任何锁
+        self._pending = True
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def _poll(self) -> None:
+        while not self._closed.wait(SIGNAL_POLL_SECONDS):
+            if self._pending:
+                self._pending = False
+                self._start()
+
+
+_SIGNAL_TRIGGER: _SignalTrigger | None = None
+
+
+def install_profiler_signal(
+    signum: int | None = None,
+    *,
+    duration: float = DEFAULT_DURATION_SECONDS,
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+    output_dir: str | os.PathLike[str] | None = None,
+) -> None:
+    """注册信号触发：收到信号后采样 ``duration`` 秒，并将折叠栈写入 ``output_dir``。
+
+    默认使用 ``SIGUSR2``（Windows 无此信号，需显式传入）；必须在主线程调用，
+    已有会话运行时信号会被忽略。
+
+    ``start`` 会获取线程锁并创建线程，不能在信号上下文中执行：在事件循环内调用时经
+    ``loop.add_signal_handler`` 由事件循环启动会话；否则处理函数只置位标志，由守护线程
+    每 ``SIGNAL_POLL_SECONDS`` 秒检查一次并启动会话。
+    """
+
+    if signum is None:
+        signum = signal.SIGUSR2
+
+    target_dir = Path(output_dir) if output_dir else Path(tempfile.gettempdir())
+
+    def _write(result: ProfileResult) -> None:
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        path = target_dir / f"sf-profile-{os.getpid()}-{stamp}.folded"
+        path.write_text(result.folded(), encoding="utf-8")
+
+    def _start() -> None:
+        try:
+            _DEFAULT_PROFILER.start(duration, interval=interval, on_complete=_write)
+        except ProfilerBusyError:
+            pass
+
+    global _SIGNAL_TRIGGER
+    if _SIGNAL_TRIGGER is not None:
+        _SIGNAL_TRIGGER.close()
+        _SIGNAL_TRIGGER = None
+
+    import asyncio
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        loop.add_signal_handler(signum, _start)
+        return
+    _SIGNAL_TRIGGER = _SignalTrigger(_start)
+    signal.signal(signum, _SIGNAL_TRIGGER.handle)
+
+
+def register_profiler_route(app: FastAPI, *, path: str = "/debug/profile") -> None:
+    """注册按需采样路由，返回 ``text/plain`` 折叠栈。
+
+    采样在线程池中等待，不阻塞事件循环；应仅在内网或受鉴权保护的实例上启用。
+    """
+
+    import asyncio
+
+    from fastapi import Query
+    from fastapi.responses import PlainTextResponse
+
+    from common.exceptions.api import APIError
+    from common.exceptions.codes import ErrorCode
+
+    async def profile_endpoint(
+        seconds: float = Query(DEFAULT_DURATION_SECONDS, gt=0, le=MAX_DURATION_SECONDS),
+        hz: float = Query(1 / DEFAULT_INTERVAL_SECONDS, gt=0, le=1 / MIN_INTERVAL_SECONDS),
+    ):  # 局部函数不加返回注解，避免 FastAPI 解析延迟注解失败
+        try:
+            session = _DEFAULT_PROFILER.start(seconds, interval=1 / hz)
+        except ProfilerBusyError as exc:
+            raise APIError(ErrorCode.RESOURCE_BUSY, str(exc)) from exc
+        result = await asyncio.to_thread(session.wait)
+        assert result is not None
+        return PlainTextResponse(
+            result.folded(),
+            headers={"X-Profile-Samples": str(result.samples)},
+        )
+
+    app.add_api_route(
+        path,
+        profile_endpoint,
+        methods=["GET"],
+        response_class=PlainTextResponse,
+        include_in_schema=False,
+    )
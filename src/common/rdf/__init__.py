@@ -0,0 +1,46 @@
+"""RDF 图相关工具。"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from common._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from .bulk import BulkWriter, BulkWriteResult
+    from .client import FusekiClient, SparqlClient
+    from .memory import InMemorySparqlStore
+    from .naming import GraphNaming, UrnTemplate, compile_urn_template
+    from .snapshot import SnapshotInfo, SnapshotManager, SnapshotResult
+    from .terms import Literal
+
+_EXPORTS = {
+    "BulkWriteResult": ".bulk",
+    "BulkWriter": ".bulk",
+    "FusekiClient": ".client",
+    "GraphNaming": ".naming",
+    "InMemorySparqlStore": ".memory",
+    "Literal": ".terms",
+    "SnapshotInfo": ".snapshot",
+    "SnapshotManager": ".snapshot",
+    "SnapshotResult": ".snapshot",
+    "SparqlClient": ".client",
+    "UrnTemplate": ".naming",
+    "compile_urn_template": ".naming",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+__all__ = [
+    "BulkWriteResult",
+    "BulkWriter",
+    "FusekiClient",
+    "GraphNaming",
+    "InMemorySparqlStore",
+    "Literal",
+    "SnapshotInfo",
+    "SnapshotManager",
+    "SnapshotResult",
+    "SparqlClient",
+    "UrnTemplate",
+    "compile_urn_template",
+]
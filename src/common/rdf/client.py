@@ -0,0 +1,172 @@
+"""SPARQL 端点客户端协议与 Fuseki HTTP 实现。
+
+``FusekiClient`` 依赖可选的 ``httpx``（``pip install sf-common[rdf]``），在构造时才导入。
+每次请求的超时取 ``RDFConfig.timeout.default`` 与当前请求截止时间剩余预算中的较小值，
+并通过 ``common.observability`` 记录 Fuseki 请求指标。
+"""
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, NoReturn, Protocol
+
+from common.exceptions.api import ExternalServiceError
+from common.exceptions.codes import ErrorCode
+from common.observability.metrics import observe_fuseki_failure, observe_fuseki_response
+from common.utils.deadline import effective_timeout
+
+from .sparql import LIST_GRAPHS_QUERY, PING_QUERY
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    import httpx
+
+    from common.config.settings import RDFConfig
+
+_NTRIPLES = "application/n-triples"
+_SPARQL_UPDATE = "application/sparql-update"
+_SPARQL_RESULTS = "application/sparql-results+json"
+
+# 可重试的 Fuseki 错误码：连接失败与超时
+TRANSIENT_ERROR_CODES = frozenset({ErrorCode.FUSEKI_CONNECT_ERROR, ErrorCode.UPSTREAM_TIMEOUT})
+
+
+class SparqlClient(Protocol):
+    """快照与批量写入依赖的最小 SPARQL 端点能力。"""
+
+    async def update(self, sparql: str, *, timeout: float | None = None) -> None:
+        """执行一次 SPARQL Update，``timeout`` 缺省时使用端点默认超时。"""
+
+    def iter_triples(self, graph: str) -> AsyncIterator[str]:
+        """以 N-Triples 行流式读取指定图的全部三元组，图不存在时为空。"""
+
+    async def ping(self) -> None:
+        """执行一次 ``ASK {}`` 查询，确认端点与数据集可用。"""
+
+    async def list_graphs(self) -> list[str]:
+        """列出数据集中的全部命名图。"""
+
+
+def is_transient(exc: BaseException) -> bool:
+    """判断异常是否为可重试的瞬时故障。"""
+
+    return isinstance(exc, ExternalServiceError) and exc.code in TRANSIENT_ERROR_CODES
+
+
+class FusekiClient:
+    """基于 httpx 的 Fuseki 客户端。"""
+
+    def __init__(self, config: RDFConfig, *, client: httpx.AsyncClient | None = None) -> None:
+        import httpx
+
+        self._httpx = httpx
+        self._config = config
+        base = f"{str(config.endpoint).rstrip('/')}/{config.dataset}"
+        self._update_url = f"{base}/update"
+        self._query_url = f"{base}/query"
+        self._data_url = f"{base}/data"
+        auth = None
+        if config.auth.username:
+            auth = httpx.BasicAuth(config.auth.username, config.auth.password or "")
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(auth=auth)
+
+    async def aclose(self) -> None:
+        """关闭内部创建的 HTTP 连接池。"""
+
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> FusekiClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _timeout(self, operation: str, requested: float | None = None) -> float | None:
+        timeout = min(requested, self._config.timeout.max) if requested else self._config.timeout.default
+        return effective_timeout(timeout, operation=f"fuseki.{operation}")
+
+    def _raise_for(self, operation: str, exc: Exception) -> NoReturn:
+        httpx = self._httpx
+        if isinstance(exc, httpx.TimeoutException):
+            observe_fuseki_failure(operation, "timeout")
+            raise ExternalServiceError(ErrorCode.UPSTREAM_TIMEOUT, details={"operation": operation}) from exc
+        observe_fuseki_failure(operation, "connect")
+        raise ExternalServiceError(
+            ErrorCode.FUSEKI_CONNECT_ERROR,
+            details={"operation": operation, "error": str(exc)},
+        ) from exc
+
+    def _check_status(self, operation: str, response: httpx.Response, started: float) -> None:
+        observe_fuseki_response(operation, response.status_code, time.perf_counter() - started)
+        if response.status_code >= 400:
+            observe_fuseki_failure(operation, f"http_{response.status_code}")
+            code = ErrorCode.FUSEKI_CONNECT_ERROR if response.status_code in (502, 503) else ErrorCode.FUSEKI_QUERY_ERROR
+            raise ExternalServiceError(
+                code,
+                details={"operation": operation, "status": response.status_code, "body": response.text[:500]},
+            )
+
+    async def update(self, sparql: str, *, timeout: float | None = None) -> None:
+        started = time.perf_counter()
+        try:
+            response = await self._client.post(
+                self._update_url,
+                content=sparql.encode("utf-8"),
+                headers={"Content-Type": f"{_SPARQL_UPDATE}; charset=utf-8"},
+                timeout=self._timeout("update", timeout),
+            )
+        except self._httpx.TransportError as exc:
+            self._raise_for("update", exc)
+        self._check_status("update", response, started)
+
+    async def iter_triples(self, graph: str) -> AsyncIterator[str]:
+        started = time.perf_counter()
+        try:
+            async with self._client.stream(
+                "GET",
+                self._data_url,
+                params={"graph": graph},
+                headers={"Accept": _NTRIPLES},
+                timeout=self._timeout("read"),
+            ) as response:
+                if response.status_code == 404:
+                    observe_fuseki_response("read", 404, time.perf_counter() - started)
+                    return
+                if response.status_code >= 400:
+                    await response.aread()
+                self._check_status("read", response, started)
+                async for line in response.aiter_lines():
+                    if line and not line.startswith("#"):
+                        yield line
+        except self._httpx.TransportError as exc:
+            self._raise_for("read", exc)
+
+    async def ping(self) -> None:
+        """执行一次 ``ASK {}`` 查询，确认端点与数据集可用。"""
+
+        started = time.perf_counter()
+        try:
+            response = await self._client.post(
+                self._query_url,
+                data={"query": PING_QUERY},
+                headers={"Accept": _SPARQL_RESULTS},
+                timeout=self._timeout("ping"),
+            )
+        except self._httpx.TransportError as exc:
+            self._raise_for("ping", exc)
+        self._check_status("ping", response, started)
+
+    async def list_graphs(self) -> list[str]:
+        started = time.perf_counter()
+        try:
+            response = await self._client.post(
+                self._query_url,
+                data={"query": LIST_GRAPHS_QUERY},
+                headers={"Accept": _SPARQL_RESULTS},
+                timeout=self._timeout("query"),
+            )
+        except self._httpx.TransportError as exc:
+            self._raise_for("query", exc)
+        self._check_status("query", response, started)
+        bindings = response.json()["results"]["bindings"]
+        return [row["g"]["value"] for row in bindings if "g" in row]
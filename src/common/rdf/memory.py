@@ -0,0 +1,69 @@
+"""内存版 SPARQL 端点替身，供本地开发与测试使用。
+
+仅理解 ``common.rdf.sparql`` 渲染出的更新语句（INSERT DATA / DELETE DATA / COPY / DROP），
+三元组按 N-Triples 行原样存储，不做 RDF 语义解析。
+"""
+from __future__ import annotations
+
+import re
+from typing import AsyncIterator
+
+_DATA_RE = re.compile(r"^(INSERT|DELETE) DATA \{ GRAPH <([^>]*)> \{\n(.*)\n\} \}$", re.DOTALL)
+_COPY_RE = re.compile(r"^COPY SILENT GRAPH <([^>]*)> TO GRAPH <([^>]*)>$")
+_DROP_RE = re.compile(r"^DROP SILENT GRAPH <([^>]*)>$")
+
+
+class InMemorySparqlStore:
+    """以 ``{graph: set[line]}`` 保存数据的 SPARQL 端点替身。"""
+
+    def __init__(self) -> None:
+        self.graphs: dict[str, set[str]] = {}
+        self.update_count = 0
+        self.bytes_received = 0
+
+    def load(self, graph: str, lines: list[str] | set[str]) -> None:
+        """直接写入初始数据，不计入请求统计。"""
+
+        self.graphs.setdefault(graph, set()).update(lines)
+
+    async def update(self, sparql: str, *, timeout: float | None = None) -> None:
+        self.update_count += 1
+        self.bytes_received += len(sparql.encode("utf-8"))
+        for operation in sparql.split(" ;\n"):
+            self._apply(operation.strip())
+
+    def _apply(self, operation: str) -> None:
+        match = _DATA_RE.match(operation)
+        if match:
+            verb, graph, body = match.groups()
+            lines = {line for line in body.split("\n") if line}
+            if verb == "INSERT":
+                self.graphs.setdefault(graph, set()).update(lines)
+            elif graph in self.graphs:
+                self.graphs[graph].difference_update(lines)
+                if not self.graphs[graph]:
+                    del self.graphs[graph]
+            return
+        match = _COPY_RE.match(operation)
+        if match:
+            source, target = match.groups()
+            if source in self.graphs:
+                self.graphs[target] = set(self.graphs[source])
+            else:
+                self.graphs.pop(target, None)
+            return
+        match = _DROP_RE.match(operation)
+        if match:
+            self.graphs.pop(match.group(1), None)
+            return
+        raise ValueError(f"unsupported SPARQL update: {operation[:80]!r}")
+
+    async def iter_triples(self, graph: str) -> AsyncIterator[str]:
+        for line in list(self.graphs.get(graph, ())):
+            yield line
+
+    async def list_graphs(self) -> list[str]:
+        return list(self.graphs)
+
+    async def ping(self) -> None:
+        """内存存储始终可用。"""
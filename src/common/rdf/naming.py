@@ -0,0 +1,241 @@
+"""图 URN 模板编译：一次编译，快速构建与反向解析。
+
+``GraphNamingConfig`` 中的 ``graph_format``/``snapshot_format`` 为 ``str.format`` 风格模板。
+编译后构建使用预先生成的 ``%`` 格式串，解析使用预编译正则。构建与解析结果分别缓存在有界 LRU
+中（``cache_size=0`` 时不缓存），相同参数的构建复用同一字符串对象；不使用 ``sys.intern``：
+3.12 起驻留字符串常驻内存，海量快照 URN 会无限增长。
+
+解析时占位符不跨越紧邻占位符的分隔符（字母、数字与下划线以外的字符，如 ``:``），因此
+``urn:sf:{model}:{version}:{env}`` 不会匹配快照 URN。取值本身含分隔符的字段（如带冒号的时间戳）
+需通过 ``greedy`` 显式声明，声明后该字段匹配任意字符。构建时按同样的规则校验取值，为空或含
+分隔符时抛出 ``ValueError``，保证 ``parse(build(...))`` 还原原值。
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from operator import itemgetter
+from string import Formatter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Sequence
+
+from common.config.exceptions import ConfigError
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import GraphNamingConfig
+
+DEFAULT_CACHE_SIZE = 65536
+
+
+def _row_getter(fields: tuple[str, ...]) -> Callable[[Mapping[str, Any]], tuple[Any, ...]]:
+    if len(fields) > 1:
+        return itemgetter(*fields)
+    if fields:
+        name = fields[0]
+        return lambda values: (values[name],)
+    return lambda values: ()
+
+
+class UrnTemplate:
+    """编译后的 URN 模板。"""
+
+    __slots__ = (
+        "template",
+        "fields",
+        "names",
+        "_format",
+        "_pattern",
+        "_getter",
+        "_checks",
+        "_separators",
+        "_build_cached",
+        "_parse_cached",
+    )
+
+    def __init__(self, template: str, *, greedy: Iterable[str] = (), cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.template = template
+        fields: list[str] = []
+        format_parts: list[str] = []
+        pattern_parts: list[str] = []
+        seen: set[str] = set()
+        greedy = frozenset(greedy)
+        try:
+            parsed = list(Formatter().parse(template))
+        except ValueError as exc:
+            raise ConfigError(f"非法的 URN 模板: {template!r}", cause=exc) from exc
+        # 分隔符：紧邻占位符的字面量字符（字母、数字、下划线除外）
+        edges = [parsed[i][0][-1:] for i, item in enumerate(parsed) if item[1] is not None]
+        edges += [parsed[i + 1][0][:1] for i, item in enumerate(parsed[:-1]) if item[1] is not None]
+        separators = sorted({char for char in edges if char and not (char.isalnum() or char == "_")})
+        char_class = "".join(re.escape(char) for char in separators)
+        bounded = f"[^{char_class}]+" if separators else ".+"
+        separator_re = re.compile(f"[{char_class}]") if separators else None
+        checks: list[Callable[[str], Any]] = []
+        self._separators: dict[str, re.Pattern[str] | None] = {}
+        for literal, name, spec, conversion in parsed:
+            format_parts.append(literal.replace("%", "%%"))
+            pattern_parts.append(re.escape(literal))
+            if name is None:
+                continue
+            if not name.isidentifier() or spec or conversion:
+                raise ConfigError(f"URN 模板仅支持简单占位符: {template!r}")
+            format_parts.append("%s")
+            if name in seen:
+                pattern_parts.append(f"(?P={name})")
+            else:
+                seen.add(name)
+                pattern_parts.append(f"(?P<{name}>{'.+' if name in greedy else bounded})")
+            fields.append(name)
+            checks.append(re.compile(".+" if name in greedy else bounded, re.DOTALL).fullmatch)
+            self._separators[name] = None if name in greedy else separator_re
+        unknown = greedy - seen
+        if unknown:
+            raise ConfigError(f"greedy 字段不在 URN 模板中: {sorted(unknown)}")
+        self.fields: tuple[str, ...] = tuple(fields)
+        # 去重后的占位符名称，按首次出现顺序排列
+        self.names: tuple[str, ...] = tuple(dict.fromkeys(fields))
+        self._format = "".join(format_parts)
+        self._pattern = re.compile("".join(pattern_parts), re.DOTALL)
+        self._getter: Callable[[Mapping[str, Any]], tuple[Any, ...]] = _row_getter(self.fields)
+        self._checks = tuple(checks)
+        # typed=True：1 与 1.0 相等但格式化结果不同
+        self._build_cached = lru_cache(maxsize=cache_size, typed=True)(self._render) if cache_size else self._render
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse) if cache_size else self._parse
+
+    def __repr__(self) -> str:
+        return f"UrnTemplate({self.template!r})"
+
+    def _render(self, *row: object) -> str:
+        for name, check, value in zip(self.fields, self._checks, row):
+            if check(str(value)) is None:
+                raise ValueError(f"URN 模板 {self.template!r} 的参数 {name} 为空或包含分隔符: {value!r}")
+        return self._format % row
+
+    def _parse(self, urn: str) -> tuple[str, ...] | None:
+        match = self._pattern.fullmatch(urn)
+        if match is None:
+            return None
+        # 重复占位符以反向引用匹配，不产生分组，groups() 与 names 一一对应
+        return match.groups()
+
+    def _check_column(self, name: str, column: Iterable[object]) -> None:
+        # 整列拼接后一次搜索分隔符，避免逐行调用正则
+        texts = list(map(str, column))
+        invalid = self._separators[name]
+        if all(texts) and (invalid is None or invalid.search("".join(texts)) is None):
+            return
+        bad = next(text for text in texts if not text or (invalid is not None and invalid.search(text)))
+        raise ValueError(f"URN 模板 {self.template!r} 的参数 {name} 为空或包含分隔符: {bad!r}")
+
+    def build(self, **values: object) -> str:
+        """按占位符构建 URN，相同参数返回同一字符串对象；取值为空或含分隔符时抛出 ``ValueError``。"""
+
+        try:
+            row = self._getter(values)
+        except KeyError as exc:
+            raise ValueError(f"URN 模板 {self.template!r} 缺少参数: {exc.args[0]}") from None
+        return self._build_cached(*row)
+
+    def build_row(self, row: Sequence[object]) -> str:
+        """按 ``fields`` 顺序的位置参数构建 URN。"""
+
+        return self._build_cached(*row)
+
+    def build_many(self, columns: Mapping[str, Sequence[object]], *, intern: bool = False) -> list[str]:
+        """由列式输入批量构建 URN。
+
+        ``columns`` 为占位符名到等长序列的映射，也可为标量（对所有行广播）。
+        批量导入时 URN 大多互不相同，默认绕过构建缓存直接格式化；``intern=True`` 时经缓存复用对象。
+        """
+
+        length: int | None = None
+        prepared: list[Iterable[object]] = []
+        broadcast: dict[str, str] = {}
+        for name in self.names:
+            if name not in columns:
+                raise ValueError(f"URN 模板 {self.template!r} 缺少参数: {name}")
+            column = columns[name]
+            if isinstance(column, (str, bytes)) or not isinstance(column, Sequence):
+                broadcast[name] = str(column)
+                continue
+            if length is None:
+                length = len(column)
+            elif len(column) != length:
+                raise ValueError("列式输入长度不一致")
+            if not intern:
+                self._check_column(name, column)
+        if length is None:
+            return [self.build(**broadcast)]
+        for name in self.fields:
+            if name in broadcast:
+                prepared.append([broadcast[name]] * length)
+            else:
+                prepared.append(columns[name])
+        if intern:
+            build_row = self._build_cached
+            return [build_row(*row) for row in zip(*prepared)]
+        for name, value in broadcast.items():
+            self._check_column(name, (value,))
+        fmt = self._format
+        return [fmt % row for row in zip(*prepared)]
+
+    def parse(self, urn: str) -> dict[str, str]:
+        """将 URN 解析为占位符字典，不匹配模板时抛出 ``ValueError``。"""
+
+        values = self._parse_cached(urn)
+        if values is None:
+            raise ValueError(f"URN 与模板 {self.template!r} 不匹配: {urn!r}")
+        return dict(zip(self.names, values))
+
+    def match(self, urn: str) -> bool:
+        """判断 URN 是否符合模板。"""
+
+        return self._parse_cached(urn) is not None
+
+    def cache_clear(self) -> None:
+        """清空构建与解析缓存。"""
+
+        for cached in (self._build_cached, self._parse_cached):
+            cache_clear = getattr(cached, "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+
+
+@lru_cache(maxsize=64)
+def compile_urn_template(template: str, greedy: tuple[str, ...] = ()) -> UrnTemplate:
+    """编译模板并按模板字符串与 ``greedy`` 缓存，同一模板全进程只编译一次。"""
+
+    return UrnTemplate(template, greedy=greedy)
+
+
+class GraphNaming:
+    """基于 ``GraphNamingConfig`` 的图命名工具，快照模板的 ``ts`` 允许包含分隔符。"""
+
+    __slots__ = ("graph", "snapshot")
+
+    def __init__(self, graph_format: str, snapshot_format: str) -> None:
+        self.graph = compile_urn_template(graph_format)
+        self.snapshot = compile_urn_template(snapshot_format, ("ts",) if "{ts}" in snapshot_format else ())
+
+    @classmethod
+    def from_config(cls, config: GraphNamingConfig) -> GraphNaming:
+        """由配置对象创建。"""
+
+        return cls(config.graph_format, config.snapshot_format)
+
+    @classmethod
+    def current(cls) -> GraphNaming:
+        """使用当前 ``ConfigManager`` 中的命名配置创建。"""
+
+        from common.config.registry import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+        return cls.from_config(ConfigManager.current().rdf.naming)
+
+    def graph_urn(self, *, model: str, version: str, env: str) -> str:
+        """构建数据图 URN。"""
+
+        return self.graph.build(model=model, version=version, env=env)
+
+    def snapshot_urn(self, *, model: str, version: str, env: str, ts: str) -> str:
+        """构建快照图 URN。"""
+
+        return self.snapshot.build(model=model, version=version, env=env, ts=ts)
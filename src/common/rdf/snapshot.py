@@ -0,0 +1,278 @@
+"""快照图生命周期管理：流式差异计算与增量上传。
+
+新快照通过服务端 ``COPY`` 复制上一份快照，再仅上传当前图与上一份快照之间的差异
+（分块的 ``DELETE DATA``/``INSERT DATA``），客户端不再整图重传。差异计算采用外部排序：
+两侧三元组按 ``(哈希, 行)`` 排序后分批写入临时文件（每批最多 ``run_size`` 条），
+再多路归并做合并连接，内存占用与图大小无关。排序、归并等阻塞操作在线程池中执行。
+
+限制：三元组按 N-Triples 文本比较，空白节点按标签比较且无法通过 ``DELETE DATA`` 删除，
+需要快照的图应先做 skolem 化。
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, NamedTuple
+
+from . import sparql
+from .naming import GraphNaming
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import RDFConfig
+
+    from .client import SparqlClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RUN_SIZE = 200_000
+DEFAULT_CHUNK_BYTES = 1 << 20
+DEFAULT_RETENTION = 5
+_DIFF_BATCH = 4096
+
+Record = tuple[str, str]
+
+
+class SnapshotInfo(NamedTuple):
+    """已存在的快照图。"""
+
+    urn: str
+    ts: str
+
+
+class SnapshotResult(NamedTuple):
+    """一次快照操作的结果。"""
+
+    urn: str | None
+    base: str | None
+    created: bool
+    inserted: int
+    deleted: int
+    pruned: tuple[str, ...]
+
+
+def _record(line: str) -> Record:
+    return hashlib.blake2b(line.encode("utf-8"), digest_size=8).hexdigest(), line
+
+
+def _read_run(path: Path) -> Iterator[Record]:
+    with path.open("r", encoding="utf-8") as handle:
+        for raw in handle:
+            key, _, line = raw.rstrip("\n").partition("\t")
+            yield key, line
+
+
+class SortedRuns:
+    """外部排序的三元组集合：超出 ``run_size`` 的部分分批排序后写入临时文件。"""
+
+    def __init__(self, *, run_size: int = DEFAULT_RUN_SIZE, tmp_dir: str | os.PathLike[str] | None = None) -> None:
+        self._run_size = run_size
+        self._tmp_dir = tmp_dir
+        self._buffer: list[Record] = []
+        self._runs: list[Path] = []
+        self.count = 0
+
+    async def spill(self, lines: AsyncIterator[str]) -> None:
+        """消费三元组流，按批排序落盘。"""
+
+        async for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            self._buffer.append(_record(line))
+            self.count += 1
+            if len(self._buffer) >= self._run_size:
+                buffer, self._buffer = self._buffer, []
+                await asyncio.to_thread(self._write_run, buffer)
+        if self._runs and self._buffer:
+            buffer, self._buffer = self._buffer, []
+            await asyncio.to_thread(self._write_run, buffer)
+        elif self._buffer:
+            await asyncio.to_thread(self._buffer.sort)
+
+    def _write_run(self, records: list[Record]) -> None:
+        records.sort()
+        fd, name = tempfile.mkstemp(prefix="sf-snapshot-", suffix=".run", dir=self._tmp_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.writelines(f"{key}\t{line}\n" for key, line in records)
+        self._runs.append(Path(name))
+
+    def merged(self) -> Iterator[Record]:
+        """按 ``(哈希, 行)`` 顺序去重输出全部记录。"""
+
+        source: Iterator[Record]
+        if self._runs:
+            source = heapq.merge(*(_read_run(path) for path in self._runs))
+        else:
+            source = iter(self._buffer)
+        previous: Record | None = None
+        for record in source:
+            if record != previous:
+                yield record
+                previous = record
+
+    def close(self) -> None:
+        """删除临时文件。"""
+
+        for path in self._runs:
+            path.unlink(missing_ok=True)
+        self._runs.clear()
+        self._buffer.clear()
+
+    def __enter__(self) -> SortedRuns:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def diff_sorted(current: Iterator[Record], previous: Iterator[Record]) -> Iterator[tuple[bool, str]]:
+    """对两个有序去重记录流做合并连接，输出 ``(True, 行)`` 表示新增、``(False, 行)`` 表示删除。"""
+
+    sentinel = None
+    cur = next(current, sentinel)
+    prev = next(previous, sentinel)
+    while cur is not None or prev is not None:
+        if prev is None or (cur is not None and cur < prev):
+            yield True, cur[1]  # type: ignore[index]
+            cur = next(current, sentinel)
+        elif cur is None or prev < cur:
+            yield False, prev[1]
+            prev = next(previous, sentinel)
+        else:
+            cur = next(current, sentinel)
+            prev = next(previous, sentinel)
+
+
+class _ChunkWriter:
+    """按字节上限分块提交 ``INSERT DATA``/``DELETE DATA``。"""
+
+    def __init__(self, client: SparqlClient, graph: str, *, insert: bool, chunk_bytes: int) -> None:
+        self._client = client
+        self._graph = graph
+        self._render = sparql.insert_data if insert else sparql.delete_data
+        self._chunk_bytes = chunk_bytes
+        self._lines: list[str] = []
+        self._size = 0
+        self.count = 0
+
+    async def add(self, line: str) -> None:
+        size = len(line) + 1
+        if self._lines and self._size + size > self._chunk_bytes:
+            await self.flush()
+        self._lines.append(line)
+        self._size += size
+        self.count += 1
+
+    async def flush(self) -> None:
+        if not self._lines:
+            return
+        lines, self._lines, self._size = self._lines, [], 0
+        await self._client.update(self._render(self._graph, lines))
+
+
+def _utc_stamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+class SnapshotManager:
+    """快照图管理器：创建增量快照并按保留数量清理旧快照。"""
+
+    def __init__(
+        self,
+        client: SparqlClient,
+        naming: GraphNaming,
+        *,
+        retention: int = DEFAULT_RETENTION,
+        run_size: int = DEFAULT_RUN_SIZE,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        tmp_dir: str | os.PathLike[str] | None = None,
+    ) -> None:
+        if retention < 1:
+            raise ValueError("retention must be >= 1")
+        self._client = client
+        self._naming = naming
+        self._retention = retention
+        self._run_size = run_size
+        self._chunk_bytes = chunk_bytes
+        self._tmp_dir = tmp_dir
+
+    @classmethod
+    def from_config(cls, client: SparqlClient, config: RDFConfig, **kwargs: Any) -> SnapshotManager:
+        """按 ``RDFConfig.naming`` 创建管理器。"""
+
+        kwargs.setdefault("retention", config.naming.snapshot_retention)
+        return cls(client, GraphNaming.from_config(config.naming), **kwargs)
+
+    async def list_snapshots(self, *, model: str, version: str, env: str) -> list[SnapshotInfo]:
+        """列出指定图的全部快照，按时间戳从旧到新排序。"""
+
+        template = self._naming.snapshot
+        snapshots: list[SnapshotInfo] = []
+        for urn in await self._client.list_graphs():
+            if not template.match(urn):
+                continue
+            parts = template.parse(urn)
+            if parts.get("model") == model and parts.get("version") == version and parts.get("env") == env:
+                snapshots.append(SnapshotInfo(urn, parts.get("ts", "")))
+        snapshots.sort(key=lambda item: item.ts)
+        return snapshots
+
+    async def take_snapshot(self, *, model: str, version: str, env: str, ts: str | None = None) -> SnapshotResult:
+        """为当前图创建快照；与上一份快照无差异时不创建新图。"""
+
+        source = self._naming.graph_urn(model=model, version=version, env=env)
+        snapshots = await self.list_snapshots(model=model, version=version, env=env)
+        target = self._naming.snapshot_urn(model=model, version=version, env=env, ts=ts or _utc_stamp())
+        if any(item.urn == target for item in snapshots):
+            raise ValueError(f"snapshot already exists: {target}")
+        base = snapshots[-1].urn if snapshots else None
+
+        with SortedRuns(run_size=self._run_size, tmp_dir=self._tmp_dir) as current, SortedRuns(
+            run_size=self._run_size, tmp_dir=self._tmp_dir
+        ) as previous:
+            await current.spill(self._client.iter_triples(source))
+            if base is not None:
+                await previous.spill(self._client.iter_triples(base))
+            deltas = diff_sorted(current.merged(), previous.merged())
+            batch = await asyncio.to_thread(list, itertools.islice(deltas, _DIFF_BATCH))
+            if not batch:
+                pruned = await self.prune(model=model, version=version, env=env)
+                return SnapshotResult(base, base, False, 0, 0, tuple(pruned))
+
+            inserts = _ChunkWriter(self._client, target, insert=True, chunk_bytes=self._chunk_bytes)
+            deletes = _ChunkWriter(self._client, target, insert=False, chunk_bytes=self._chunk_bytes)
+            try:
+                if base is not None:
+                    await self._client.update(sparql.copy_graph(base, target))
+                while batch:
+                    for is_insert, line in batch:
+                        await (inserts if is_insert else deletes).add(line)
+                    batch = await asyncio.to_thread(list, itertools.islice(deltas, _DIFF_BATCH))
+                await deletes.flush()
+                await inserts.flush()
+            except BaseException:
+                # 半成品快照不可用，尽力清理后再抛出；清理失败只记录，不掩盖原始异常
+                try:
+                    await asyncio.shield(self._client.update(sparql.drop_graph(target)))
+                except Exception:  # noqa: BLE001
+                    logger.exception("failed to drop partial snapshot %s", target)
+                raise
+
+        pruned = await self.prune(model=model, version=version, env=env)
+        return SnapshotResult(target, base, True, inserts.count, deletes.count, tuple(pruned))
+
+    async def prune(self, *, model: str, version: str, env: str) -> list[str]:
+        """删除超出保留数量的旧快照，返回被删除的快照 URN。"""
+
+        snapshots = await self.list_snapshots(model=model, version=version, env=env)
+        expired = [item.urn for item in snapshots[: max(0, len(snapshots) - self._retention)]]
+        if expired:
+            await self._client.update(sparql.join_operations(sparql.drop_graph(urn) for urn in expired))
+        return expired
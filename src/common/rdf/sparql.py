@@ -0,0 +1,50 @@
+"""SPARQL Update 语句渲染。
+
+三元组/四元组统一以 N-Triples/N-Quads 行表示（每行一个语句，以 `` .`` 结尾），
+渲染时每行占一行，多条操作以 ``" ;\\n"`` 分隔。N-Triples 中的换行必须转义，
+因此按行切分总是安全的。
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+from .terms import iri
+
+
+def _data_block(keyword: str, graph: str, lines: Iterable[str]) -> str:
+    body = "\n".join(line.rstrip("\n") for line in lines)
+    return f"{keyword} DATA {{ GRAPH {iri(graph)} {{\n{body}\n}} }}"
+
+
+def insert_data(graph: str, lines: Iterable[str]) -> str:
+    """渲染向指定图写入的 ``INSERT DATA``。"""
+
+    return _data_block("INSERT", graph, lines)
+
+
+def delete_data(graph: str, lines: Iterable[str]) -> str:
+    """渲染从指定图删除的 ``DELETE DATA``；SPARQL 不允许其中出现空白节点。"""
+
+    return _data_block("DELETE", graph, lines)
+
+
+def copy_graph(source: str, target: str) -> str:
+    """渲染服务端图复制（覆盖目标图）。"""
+
+    return f"COPY SILENT GRAPH {iri(source)} TO GRAPH {iri(target)}"
+
+
+def drop_graph(graph: str) -> str:
+    """渲染删除图。"""
+
+    return f"DROP SILENT GRAPH {iri(graph)}"
+
+
+def join_operations(operations: Iterable[str]) -> str:
+    """将多条更新操作合并为一次请求。"""
+
+    return " ;\n".join(operations)
+
+
+LIST_GRAPHS_QUERY = "SELECT DISTINCT ?g WHERE { GRAPH ?g { } }"
+PING_QUERY = "ASK {}"
@@ -0,0 +1,83 @@
+"""RDF 术语到 N-Triples 文本的序列化。
+
+字符串视为 IRI（可带一对尖括号），``_:`` 开头的字符串视为空白节点；IRI 中出现空白、控制字符或
+``<>"{}|^`\\`` 时抛出 ``ValueError``，避免拼接出的 SPARQL 语句被改写。字面量必须使用 ``Literal``，
+Python 的 bool/int/float 会转换为对应的 XSD 类型字面量，其它类型抛出 ``TypeError``。
+"""
+from __future__ import annotations
+
+import re
+from typing import NamedTuple, Union
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+_IRI_INVALID = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+_BLANK_NODE = re.compile(r"_:[A-Za-z0-9_](?:[A-Za-z0-9_.-]*[A-Za-z0-9_-])?")
+_LANG_TAG = re.compile(r"[A-Za-z]+(?:-[A-Za-z0-9]+)*")
+
+
+class Literal(NamedTuple):
+    """RDF 字面量。"""
+
+    value: str
+    datatype: str | None = None
+    lang: str | None = None
+
+
+Term = Union[str, Literal, bool, int, float]
+
+
+def check_iri(value: str) -> str:
+    """校验 IRI 并返回去掉尖括号的形式，包含非法字符时抛出 ``ValueError``。"""
+
+    if value[:1] == "<" and value[-1:] == ">":
+        value = value[1:-1]
+    if not value or _IRI_INVALID.search(value):
+        raise ValueError(f"invalid IRI: {value!r}")
+    return value
+
+
+def iri(value: str) -> str:
+    """序列化 IRI，``value`` 可带或不带尖括号。"""
+
+    return f"<{check_iri(value)}>"
+
+
+def literal(value: str, *, datatype: str | None = None, lang: str | None = None) -> str:
+    """序列化字面量。"""
+
+    text = f'"{value.translate(_ESCAPES)}"'
+    if lang:
+        if not _LANG_TAG.fullmatch(lang):
+            raise ValueError(f"invalid language tag: {lang!r}")
+        return f"{text}@{lang}"
+    if datatype:
+        return f"{text}^^{iri(datatype)}"
+    return text
+
+
+def to_nt(term: Term) -> str:
+    """将单个术语序列化为 N-Triples 文本。"""
+
+    if isinstance(term, str):
+        if term.startswith("_:"):
+            if not _BLANK_NODE.fullmatch(term):
+                raise ValueError(f"invalid blank node: {term!r}")
+            return term
+        return iri(term)
+    if isinstance(term, Literal):
+        return literal(term.value, datatype=term.datatype, lang=term.lang)
+    if isinstance(term, bool):
+        return literal("true" if term else "false", datatype=f"{XSD}boolean")
+    if isinstance(term, int):
+        return literal(str(term), datatype=f"{XSD}integer")
+    if isinstance(term, float):
+        return literal(repr(term), datatype=f"{XSD}double")
+    raise TypeError(f"unsupported RDF term type: {type(term).__name__}")
+
+
+def triple_line(subject: Term, predicate: Term, obj: Term) -> str:
+    """序列化一条 N-Triples 语句。"""
+
+    return f"{to_nt(subject)} {to_nt(predicate)} {to_nt(obj)} ."
@@ -0,0 +1,85 @@
+"""通用工具集。"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from common._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from .apikey import ApiKeyMiddleware, ApiKeyRecord, ApiKeyVerifier, PostgresKeyLoader, hash_api_key
+    from .compression import CompressionMiddleware, negotiate
+    from .deadline import (
+        Deadline,
+        DeadlineMiddleware,
+        check_deadline,
+        current_deadline,
+        deadline_scope,
+        effective_timeout,
+        remaining_budget,
+        retry_async,
+    )
+    from .lifecycle import AdmissionMiddleware, ResourceContainer, StartupTiming
+    from .ratelimit import (
+        RateDecision,
+        RateLimitMiddleware,
+        RedisSlidingWindowLimiter,
+        TokenBucketLimiter,
+        create_rate_limiter,
+    )
+    from .tracing import TraceIdMiddleware
+
+_EXPORTS = {
+    "ApiKeyMiddleware": ".apikey",
+    "ApiKeyRecord": ".apikey",
+    "ApiKeyVerifier": ".apikey",
+    "PostgresKeyLoader": ".apikey",
+    "hash_api_key": ".apikey",
+    "CompressionMiddleware": ".compression",
+    "negotiate": ".compression",
+    "Deadline": ".deadline",
+    "DeadlineMiddleware": ".deadline",
+    "check_deadline": ".deadline",
+    "current_deadline": ".deadline",
+    "deadline_scope": ".deadline",
+    "effective_timeout": ".deadline",
+    "remaining_budget": ".deadline",
+    "retry_async": ".deadline",
+    "AdmissionMiddleware": ".lifecycle",
+    "ResourceContainer": ".lifecycle",
+    "StartupTiming": ".lifecycle",
+    "RateDecision": ".ratelimit",
+    "RateLimitMiddleware": ".ratelimit",
+    "RedisSlidingWindowLimiter": ".ratelimit",
+    "TokenBucketLimiter": ".ratelimit",
+    "create_rate_limiter": ".ratelimit",
+    "TraceIdMiddleware": ".tracing",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+__all__ = [
+    "ApiKeyMiddleware",
+    "ApiKeyRecord",
+    "ApiKeyVerifier",
+    "PostgresKeyLoader",
+    "hash_api_key",
+    "CompressionMiddleware",
+    "negotiate",
+    "Deadline",
+    "DeadlineMiddleware",
+    "check_deadline",
+    "current_deadline",
+    "deadline_scope",
+    "effective_timeout",
+    "remaining_budget",
+    "retry_async",
+    "AdmissionMiddleware",
+    "ResourceContainer",
+    "StartupTiming",
+    "RateDecision",
+    "RateLimitMiddleware",
+    "RedisSlidingWindowLimiter",
+    "TokenBucketLimiter",
+    "create_rate_limiter",
+    "TraceIdMiddleware",
+]
@@ -0,0 +1,247 @@
+"""API Key 校验：带 TTL 的有界缓存、负缓存与单飞查询。
+
+缓存以 Key 的 SHA-256 摘要为键，进程内不保存明文 Key。查找只对摘要做哈希表与数据库等值匹配，
+时间差最多暴露摘要的前缀，无法据此逐字节猜出明文 Key，因此不需要 ``hmac.compare_digest``
+式的定长比较。
+
+有效 Key 缓存 ``ttl_seconds``（最多 ``max_entries`` 条）；无效 Key 记录在独立且容量较小的
+负缓存中（``negative_ttl_seconds``、``negative_max_entries``），同一无效 Key 在有效期内不再
+查询数据库，而每个新的无效 Key 仍会查询一次。两级缓存互不挤占，大量不同的无效 Key 只会淘汰
+负缓存，不会把有效 Key 挤出缓存。同一摘要的并发未命中只触发一次加载。吊销 Key 后调用
+``invalidate``/``invalidate_key_id`` 立即失效：正在进行的加载结果不会写回缓存，之后到达的
+请求也不会复用吊销前发起的加载。
+
+Key 存储通过可注入的加载函数访问，``PostgresKeyLoader`` 适配 asyncpg 风格的连接池。
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, NamedTuple
+
+from common.exceptions.codes import ErrorCode
+from common.observability.metrics import observe_api_key_cache
+
+from .responses import ErrorResponder
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import SecurityConfig, Settings
+
+logger = logging.getLogger(__name__)
+
+
+class ApiKeyRecord(NamedTuple):
+    """Key 存储中的一条有效记录，``key_hash`` 为 SHA-256 摘要。"""
+
+    key_id: str
+    client_id: str | None
+    key_hash: bytes
+
+
+KeyLoader = Callable[[bytes], Awaitable[ApiKeyRecord | None]]
+
+
+def hash_api_key(api_key: str) -> bytes:
+    """计算 Key 的 SHA-256 摘要。"""
+
+    return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+
+class PostgresKeyLoader:
+    """按摘要查询 Key 存储，表中 ``key_hash`` 为十六进制 SHA-256，已吊销的行设置 ``revoked_at``。"""
+
+    def __init__(self, pool: Any, *, schema: str, table: str = "api_keys") -> None:
+        self._pool = pool
+        self._query = (
+            f'SELECT key_id, client_id, key_hash FROM "{schema}"."{table}" '
+            "WHERE key_hash = $1 AND revoked_at IS NULL"
+        )
+
+    @classmethod
+    def from_config(cls, pool: Any, settings: Settings) -> PostgresKeyLoader:
+        """按 ``postgres.schema`` 与 ``security.api_key_table`` 创建加载器。"""
+
+        return cls(pool, schema=settings.postgres.schema, table=settings.security.api_key_table)
+
+    async def __call__(self, digest: bytes) -> ApiKeyRecord | None:
+        row = await self._pool.fetchrow(self._query, digest.hex())
+        if row is None:
+            return None
+        return ApiKeyRecord(str(row["key_id"]), row["client_id"], bytes.fromhex(row["key_hash"]))
+
+
+class ApiKeyVerifier:
+    """API Key 校验器，仅供单个事件循环使用。"""
+
+    def __init__(
+        self,
+        loader: KeyLoader,
+        *,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        max_entries: int = 10000,
+        negative_max_entries: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._loader = loader
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._max_entries = max_entries
+        self._negative_max_entries = negative_max_entries
+        self._clock = clock
+        self._cache: OrderedDict[bytes, tuple[float, ApiKeyRecord]] = OrderedDict()
+        # 负缓存只保存过期时间
+        self._negative: OrderedDict[bytes, float] = OrderedDict()
+        self._inflight: dict[bytes, asyncio.Future[ApiKeyRecord | None]] = {}
+        self._generation = 0
+
+    @classmethod
+    def from_config(cls, loader: KeyLoader, config: SecurityConfig, **kwargs: Any) -> ApiKeyVerifier:
+        """按 ``security.api_key_cache`` 创建校验器。"""
+
+        cache = config.api_key_cache
+        kwargs.setdefault("ttl_seconds", cache.ttl_seconds)
+        kwargs.setdefault("negative_ttl_seconds", cache.negative_ttl_seconds)
+        kwargs.setdefault("max_entries", cache.max_entries)
+        kwargs.setdefault("negative_max_entries", cache.negative_max_entries)
+        return cls(loader, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._cache) + len(self._negative)
+
+    async def verify(self, api_key: str | None) -> ApiKeyRecord | None:
+        """校验 Key，有效时返回记录，否则返回 ``None``；加载失败的异常原样抛出且不缓存。"""
+
+        if not api_key:
+            return None
+        digest = hash_api_key(api_key)
+        entry = self._cache.get(digest)
+        if entry is not None:
+            expires, record = entry
+            if expires > self._clock():
+                self._cache.move_to_end(digest)
+                observe_api_key_cache("hit")
+                return record
+            del self._cache[digest]
+        expires = self._negative.get(digest)
+        if expires is not None:
+            if expires > self._clock():
+                observe_api_key_cache("negative_hit")
+                return None
+            del self._negative[digest]
+        observe_api_key_cache("miss")
+        future = self._inflight.get(digest)
+        if future is None:
+            future = self._inflight[digest] = asyncio.ensure_future(self._load(digest))
+            future.add_done_callback(functools.partial(self._forget, digest))
+        # shield：单个等待方被取消时不影响其它共享同一次加载的请求
+        return await asyncio.shield(future)
+
+    def _forget(self, digest: bytes, future: asyncio.Future[ApiKeyRecord | None]) -> None:
+        # 失效后同一摘要可能已经发起新的加载，只移除自己登记的那一次
+        if self._inflight.get(digest) is future:
+            del self._inflight[digest]
+
+    async def _load(self, digest: bytes) -> ApiKeyRecord | None:
+        generation = self._generation
+        record = await self._loader(digest)
+        if generation != self._generation:
+            return record
+        if record is not None:
+            self._cache[digest] = (self._clock() + self._ttl, record)
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+        elif self._negative_ttl > 0:
+            # 负缓存按写入顺序淘汰，命中时不调整顺序
+            self._negative[digest] = self._clock() + self._negative_ttl
+            self._negative.move_to_end(digest)
+            while len(self._negative) > self._negative_max_entries:
+                self._negative.popitem(last=False)
+        return record
+
+    def invalidate(self, api_key: str) -> None:
+        """使指定 Key 的缓存失效。"""
+
+        self._generation += 1
+        digest = hash_api_key(api_key)
+        self._cache.pop(digest, None)
+        self._negative.pop(digest, None)
+        self._inflight.pop(digest, None)
+
+    def invalidate_key_id(self, key_id: str) -> int:
+        """使指定 ``key_id`` 的缓存失效，返回移除的条目数。"""
+
+        self._generation += 1
+        stale = [digest for digest, (_, record) in self._cache.items() if record.key_id == key_id]
+        for digest in stale:
+            del self._cache[digest]
+        # 加载中的记录无法按 key_id 定位，全部放弃，后续请求重新查询
+        self._inflight.clear()
+        return len(stale)
+
+    def clear(self) -> None:
+        """清空缓存。"""
+
+        self._generation += 1
+        self._cache.clear()
+        self._negative.clear()
+        self._inflight.clear()
+
+
+class ApiKeyMiddleware:
+    """ASGI 中间件：``security.require_api_key`` 开启时校验 ``api_key_header``。
+
+    校验通过的记录写入 ``request.state.api_key``；缺失或无效时返回 401 Envelope。
+    """
+
+    def __init__(self, app: Any, *, verifier: ApiKeyVerifier) -> None:
+        self.app = app
+        self._verifier = verifier
+        self._settings: Settings | None = None
+        self._required = False
+        self._key_header = b""
+        self._unauthenticated: ErrorResponder | None = None
+        self._failed: ErrorResponder | None = None
+
+    def _sync(self) -> None:
+        from common.config import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+        settings = ConfigManager.current().settings
+        if settings is self._settings:
+            return
+        security = settings.security
+        self._required = security.require_api_key
+        self._key_header = security.api_key_header.lower().encode("latin-1")
+        self._unauthenticated = ErrorResponder(ErrorCode.UNAUTHENTICATED, settings)
+        self._failed = ErrorResponder(ErrorCode.INTERNAL_ERROR, settings)
+        self._settings = settings
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        self._sync()
+        if not self._required:
+            await self.app(scope, receive, send)
+            return
+        api_key: str | None = None
+        for key, value in scope.get("headers", ()):
+            if key == self._key_header:
+                api_key = value.decode("latin-1")
+                break
+        try:
+            record = await self._verifier.verify(api_key)
+        except Exception:  # noqa: BLE001 - Key 存储不可用时拒绝请求而不是放行
+            logger.exception("api key lookup failed")
+            await self._failed.send(send)  # type: ignore[union-attr]
+            return
+        if record is None:
+            await self._unauthenticated.send(send)  # type: ignore[union-attr]
+            return
+        scope.setdefault("state", {})["api_key"] = record
+        await self.app(scope, receive, send)
@@ -0,0 +1,425 @@
+"""响应压缩：按 ``Accept-Encoding`` 协商 zstd/br/gzip，大响应在线程池中压缩。
+
+``CompressionMiddleware`` 是纯 ASGI 中间件，行为由 ``Settings.compression`` 控制：
+
+* 小于 ``minimum_size`` 的响应、非文本类响应、已编码的响应不压缩；压缩后不变小时发送原文。
+* 不小于 ``offload_size`` 的响应体交给专用线程池压缩（zlib/zstd/brotli 压缩时释放 GIL），
+  避免阻塞事件循环；较小的响应直接在事件循环中压缩，省去线程切换开销。
+* 流式响应（``more_body=True``）逐块压缩并 flush，客户端可以边收边解压。
+* 可能被压缩的响应无论请求是否带 ``Accept-Encoding``、最终是否压缩，都声明
+  ``Vary: Accept-Encoding``；压缩后的强 ETag 降级为弱 ETag。
+
+zstd 与 br 依赖可选的 ``zstandard``、``brotli``（``pip install sf-common[compression]``），
+未安装时自动跳过。压缩耗时与节省字节数通过 ``observe_compression`` 上报。
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Protocol, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import CompressionConfig
+
+_SKIP_STATUS = frozenset({204, 206, 304})
+
+
+class StreamCompressor(Protocol):
+    def compress(self, chunk: bytes) -> bytes:
+        """压缩一块数据并 flush，返回可立即发送的字节。"""
+
+    def finish(self) -> bytes:
+        """结束压缩流。"""
+
+
+class Codec(Protocol):
+    name: str
+
+    def compress(self, data: bytes) -> bytes:
+        """一次性压缩完整数据。"""
+
+    def stream(self) -> StreamCompressor:
+        """创建流式压缩器。"""
+
+
+class _ZlibStream:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class GzipCodec:
+    name = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        obj = zlib.compressobj(self._level, zlib.DEFLATED, 31)
+        return obj.compress(data) + obj.flush()
+
+    def stream(self) -> StreamCompressor:
+        return _ZlibStream(self._level)
+
+
+class _ZstdStream:
+    __slots__ = ("_obj", "_flush_block")
+
+    def __init__(self, obj: Any, flush_block: int) -> None:
+        self._obj = obj
+        self._flush_block = flush_block
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class ZstdCodec:
+    name = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        import zstandard
+
+        self._zstd = zstandard
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        # ZstdCompressor 不是线程安全的，每次压缩单独创建
+        return self._zstd.ZstdCompressor(level=self._level).compress(data)
+
+    def stream(self) -> StreamCompressor:
+        obj = self._zstd.ZstdCompressor(level=self._level).compressobj()
+        return _ZstdStream(obj, self._zstd.COMPRESSOBJ_FLUSH_BLOCK)
+
+
+class _BrotliStream:
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.process(chunk) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class BrotliCodec:
+    name = "br"
+
+    def __init__(self, quality: int = 4) -> None:
+        import brotli
+
+        self._brotli = brotli
+        self._quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return self._brotli.compress(data, quality=self._quality)
+
+    def stream(self) -> StreamCompressor:
+        return _BrotliStream(self._brotli.Compressor(quality=self._quality))
+
+
+def build_codecs(config: CompressionConfig) -> dict[str, Codec]:
+    """按 ``encodings`` 的优先顺序创建可用的编码器，缺少可选依赖的编码被跳过。"""
+
+    factories: dict[str, Callable[[], Codec]] = {
+        "gzip": lambda: GzipCodec(config.gzip_level),
+        "zstd": lambda: ZstdCodec(config.zstd_level),
+        "br": lambda: BrotliCodec(config.brotli_quality),
+    }
+    codecs: dict[str, Codec] = {}
+    for name in config.encodings:
+        try:
+            codecs[name] = factories[name]()
+        except ImportError:
+            continue
+    return codecs
+
+
+@lru_cache(maxsize=512)
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    weights: dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params[:2].lower() == "q=":
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+    return weights
+
+
+def negotiate(accept_encoding: str, available: Sequence[str]) -> str | None:
+    """从 ``available``（按服务端偏好排序）中选出客户端权重最高的编码，无可接受编码时返回 ``None``。"""
+
+    weights = _parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    best: str | None = None
+    best_q = 0.0
+    for name in available:
+        q = weights.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def is_compressible(content_type: bytes) -> bool:
+    """判断内容类型是否值得压缩（文本、JSON、XML 与 RDF 文本序列化）。"""
+
+    media = content_type.split(b";", 1)[0].strip().lower()
+    return (
+        media.startswith(b"text/")
+        or media.endswith(b"json")
+        or media.endswith(b"xml")
+        or media in (b"application/n-triples", b"application/n-quads", b"application/sparql-update")
+    )
+
+
+def _add_vary(headers: list[tuple[bytes, bytes]]) -> bool:
+    """在 ``headers`` 中追加 ``Vary: Accept-Encoding``，已声明（或为 ``*``）时不重复，返回是否追加。"""
+
+    for key, value in headers:
+        if key == b"vary":
+            tokens = {token.strip().lower() for token in value.split(b",")}
+            if b"accept-encoding" in tokens or b"*" in tokens:
+                return False
+    headers.append((b"vary", b"Accept-Encoding"))
+    return True
+
+
+def _may_compress(start: dict[str, Any], config: CompressionConfig) -> bool:
+    """按响应头判断压缩是否可能作用于该响应（与请求的 ``Accept-Encoding`` 无关）。
+
+    可能压缩的响应无论本次是否压缩都要声明 ``Vary: Accept-Encoding``，否则共享缓存会把原文
+    返回给支持压缩的客户端，或反之。
+    """
+
+    status = start["status"]
+    if status < 200 or status in _SKIP_STATUS:
+        return False
+    content_type = b""
+    for key, value in start.get("headers", ()):
+        if key == b"content-encoding":
+            return False
+        if key == b"content-type":
+            content_type = value
+        elif key == b"content-length" and value.isdigit() and int(value) < config.minimum_size:
+            return False
+    return is_compressible(content_type)
+
+
+def _vary_send(send: Any, config: CompressionConfig) -> Callable[[dict[str, Any]], Awaitable[None]]:
+    """包装未协商出编码的请求的 ``send``：可能压缩的响应同样声明 ``Vary``。"""
+
+    async def wrapped(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start" and _may_compress(message, config):
+            headers = list(message.get("headers", ()))
+            if _add_vary(headers):
+                message = {**message, "headers": headers}
+        await send(message)
+
+    return wrapped
+
+
+class _CompressingSend:
+    """包装 ASGI ``send``，延迟发送响应头直到确定是否压缩。"""
+
+    def __init__(self, send: Any, codec: Codec, config: CompressionConfig, executor: ThreadPoolExecutor) -> None:
+        self._send = send
+        self._codec = codec
+        self._config = config
+        self._executor = executor
+        self._start: dict[str, Any] | None = None
+        self._mode: str | None = None
+        self._stream: StreamCompressor | None = None
+        self._original = 0
+        self._compressed = 0
+        self._seconds = 0.0
+
+    async def _run(self, func: Callable[[bytes], bytes], data: bytes) -> bytes:
+        def timed() -> bytes:
+            started = time.perf_counter()
+            result = func(data)
+            self._seconds += time.perf_counter() - started
+            return result
+
+        if len(data) >= self._config.offload_size:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        return timed()
+
+    def _headers(self, *, length: int | None) -> list[tuple[bytes, bytes]]:
+        headers: list[tuple[bytes, bytes]] = []
+        for key, value in self._start["headers"]:  # type: ignore[index]
+            if key == b"content-length":
+                continue
+            if key == b"etag" and not value.startswith(b"W/"):
+                # 压缩后的字节与原文不同，强 ETag 不再成立，降级为弱校验器
+                value = b"W/" + value
+            headers.append((key, value))
+        headers.append((b"content-encoding", self._codec.name.encode("latin-1")))
+        _add_vary(headers)
+        if length is not None:
+            headers.append((b"content-length", str(length).encode("latin-1")))
+        return headers
+
+    def _identity(self) -> dict[str, Any]:
+        """协商后仍发送原文时的响应头：同样声明 ``Vary``，避免缓存把原文返回给支持压缩的客户端。"""
+
+        start: dict[str, Any] = self._start  # type: ignore[assignment]
+        if _may_compress(start, self._config):
+            headers = list(start.get("headers", ()))
+            if _add_vary(headers):
+                return {**start, "headers": headers}
+        return start
+
+    def _eligible(self, body: bytes, more_body: bool) -> bool:
+        start = self._start
+        if start is None or not _may_compress(start, self._config):
+            return False
+        return more_body or len(body) >= self._config.minimum_size
+
+    def _observe(self) -> None:
+        from common.observability.metrics import observe_compression  # 延迟导入，避免加载 prometheus_client
+
+        observe_compression(self._codec.name, self._original, self._compressed, self._seconds)
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        kind = message["type"]
+        if kind == "http.response.start":
+            self._start = message
+            return
+        if kind != "http.response.body":
+            if self._mode is None and self._start is not None:
+                self._mode = "identity"
+                await self._send(self._identity())
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._mode is None:
+            if not self._eligible(body, more_body):
+                self._mode = "identity"
+                await self._send(self._identity())
+            elif not more_body:
+                compressed = await self._run(self._codec.compress, body)
+                self._original, self._compressed = len(body), len(compressed)
+                self._observe()
+                if len(compressed) >= len(body):
+                    self._mode = "identity"
+                    await self._send(self._identity())
+                else:
+                    self._mode = "whole"
+                    await self._send({**self._start, "headers": self._headers(length=len(compressed))})  # type: ignore[dict-item]
+                    await self._send({"type": "http.response.body", "body": compressed})
+                    return
+            else:
+                self._mode = "stream"
+                self._stream = self._codec.stream()
+                await self._send({**self._start, "headers": self._headers(length=None)})  # type: ignore[dict-item]
+
+        if self._mode == "identity":
+            await self._send(message)
+            return
+
+        stream = self._stream
+        chunk = await self._run(stream.compress, body) if body else b""  # type: ignore[union-attr]
+        if not more_body:
+            chunk += stream.finish()  # type: ignore[union-attr]
+        self._original += len(body)
+        self._compressed += len(chunk)
+        if not more_body:
+            self._observe()
+        if chunk or not more_body:
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+class CompressionMiddleware:
+    """ASGI 响应压缩中间件。
+
+    未传入 ``config`` 时使用 ``ConfigManager`` 当前的 ``compression`` 配置并跟随 ``reload()``；
+    线程池大小在首次压缩时按 ``workers`` 确定。应用的 lifespan 关闭完成时线程池随之关闭；
+    不经过 ASGI lifespan 运行时可调用 ``aclose()`` 手动释放。
+    """
+
+    def __init__(self, app: Any, *, config: CompressionConfig | None = None) -> None:
+        self.app = app
+        self._fixed = config
+        self._config: CompressionConfig | None = None
+        self._codecs: dict[str, Codec] = {}
+        self._names: tuple[str, ...] = ()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _sync(self) -> CompressionConfig:
+        config = self._fixed
+        if config is None:
+            from common.config import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+            config = ConfigManager.current().settings.compression
+        if config is not self._config:
+            self._codecs = build_codecs(config)
+            self._names = tuple(self._codecs)
+            self._config = config
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=config.workers, thread_name_prefix="sf-compress")
+        return config
+
+    async def aclose(self) -> None:
+        """关闭压缩线程池，等待已提交的压缩任务完成；之后的请求会重新创建线程池。"""
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown)
+
+    async def _lifespan(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        async def send_after_close(message: dict[str, Any]) -> None:
+            if message["type"] in ("lifespan.shutdown.complete", "lifespan.shutdown.failed"):
+                await self.aclose()
+            await send(message)
+
+        await self.app(scope, receive, send_after_close)
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        config = self._sync()
+        if not config.enabled or not self._names:
+            await self.app(scope, receive, send)
+            return
+        accept = b""
+        for key, value in scope.get("headers", ()):
+            if key == b"accept-encoding":
+                accept = value
+                break
+        encoding: str | None = None
+        # HEAD 不压缩，但 Vary 需与 GET 一致
+        if accept and scope.get("method") != "HEAD":
+            encoding = negotiate(accept.decode("latin-1"), self._names)
+        if encoding is None:
+            await self.app(scope, receive, _vary_send(send, config))
+            return
+        await self.app(scope, receive, _CompressingSend(send, self._codecs[encoding], config, self._executor))  # type: ignore[arg-type]
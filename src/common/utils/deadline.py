@@ -0,0 +1,210 @@
+"""请求级截止时间传递，统一约束上游调用与重试的超时预算。
+
+请求入口通过 ``DeadlineMiddleware`` 或 ``deadline_scope`` 建立截止时间并写入上下文变量；
+上游调用在发起前用 ``effective_timeout`` 把配置的超时（如 ``RDFConfig.timeout.default``、
+``QdrantConfig.timeout.default``、``GraphAlgorithmLimitConfig.default_timeout``）收紧到剩余预算，
+重试循环通过 ``retry_async`` 保证截止时间之后不再发起新的尝试。
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, TypeVar
+
+from common.exceptions.api import DeadlineExceeded
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import RetryConfig
+
+T = TypeVar("T")
+
+_deadline_var: ContextVar[Deadline | None] = ContextVar("sf_deadline", default=None)
+
+
+class Deadline:
+    """基于单调时钟的绝对截止时间。"""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float) -> None:
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        """返回 ``seconds`` 秒后到期的截止时间。"""
+
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """剩余预算（秒），已过期时返回 0。"""
+
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """是否已过期。"""
+
+        return time.monotonic() >= self.expires_at
+
+    def cap(self, timeout: float | None, *, operation: str | None = None) -> float:
+        """将超时收紧到剩余预算，已过期时抛出 ``DeadlineExceeded``。"""
+
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(details={"operation": operation} if operation else None)
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+def current_deadline() -> Deadline | None:
+    """返回当前上下文的截止时间。"""
+
+    return _deadline_var.get()
+
+
+def remaining_budget() -> float | None:
+    """返回当前上下文剩余预算，未设置截止时间时返回 None。"""
+
+    deadline = _deadline_var.get()
+    return None if deadline is None else deadline.remaining()
+
+
+def effective_timeout(timeout: float | None, *, operation: str | None = None) -> float | None:
+    """计算上游调用实际可用的超时，未设置截止时间时原样返回。"""
+
+    deadline = _deadline_var.get()
+    if deadline is None:
+        return timeout
+    return deadline.cap(timeout, operation=operation)
+
+
+def check_deadline(operation: str | None = None) -> None:
+    """截止时间已过期时立即抛出 ``DeadlineExceeded``。"""
+
+    deadline = _deadline_var.get()
+    if deadline is not None and deadline.expired:
+        raise DeadlineExceeded(details={"operation": operation} if operation else None)
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[Deadline | None]:
+    """在当前上下文内建立截止时间，嵌套时取内外层中较早者。"""
+
+    outer = _deadline_var.get()
+    if seconds is None:
+        yield outer
+        return
+    deadline = Deadline.after(seconds)
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _deadline_var.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline_var.reset(token)
+
+
+def parse_timeout_header(value: str | bytes | None) -> float | None:
+    """解析客户端给出的超时头（单位秒），非法或非正数时返回 None。"""
+
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("latin-1")
+    try:
+        seconds = float(value.strip())
+    except ValueError:
+        return None
+    return seconds if seconds > 0 else None
+
+
+def compute_backoff(retry: RetryConfig, attempt: int) -> float:
+    """按 ``RetryConfig`` 计算第 ``attempt`` 次失败后的退避时长。"""
+
+    delay = retry.backoff_seconds * (retry.backoff_multiplier ** (attempt - 1))
+    if retry.jitter_seconds:
+        delay += random.uniform(0, retry.jitter_seconds)
+    return delay
+
+
+def _attempt_details(operation: str | None, attempt: int) -> dict[str, Any]:
+    return {"operation": operation, "attempts": attempt} if operation else {"attempts": attempt}
+
+
+async def retry_async(
+    func: Callable[[float | None], Awaitable[T]],
+    retry: RetryConfig,
+    *,
+    timeout: float | None = None,
+    retry_on: tuple[type[BaseException], ...] = (TimeoutError, ConnectionError),
+    should_retry: Callable[[BaseException], bool] | None = None,
+    operation: str | None = None,
+) -> T:
+    """在截止时间约束下按 ``RetryConfig`` 重试异步调用。
+
+    ``func`` 接收本次尝试可用的超时（秒）。每次尝试前都会重新收紧超时，
+    截止时间已过或剩余预算不足以覆盖退避时长时直接抛出 ``DeadlineExceeded``，
+    不会再发起新的尝试。``retry.max_attempts`` 表示总尝试次数，至少执行一次。
+    ``should_retry`` 可进一步筛选 ``retry_on`` 命中的异常，返回 False 时立即抛出。
+    """
+
+    max_attempts = max(1, retry.max_attempts)
+    attempt = 0
+    while True:
+        attempt += 1
+        attempt_timeout = effective_timeout(timeout, operation=operation)
+        try:
+            if attempt_timeout is None:
+                return await func(None)
+            return await asyncio.wait_for(func(attempt_timeout), attempt_timeout)
+        except retry_on as exc:
+            deadline = _deadline_var.get()
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceeded(details=_attempt_details(operation, attempt)) from exc
+            if attempt >= max_attempts or (should_retry is not None and not should_retry(exc)):
+                raise
+            delay = compute_backoff(retry, attempt)
+            remaining = remaining_budget()
+            if remaining is not None and delay >= remaining:
+                raise DeadlineExceeded(details=_attempt_details(operation, attempt)) from exc
+            await asyncio.sleep(delay)
+
+
+class DeadlineMiddleware:
+    """ASGI 中间件：在请求入口按客户端超时头与契约默认超时建立截止时间。
+
+    预算取 ``security.deadline_header`` 给出的秒数与 ``contract.default_timeout`` 中的较小值。
+    """
+
+    def __init__(self, app: Any, *, header: str | None = None, default_timeout: float | None = None) -> None:
+        self.app = app
+        self._header = header
+        self._default_timeout = default_timeout
+
+    def _resolve(self) -> tuple[bytes, float | None]:
+        header = self._header
+        default_timeout = self._default_timeout
+        if header is None or default_timeout is None:
+            from common.config import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+            manager = ConfigManager.current()
+            header = header or manager.security.deadline_header
+            if default_timeout is None:
+                default_timeout = manager.contract.default_timeout
+        return header.lower().encode("latin-1"), default_timeout
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        header, budget = self._resolve()
+        for key, value in scope.get("headers", ()):
+            if key == header:
+                requested = parse_timeout_header(value)
+                if requested is not None:
+                    budget = requested if budget is None else min(requested, budget)
+                break
+        with deadline_scope(budget):
+            await self.app(scope, receive, send)
@@ -0,0 +1,330 @@
+"""外部资源生命周期容器：并发启动、就绪检查与优雅停机。
+
+``ResourceContainer.from_config`` 按 ``Settings.rdf``/``postgres``/``redis``/``qdrant`` 登记资源，
+启动时所有资源并发创建并执行就绪检查，每个资源受 ``lifecycle.resource_timeouts``（缺省
+``startup_timeout``）限制，任一失败时关闭已启动的资源并抛出 ``ExternalServiceError``。
+各资源的启动耗时记录在 ``timings`` 并上报 ``sf_resource_startup_seconds``。
+
+停机时先停止接纳新请求（``AdmissionMiddleware`` 返回 503），在 ``drain_timeout`` 内等待
+在途请求结束，再并发关闭连接池。``lifespan`` 可直接作为 FastAPI 的 lifespan 使用。
+
+驱动均为可选依赖，在启动对应资源时才导入：``httpx``（rdf）、``asyncpg``（postgres）、
+``redis``、``qdrant-client``（qdrant）。
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, NamedTuple
+
+from common.exceptions.api import ExternalServiceError
+from common.exceptions.codes import ErrorCode
+from common.logging.context import get_trace_id
+
+from .responses import ErrorResponder
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+Factory = Callable[[], Awaitable[Any]]
+Hook = Callable[[Any], Awaitable[Any]]
+
+DEFAULT_RESOURCES = ("rdf", "postgres", "redis", "qdrant")
+
+_RESOURCE_ERROR_CODES = {
+    "rdf": ErrorCode.FUSEKI_CONNECT_ERROR,
+    "postgres": ErrorCode.POSTGRES_ERROR,
+}
+
+
+class ResourceSpec(NamedTuple):
+    """资源定义：``factory`` 创建资源，``check`` 为就绪检查，``close`` 释放资源。"""
+
+    name: str
+    factory: Factory
+    check: Hook | None
+    close: Hook | None
+    timeout: float
+
+
+class StartupTiming(NamedTuple):
+    """单个资源的启动结果。"""
+
+    name: str
+    seconds: float
+    ok: bool
+    error: str | None = None
+
+
+class ResourceContainer:
+    """外部资源容器。"""
+
+    def __init__(self, *, startup_timeout: float = 10.0, drain_timeout: float = 30.0) -> None:
+        self._startup_timeout = startup_timeout
+        self._drain_timeout = drain_timeout
+        self._specs: dict[str, ResourceSpec] = {}
+        self._resources: dict[str, Any] = {}
+        self.timings: dict[str, StartupTiming] = {}
+        self._inflight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._accepting = False
+
+    @classmethod
+    def from_config(cls, settings: Settings | None = None, *, include: Iterable[str] = DEFAULT_RESOURCES) -> ResourceContainer:
+        """按配置登记 ``include`` 中的资源，缺省使用 ``ConfigManager`` 当前配置。"""
+
+        if settings is None:
+            from common.config.registry import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+            settings = ConfigManager.current().settings
+        lifecycle = settings.lifecycle
+        container = cls(startup_timeout=lifecycle.startup_timeout, drain_timeout=lifecycle.drain_timeout)
+        for name in include:
+            if name not in _BUILDERS:
+                raise ValueError(f"unknown resource: {name}")
+            factory, check, close = _BUILDERS[name](settings)
+            container.register(name, factory, check=check, close=close, timeout=lifecycle.resource_timeouts.get(name))
+        return container
+
+    def register(
+        self,
+        name: str,
+        factory: Factory,
+        *,
+        check: Hook | None = None,
+        close: Hook | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """登记资源，需在 ``start`` 之前调用。"""
+
+        if name in self._specs:
+            raise ValueError(f"resource already registered: {name}")
+        self._specs[name] = ResourceSpec(name, factory, check, close, timeout or self._startup_timeout)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._resources[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._resources
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self._resources.get(name, default)
+
+    @property
+    def accepting(self) -> bool:
+        """是否接纳新请求。"""
+
+        return self._accepting
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    async def _start_one(self, spec: ResourceSpec) -> None:
+        started = time.perf_counter()
+        resource = None
+        try:
+            async with asyncio.timeout(spec.timeout):
+                resource = await spec.factory()
+                if spec.check is not None:
+                    await spec.check(resource)
+        except BaseException as exc:
+            self.timings[spec.name] = StartupTiming(spec.name, time.perf_counter() - started, False, repr(exc))
+            if resource is not None:
+                await self._close_one(spec, resource)
+            raise
+        self._resources[spec.name] = resource
+        self.timings[spec.name] = StartupTiming(spec.name, time.perf_counter() - started, True)
+
+    async def start(self) -> None:
+        """并发启动全部资源，任一失败时关闭已启动的资源并抛出异常。"""
+
+        from common.observability.metrics import observe_resource_startup  # 延迟导入，避免加载 prometheus_client
+
+        specs = list(self._specs.values())
+        results = await asyncio.gather(*(self._start_one(spec) for spec in specs), return_exceptions=True)
+        for timing in self.timings.values():
+            observe_resource_startup(timing.name, timing.seconds)
+        failures = {spec.name: result for spec, result in zip(specs, results) if isinstance(result, BaseException)}
+        if failures:
+            await self._close_all()
+            name, error = next(iter(failures.items()))
+            if isinstance(error, TimeoutError):
+                error_code = ErrorCode.UPSTREAM_TIMEOUT
+            else:
+                error_code = _RESOURCE_ERROR_CODES.get(name, ErrorCode.UPSTREAM_ERROR)
+            raise ExternalServiceError(
+                error_code,
+                f"资源启动失败: {', '.join(failures)}",
+                details={"failed": {key: self.timings[key].error for key in failures}},
+            ) from error
+        self._accepting = True
+        logger.info(
+            "resources started",
+            extra={"startup_seconds": {name: round(timing.seconds, 4) for name, timing in self.timings.items()}},
+        )
+
+    @contextlib.asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        """登记一项在途工作，停机时会等待其结束。"""
+
+        self._inflight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._inflight -= 1
+            if not self._inflight:
+                self._idle.set()
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """停止接纳新请求并等待在途工作结束，超时返回 ``False``。"""
+
+        self._accepting = False
+        try:
+            async with asyncio.timeout(self._drain_timeout if timeout is None else timeout):
+                await self._idle.wait()
+        except TimeoutError:
+            logger.warning("drain timed out", extra={"inflight": self._inflight})
+            return False
+        return True
+
+    async def _close_one(self, spec: ResourceSpec, resource: Any) -> None:
+        if spec.close is None:
+            return
+        try:
+            async with asyncio.timeout(spec.timeout):
+                await spec.close(resource)
+        except Exception:  # noqa: BLE001 - 关闭失败不应阻止其它资源释放
+            logger.exception("failed to close resource %s", spec.name)
+
+    async def _close_all(self) -> None:
+        resources, self._resources = self._resources, {}
+        await asyncio.gather(*(self._close_one(self._specs[name], resource) for name, resource in resources.items()))
+
+    async def stop(self, *, drain_timeout: float | None = None) -> None:
+        """优雅停机：停止接纳、排空在途请求、关闭全部资源。"""
+
+        await self.drain(drain_timeout)
+        await self._close_all()
+
+    @contextlib.asynccontextmanager
+    async def lifespan(self, app: Any = None) -> AsyncIterator[None]:
+        """FastAPI lifespan：``FastAPI(lifespan=container.lifespan)``，容器挂在 ``app.state.resources``。"""
+
+        await self.start()
+        if app is not None:
+            app.state.resources = self
+        try:
+            yield
+        finally:
+            await self.stop()
+
+
+class AdmissionMiddleware:
+    """ASGI 中间件：登记在途请求，容器停止接纳后返回 503。
+
+    503 Envelope 按 ``ConfigManager`` 当前配置编码并跟随 ``reload()``，trace_id 取
+    ``TraceIdMiddleware`` 绑定的值。
+    """
+
+    def __init__(self, app: Any, *, container: ResourceContainer) -> None:
+        self.app = app
+        self._container = container
+        self._settings: Settings | None = None
+        self._responder: ErrorResponder | None = None
+
+    def _sync(self) -> ErrorResponder:
+        from common.config.registry import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+        settings = ConfigManager.current().settings
+        if settings is not self._settings:
+            self._responder = ErrorResponder(ErrorCode.SERVICE_UNAVAILABLE, settings)
+            self._settings = settings
+        return self._responder  # type: ignore[return-value]
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if not self._container.accepting:
+            await self._sync().send(send, get_trace_id(), retry_after=1)
+            return
+        async with self._container.track():
+            await self.app(scope, receive, send)
+
+
+Builder = Callable[["Settings"], tuple[Factory, Hook, Hook]]
+
+
+def _build_rdf(settings: Settings) -> tuple[Factory, Hook, Hook]:
+    async def factory() -> Any:
+        from common.rdf.client import FusekiClient
+
+        return FusekiClient(settings.rdf)
+
+    async def check(client: Any) -> None:
+        await client.ping()
+
+    async def close(client: Any) -> None:
+        await client.aclose()
+
+    return factory, check, close
+
+
+def _build_postgres(settings: Settings) -> tuple[Factory, Hook, Hook]:
+    async def factory() -> Any:
+        import asyncpg
+
+        return await asyncpg.create_pool(str(settings.postgres.dsn))
+
+    async def check(pool: Any) -> None:
+        await pool.fetchval("SELECT 1")
+
+    async def close(pool: Any) -> None:
+        await pool.close()
+
+    return factory, check, close
+
+
+def _build_redis(settings: Settings) -> tuple[Factory, Hook, Hook]:
+    async def factory() -> Any:
+        import redis.asyncio
+
+        return redis.asyncio.from_url(str(settings.redis.url))
+
+    async def check(client: Any) -> None:
+        await client.ping()
+
+    async def close(client: Any) -> None:
+        await client.aclose()
+
+    return factory, check, close
+
+
+def _build_qdrant(settings: Settings) -> tuple[Factory, Hook, Hook]:
+    async def factory() -> Any:
+        from qdrant_client import AsyncQdrantClient
+
+        return AsyncQdrantClient(url=str(settings.qdrant.http_url), timeout=settings.qdrant.timeout.default)
+
+    async def check(client: Any) -> None:
+        await client.get_collections()
+
+    async def close(client: Any) -> None:
+        await client.close()
+
+    return factory, check, close
+
+
+_BUILDERS: dict[str, Builder] = {
+    "rdf": _build_rdf,
+    "postgres": _build_postgres,
+    "redis": _build_redis,
+    "qdrant": _build_qdrant,
+}
@@ -0,0 +1,353 @@
+"""按客户端限流：进程内令牌桶与可选的 Redis 滑动窗口。
+
+客户端以 ``security.client_header`` 标识，缺失时退回到连接的远端地址。限额来自
+``security.rate_limit``：``default`` 为缺省规则，``clients`` 按客户端覆盖。
+
+进程内令牌桶按槽位存放在定长 ``array`` 中（每个客户端 32 字节加一个字典项），请求到达时
+按流逝时间惰性补充令牌，无需为每个客户端维护定时器。客户端数达到 ``max_clients`` 时只回收
+已经补满的桶（与新建桶等价）；全部桶都在使用中时，新客户端共用一个按缺省规则限流的溢出桶，
+轮换客户端标识无法借新桶绕过限额。Redis 后端（``pip install redis``）使用滑动窗口计数
+实现全局限额，窗口内上限为 ``rate × window_seconds``，Redis 不可用时退回进程内令牌桶，
+告警日志每分钟最多一条。
+
+``RateLimitMiddleware`` 在每次请求时比对 ``ConfigManager`` 的配置对象，``reload()`` 后
+自动应用新的限额；拒绝时直接发送预先编码的 429 Envelope 与 ``Retry-After`` 头。
+"""
+from __future__ import annotations
+
+import logging
+import math
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Protocol
+
+from common.exceptions.codes import ErrorCode
+
+from .responses import ErrorResponder
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import RateLimitConfig, Settings
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], float]
+
+# Redis 不可用告警的最小间隔（秒）
+_WARNING_INTERVAL = 60.0
+
+
+class RateDecision(NamedTuple):
+    """一次限流判定结果，``retry_after`` 为被拒绝时建议的等待秒数。"""
+
+    allowed: bool
+    remaining: float
+    retry_after: float
+
+
+class RateLimiter(Protocol):
+    """限流后端。"""
+
+    backend: str
+
+    async def acquire(self, client: str, cost: float = 1.0) -> RateDecision:
+        """为客户端消耗 ``cost`` 个配额。"""
+
+    def configure(self, config: RateLimitConfig) -> None:
+        """应用新的限额配置。"""
+
+    async def aclose(self) -> None:
+        """释放后端持有的连接。"""
+
+
+class TokenBucketLimiter:
+    """进程内令牌桶限流器，仅供单个事件循环线程使用。"""
+
+    backend = "memory"
+
+    def __init__(self, config: RateLimitConfig, *, clock: Clock = time.monotonic) -> None:
+        self._clock = clock
+        self._slots: dict[str, int] = {}
+        self._free: list[int] = []
+        self._tokens = array("d")
+        self._stamps = array("d")
+        self._rates = array("d")
+        self._bursts = array("d")
+        self._overflow: int | None = None
+        self._scan_after = 0.0
+        self.configure(config)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def configure(self, config: RateLimitConfig) -> None:
+        self._capacity = config.max_clients
+        self._default = (config.default.rate, float(config.default.burst))
+        self._rules = {client: (rule.rate, float(rule.burst)) for client, rule in config.clients.items()}
+        for client, slot in self._slots.items():
+            self._apply_rule(slot, *self._rules.get(client, self._default))
+        if self._overflow is not None:
+            self._apply_rule(self._overflow, *self._default)
+        self._scan_after = 0.0
+
+    def _apply_rule(self, slot: int, rate: float, burst: float) -> None:
+        self._rates[slot] = rate
+        self._bursts[slot] = burst
+        if self._tokens[slot] > burst:
+            self._tokens[slot] = burst
+
+    def _evict(self, now: float) -> bool:
+        """回收已补满的桶，全部桶都在使用中时返回 ``False``。"""
+
+        if now < self._scan_after:
+            return False
+        tokens, stamps, rates, bursts = self._tokens, self._stamps, self._rates, self._bursts
+        idle: list[str] = []
+        soonest = math.inf
+        for client, slot in self._slots.items():
+            missing = bursts[slot] - tokens[slot] - (now - stamps[slot]) * rates[slot]
+            if missing <= 0:
+                idle.append(client)
+            elif not idle:
+                soonest = min(soonest, missing / rates[slot])
+        if not idle:
+            # 在最早补满的桶补满之前不再重复全量扫描
+            self._scan_after = now + soonest
+            return False
+        for client in idle:
+            self._free.append(self._slots.pop(client))
+        return True
+
+    def _overflow_slot(self, now: float) -> int:
+        if self._overflow is None:
+            rate, burst = self._default
+            self._overflow = len(self._tokens)
+            self._tokens.append(burst)
+            self._stamps.append(now)
+            self._rates.append(rate)
+            self._bursts.append(burst)
+        return self._overflow
+
+    def _allocate(self, client: str, now: float) -> int:
+        if len(self._slots) >= self._capacity and not self._evict(now):
+            # 溢出桶不登记客户端，桶表有空位后客户端再获得独立的桶
+            return self._overflow_slot(now)
+        rate, burst = self._rules.get(client, self._default)
+        if self._free:
+            slot = self._free.pop()
+            self._tokens[slot] = burst
+            self._stamps[slot] = now
+            self._rates[slot] = rate
+            self._bursts[slot] = burst
+        else:
+            slot = len(self._tokens)
+            self._tokens.append(burst)
+            self._stamps.append(now)
+            self._rates.append(rate)
+            self._bursts.append(burst)
+        self._slots[client] = slot
+        return slot
+
+    def take(self, client: str, cost: float = 1.0) -> RateDecision:
+        """同步消耗令牌。"""
+
+        now = self._clock()
+        slot = self._slots.get(client)
+        if slot is None:
+            slot = self._allocate(client, now)
+        rate = self._rates[slot]
+        tokens = self._tokens[slot] + (now - self._stamps[slot]) * rate
+        burst = self._bursts[slot]
+        if tokens > burst:
+            tokens = burst
+        self._stamps[slot] = now
+        if tokens >= cost:
+            self._tokens[slot] = tokens - cost
+            return RateDecision(True, tokens - cost, 0.0)
+        self._tokens[slot] = tokens
+        return RateDecision(False, tokens, (cost - tokens) / rate)
+
+    async def acquire(self, client: str, cost: float = 1.0) -> RateDecision:
+        return self.take(client, cost)
+
+    async def aclose(self) -> None:
+        pass
+
+
+# KEYS: 当前窗口、上一窗口；ARGV: 上一窗口权重、上限、消耗、过期毫秒
+_SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimated = previous * tonumber(ARGV[1]) + current
+local cost = tonumber(ARGV[3])
+if estimated + cost > tonumber(ARGV[2]) then
+  return {0, math.floor(estimated)}
+end
+redis.call('INCRBY', KEYS[1], cost)
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return {1, math.floor(estimated + cost)}
+"""
+
+
+class RedisSlidingWindowLimiter:
+    """基于 Redis 滑动窗口计数的全局限流器。"""
+
+    backend = "redis"
+
+    def __init__(
+        self,
+        redis: Any,
+        config: RateLimitConfig,
+        *,
+        namespace: str,
+        fallback: TokenBucketLimiter | None = None,
+        clock: Clock = time.time,
+        owns_redis: bool = False,
+    ) -> None:
+        self._redis = redis
+        self._owns_redis = owns_redis
+        self._prefix = f"{namespace}:ratelimit:"
+        self._fallback = fallback or TokenBucketLimiter(config)
+        self._clock = clock
+        self._warned_at = -math.inf
+        self._suppressed = 0
+        self.configure(config)
+
+    @classmethod
+    def from_config(cls, settings: Settings, **kwargs: Any) -> RedisSlidingWindowLimiter:
+        """按 ``redis`` 与 ``security.rate_limit`` 配置创建限流器，``aclose`` 时关闭创建的连接。"""
+
+        import redis.asyncio
+
+        client = redis.asyncio.from_url(str(settings.redis.url))
+        kwargs.setdefault("owns_redis", True)
+        return cls(client, settings.security.rate_limit, namespace=settings.redis.namespace, **kwargs)
+
+    def configure(self, config: RateLimitConfig) -> None:
+        self._window = config.window_seconds
+        self._ttl_ms = int(config.window_seconds * 2000) + 1000
+        self._default = max(1, math.floor(config.default.rate * self._window))
+        self._limits = {client: max(1, math.floor(rule.rate * self._window)) for client, rule in config.clients.items()}
+        self._fallback.configure(config)
+
+    async def acquire(self, client: str, cost: float = 1.0) -> RateDecision:
+        now = self._clock() / self._window
+        index = int(now)
+        elapsed = now - index
+        limit = self._limits.get(client, self._default)
+        key = f"{self._prefix}{client}:"
+        try:
+            allowed, count = await self._redis.eval(
+                _SLIDING_WINDOW_SCRIPT,
+                2,
+                f"{key}{index}",
+                f"{key}{index - 1}",
+                1.0 - elapsed,
+                limit,
+                math.ceil(cost),
+                self._ttl_ms,
+            )
+        except Exception as exc:  # noqa: BLE001 - Redis 故障时退回进程内限流，不影响请求
+            self._warn_unavailable(exc)
+            return self._fallback.take(client, cost)
+        if allowed:
+            return RateDecision(True, float(limit - count), 0.0)
+        return RateDecision(False, 0.0, (1.0 - elapsed) * self._window)
+
+    def _warn_unavailable(self, exc: Exception) -> None:
+        now = time.monotonic()
+        if now - self._warned_at < _WARNING_INTERVAL:
+            self._suppressed += 1
+            return
+        logger.warning(
+            "rate limit redis unavailable, using in-process buckets: %s",
+            exc,
+            extra={"suppressed": self._suppressed},
+        )
+        self._warned_at = now
+        self._suppressed = 0
+
+    async def aclose(self) -> None:
+        if self._owns_redis:
+            await self._redis.aclose()
+
+
+def create_rate_limiter(settings: Settings) -> RateLimiter:
+    """按 ``security.rate_limit.backend`` 创建限流器。"""
+
+    config = settings.security.rate_limit
+    if config.backend == "redis":
+        return RedisSlidingWindowLimiter.from_config(settings)
+    return TokenBucketLimiter(config)
+
+
+class RateLimitMiddleware:
+    """ASGI 中间件：按客户端限流，超限时返回 429 Envelope。
+
+    未传入 ``limiter`` 时按配置的后端自动创建，配置重载后后端或 Redis 连接配置变化时重新创建，
+    并关闭旧后端的连接。
+    """
+
+    def __init__(self, app: Any, *, limiter: RateLimiter | None = None) -> None:
+        self.app = app
+        self._limiter = limiter
+        self._owns_limiter = limiter is None
+        self._backend: tuple[Any, ...] = ()
+        self._settings: Settings | None = None
+        self._enabled = False
+        self._rejection: ErrorResponder | None = None
+        self._client_header = b""
+
+    async def _sync(self) -> None:
+        from common.config import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+        settings = ConfigManager.current().settings
+        if settings is self._settings:
+            return
+        config = settings.security.rate_limit
+        # Redis 连接配置变化同样需要重建后端
+        backend = (config.backend, settings.redis) if config.backend == "redis" else (config.backend,)
+        previous: RateLimiter | None = None
+        if self._owns_limiter and (self._limiter is None or backend != self._backend):
+            previous, self._limiter = self._limiter, create_rate_limiter(settings)
+            self._backend = backend
+        elif self._limiter is not None:
+            self._limiter.configure(config)
+        self._enabled = config.enabled
+        self._rejection = ErrorResponder(ErrorCode.RATE_LIMITED, settings)
+        self._client_header = settings.security.client_header.lower().encode("latin-1")
+        self._settings = settings
+        if previous is not None:
+            # 切换后端后关闭旧后端的连接，新请求已经使用新的限流器
+            await previous.aclose()
+
+    async def aclose(self) -> None:
+        """关闭中间件自行创建的限流后端，可在应用停机时调用。"""
+
+        if self._owns_limiter and self._limiter is not None:
+            limiter, self._limiter, self._settings, self._backend = self._limiter, None, None, ()
+            await limiter.aclose()
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await self._sync()
+        if not self._enabled:
+            await self.app(scope, receive, send)
+            return
+        client: str | None = None
+        for key, value in scope.get("headers", ()):
+            if key == self._client_header:
+                client = value.decode("latin-1")
+                break
+        if not client:
+            peer = scope.get("client")
+            client = f"addr:{peer[0]}" if peer else "anonymous"
+        decision = await self._limiter.acquire(client)  # type: ignore[union-attr]
+        if decision.allowed:
+            await self.app(scope, receive, send)
+            return
+        from common.observability.metrics import observe_rate_limited  # 延迟导入，避免加载 prometheus_client
+
+        observe_rate_limited(self._limiter.backend)  # type: ignore[union-attr]
+        await self._rejection.send(send, retry_after=decision.retry_after)  # type: ignore[union-attr]
@@ -0,0 +1,54 @@
+"""ASGI 中间件使用的预编码错误响应。
+
+中间件在进入 FastAPI 之前拒绝请求时无法经过异常处理器，这里按错误码与当前配置预先编码
+Envelope 的固定部分，发送时只拼接 trace_id，输出与 ``Envelope.json_ready()`` 一致。
+trace_id 缺省取 ``TraceIdMiddleware`` 绑定到上下文的值，与日志及异常处理器保持一致。
+"""
+from __future__ import annotations
+
+import json
+import math
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from common.exceptions.codes import ErrorCode, spec_for
+from common.logging.context import get_trace_id
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import Settings
+
+
+class ErrorResponder:
+    """按错误码预编码的 Envelope 错误响应。"""
+
+    def __init__(self, code: ErrorCode, settings: Settings) -> None:
+        spec = spec_for(code)
+        version = json.dumps(settings.contract.envelope_version).encode("utf-8")
+        self.status = spec.http_status
+        self.prefix = b'{"code":%d,"message":%s,"traceId":' % (int(code), spec.message_json)
+        self.suffix = b',"meta":{"version":%s}}' % version
+        self.trace_header = settings.security.trace_header.lower().encode("latin-1")
+
+    async def send(
+        self,
+        send: Any,
+        trace_id: str | None = None,
+        *,
+        retry_after: float | None = None,
+        headers: list[tuple[bytes, bytes]] | None = None,
+    ) -> None:
+        """发送响应，``trace_id`` 缺省时使用上下文绑定的 trace_id，仍缺失时生成新的 UUID。"""
+
+        trace_id = trace_id or get_trace_id() or str(uuid.uuid4())
+        body = b"".join((self.prefix, json.dumps(trace_id).encode("utf-8"), self.suffix))
+        response_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (self.trace_header, trace_id.encode("latin-1", "replace")),
+        ]
+        if retry_after is not None:
+            response_headers.append((b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")))
+        if headers:
+            response_headers.extend(headers)
+        await send({"type": "http.response.start", "status": self.status, "headers": response_headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,97 @@
+"""请求入口的 trace_id 绑定。
+
+``TraceIdMiddleware`` 依次读取 ``security.trace_header``（缺省 ``X-Trace-Id``）与 W3C
+``traceparent`` 头，均缺失或非法时生成新的 UUID。trace_id 绑定到 ``common.logging.context``
+的上下文变量（``JsonFormatter`` 与事件循环监测器据此输出），同时写入 ``request.state.trace_id``
+供异常处理器复用，并在响应未携带该头时回写。应作为最外层中间件注册，使内层中间件与
+业务代码都能通过 ``get_trace_id`` 取得同一个值。
+"""
+from __future__ import annotations
+
+import re
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from common.logging.context import bind_trace_id, reset_trace_id
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from common.config.settings import Settings
+
+# 客户端给出的 trace_id 会写入日志与响应头，只接受有限长度的安全字符
+_TRACE_ID_RE = re.compile(rb"[A-Za-z0-9._:-]{1,128}")
+# traceparent: version-trace_id-parent_id-flags
+_TRACEPARENT_RE = re.compile(rb"[0-9a-f]{2}-([0-9a-f]{32})-[0-9a-f]{16}-[0-9a-f]{2}")
+_ZERO_TRACE_ID = b"0" * 32
+
+
+def parse_traceparent(value: bytes) -> str | None:
+    """从 W3C ``traceparent`` 头取出 32 位十六进制 trace-id，非法时返回 None。"""
+
+    match = _TRACEPARENT_RE.fullmatch(value.strip().lower())
+    if match is None or match.group(1) == _ZERO_TRACE_ID:
+        return None
+    return match.group(1).decode("ascii")
+
+
+class TraceIdMiddleware:
+    """ASGI 中间件：为每个请求绑定 trace_id。"""
+
+    def __init__(self, app: Any, *, header: str | None = None) -> None:
+        self.app = app
+        self._fixed = header
+        self._settings: Settings | None = None
+        self._header = b""
+        self._response_header = b""
+
+    def _sync(self) -> None:
+        if self._fixed is not None:
+            if not self._header:
+                self._response_header = self._fixed.encode("latin-1")
+                self._header = self._fixed.lower().encode("latin-1")
+            return
+        from common.config import ConfigManager  # 延迟导入，避免初始化顺序问题
+
+        settings = ConfigManager.current().settings
+        if settings is self._settings:
+            return
+        self._response_header = settings.security.trace_header.encode("latin-1")
+        self._header = self._response_header.lower()
+        self._settings = settings
+
+    def _resolve(self, headers: Any) -> str:
+        traceparent: bytes | None = None
+        for key, value in headers:
+            if key == self._header:
+                if _TRACE_ID_RE.fullmatch(value):
+                    return value.decode("ascii")
+            elif key == b"traceparent":
+                traceparent = value
+        if traceparent is not None:
+            trace_id = parse_traceparent(traceparent)
+            if trace_id is not None:
+                return trace_id
+        return str(uuid.uuid4())
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        self._sync()
+        trace_id = self._resolve(scope.get("headers", ()))
+        scope.setdefault("state", {})["trace_id"] = trace_id
+        header = self._header
+        value = trace_id.encode("ascii")
+
+        async def send_with_trace(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                if not any(key.lower() == header for key, _ in headers):
+                    headers.append((self._response_header, value))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        token = bind_trace_id(trace_id)
+        try:
+            await self.app(scope, receive, send_with_trace)
+        finally:
+            reset_trace_id(token)
@@ -0,0 +1,166 @@
+import asyncio
+import json
+
+from common.config.registry import ConfigManager
+from common.config.settings import Settings
+from common.utils.apikey import ApiKeyMiddleware, ApiKeyRecord, ApiKeyVerifier, hash_api_key
+from common.utils.tracing import TraceIdMiddleware
+
+VALID = {f"key-{i}": ApiKeyRecord(f"id-{i}", f"client-{i}", hash_api_key(f"key-{i}")) for i in range(3)}
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, digest):
+        self.calls += 1
+        await asyncio.sleep(0)
+        for record in VALID.values():
+            if record.key_hash == digest:
+                return record
+        return None
+
+
+def _verifier(loader, clock, **kwargs):
+    kwargs.setdefault("max_entries", 10)
+    kwargs.setdefault("negative_max_entries", 4)
+    return ApiKeyVerifier(loader, clock=clock, **kwargs)
+
+
+def test_invalid_key_flood_does_not_evict_valid_keys(clock):
+    loader = Loader()
+    verifier = _verifier(loader, clock)
+
+    async def run():
+        for key in VALID:
+            assert await verifier.verify(key) == VALID[key]
+        for i in range(100):
+            assert await verifier.verify(f"bad-{i}") is None
+        calls = loader.calls
+        for key in VALID:
+            assert await verifier.verify(key) == VALID[key]
+        return calls
+
+    calls = asyncio.run(run())
+    assert loader.calls == calls
+    assert len(verifier) == len(VALID) + 4
+
+
+def test_negative_cache_expires(clock):
+    loader = Loader()
+    verifier = _verifier(loader, clock, negative_ttl_seconds=30.0)
+
+    async def run():
+        await verifier.verify("bad")
+        await verifier.verify("bad")
+        assert loader.calls == 1
+        clock.now = 31.0
+        await verifier.verify("bad")
+        assert loader.calls == 2
+
+    asyncio.run(run())
+
+
+def test_concurrent_misses_share_one_load(clock):
+    loader = Loader()
+    verifier = _verifier(loader, clock)
+
+    async def run():
+        return await asyncio.gather(*(verifier.verify("key-0") for _ in range(10)))
+
+    assert asyncio.run(run()) == [VALID["key-0"]] * 10
+    assert loader.calls == 1
+
+
+def test_invalidate_drops_positive_and_negative_entries(clock):
+    loader = Loader()
+    verifier = _verifier(loader, clock)
+
+    async def run():
+        await verifier.verify("key-1")
+        await verifier.verify("bad")
+        verifier.invalidate("bad")
+        assert verifier.invalidate_key_id("id-1") == 1
+        assert len(verifier) == 0
+        await verifier.verify("key-1")
+        assert loader.calls == 3
+
+    asyncio.run(run())
+
+
+def test_verify_after_invalidate_does_not_join_stale_load(clock):
+    store = dict(VALID)
+    release = asyncio.Event()
+    calls = []
+
+    async def loader(digest):
+        calls.append(digest)
+        if len(calls) == 1:
+            await release.wait()
+        return next((record for record in store.values() if record.key_hash == digest), None)
+
+    verifier = _verifier(loader, clock)
+
+    async def run():
+        stale = asyncio.create_task(verifier.verify("key-0"))
+        await asyncio.sleep(0)
+        store.pop("key-0")
+        verifier.invalidate("key-0")
+        fresh = asyncio.create_task(verifier.verify("key-0"))
+        await asyncio.sleep(0)
+        release.set()
+        return await stale, await fresh
+
+    _, fresh = asyncio.run(run())
+    assert fresh is None
+    assert len(calls) == 2
+    assert len(verifier) == 1
+
+
+def test_clear_discards_inflight_loads(clock):
+    release = asyncio.Event()
+    calls = []
+
+    async def loader(digest):
+        calls.append(digest)
+        await release.wait()
+        return None
+
+    verifier = _verifier(loader, clock)
+
+    async def run():
+        first = asyncio.create_task(verifier.verify("key-1"))
+        await asyncio.sleep(0)
+        verifier.clear()
+        second = asyncio.create_task(verifier.verify("key-1"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, second)
+        # 旧加载完成时不能把新登记的加载移除
+        assert not verifier._inflight
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_middleware_rejection_uses_bound_trace_id(monkeypatch, clock):
+    base = Settings()
+    settings = base.model_copy(update={"security": base.security.model_copy(update={"require_api_key": True})})
+    monkeypatch.setattr(ConfigManager, "_instance", ConfigManager(settings))
+
+    async def app(scope, receive, send):
+        raise AssertionError("request should be rejected")
+
+    middleware = TraceIdMiddleware(ApiKeyMiddleware(app, verifier=_verifier(Loader(), clock)))
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"x-api-key", b"bad"), (b"x-trace-id", b"bad id!")]}
+    asyncio.run(middleware(scope, None, send))
+    assert messages[0]["status"] == 401
+    trace_id = json.loads(messages[1]["body"])["traceId"]
+    assert trace_id == scope["state"]["trace_id"] != "bad id!"
+    assert dict(messages[0]["headers"])[b"x-trace-id"] == trace_id.encode()
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from common.config.settings import RetryConfig
+from common.exceptions.api import ExternalServiceError
+from common.exceptions.codes import ErrorCode
+from common.rdf.bulk import BulkWriter
+from common.rdf.memory import InMemorySparqlStore
+from common.rdf.terms import Literal, to_nt
+
+GRAPH = "urn:sf:m:v1:prod"
+NO_BACKOFF = RetryConfig(max_attempts=3, backoff_seconds=0.0, jitter_seconds=None)
+
+
+def _statements(count):
+    return [(f"urn:s:{i}", "urn:p", Literal(f"value {i}")) for i in range(count)]
+
+
+class SlowStore(InMemorySparqlStore):
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+
+    async def update(self, sparql, *, timeout=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            await super().update(sparql, timeout=timeout)
+        finally:
+            self.active -= 1
+
+
+def test_parallel_commits_are_bounded_by_parallelism():
+    store = SlowStore()
+    writer = BulkWriter(store, retry=NO_BACKOFF, chunk_bytes=128, parallelism=3)
+
+    result = asyncio.run(writer.write(_statements(60), graph=f"<{GRAPH}>"))
+
+    assert result.triples == 60 and result.graphs == 1
+    assert result.chunks == store.update_count > 3
+    assert store.peak == 3
+    assert len(store.graphs[GRAPH]) == 60
+
+
+def test_quads_are_grouped_by_graph():
+    store = InMemorySparqlStore()
+    quads = [(f"urn:s:{i}", "urn:p", i, f"urn:g:{i % 2}") for i in range(10)]
+
+    result = asyncio.run(BulkWriter(store, retry=NO_BACKOFF).write(quads))
+
+    assert result.graphs == 2
+    assert {graph: len(lines) for graph, lines in store.graphs.items()} == {"urn:g:0": 5, "urn:g:1": 5}
+
+
+class FlakyStore(InMemorySparqlStore):
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+        self.attempts = 0
+
+    async def update(self, sparql, *, timeout=None):
+        self.attempts += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        await super().update(sparql, timeout=timeout)
+
+
+def test_transient_errors_are_retried():
+    store = FlakyStore([ConnectionError("reset"), ExternalServiceError(ErrorCode.FUSEKI_CONNECT_ERROR)])
+
+    result = asyncio.run(BulkWriter(store, retry=NO_BACKOFF).write(_statements(5), graph=GRAPH))
+
+    assert result.triples == 5
+    assert store.attempts == 3
+    assert len(store.graphs[GRAPH]) == 5
+
+
+def test_permanent_errors_are_not_retried():
+    store = FlakyStore([ExternalServiceError(ErrorCode.FUSEKI_QUERY_ERROR)])
+
+    with pytest.raises(ExternalServiceError) as info:
+        asyncio.run(BulkWriter(store, retry=NO_BACKOFF).write(_statements(5), graph=GRAPH))
+
+    assert info.value.code == ErrorCode.FUSEKI_QUERY_ERROR
+    assert store.attempts == 1
+
+
+@pytest.mark.parametrize(
+    ("statements", "graph"),
+    [
+        (_statements(1), "urn:g> } ; DROP ALL ; INSERT DATA { GRAPH <urn:x"),
+        ([("urn:s", "urn:p", "urn:o", "urn:bad graph")], None),
+        ([("urn:s a", "urn:p", "urn:o")], GRAPH),
+        ([("urn:s", "urn:p", 'urn:o"')], GRAPH),
+    ],
+)
+def test_invalid_iris_are_rejected(statements, graph):
+    store = InMemorySparqlStore()
+
+    with pytest.raises(ValueError, match="invalid IRI"):
+        asyncio.run(BulkWriter(store, retry=NO_BACKOFF).write(statements, graph=graph))
+
+    assert store.update_count == 0
+
+
+@pytest.mark.parametrize("term", [None, object(), b"urn:x", 1.5j])
+def test_unsupported_term_types_raise(term):
+    with pytest.raises(TypeError):
+        to_nt(term)
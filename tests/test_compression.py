@@ -0,0 +1,117 @@
+import asyncio
+import gzip
+
+from common.config.settings import CompressionConfig
+from common.utils.compression import CompressionMiddleware
+
+CONFIG = CompressionConfig(encodings=["gzip"], minimum_size=0, offload_size=0)
+JSON = (b"content-type", b"application/json")
+
+
+def _app(body, headers):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [JSON, *headers]})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def _serve(middleware, accept=b"gzip"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "headers": [(b"accept-encoding", accept)]}
+    asyncio.run(middleware(scope, None, send))
+    return dict(messages[0]["headers"]), messages[1]["body"]
+
+
+def test_compressed_response_weakens_strong_etag():
+    body = b'{"data": "' + b"x" * 4096 + b'"}'
+    headers, payload = _serve(CompressionMiddleware(_app(body, [(b"etag", b'"v1"')]), config=CONFIG))
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"etag"] == b'W/"v1"'
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert gzip.decompress(payload) == body
+
+
+def test_weak_etag_and_existing_vary_are_kept():
+    body = b"x" * 4096
+    app = _app(body, [(b"etag", b'W/"v1"'), (b"vary", b"Origin, accept-encoding")])
+    headers, _ = _serve(CompressionMiddleware(app, config=CONFIG))
+    assert headers[b"etag"] == b'W/"v1"'
+    assert headers[b"vary"] == b"Origin, accept-encoding"
+
+
+def test_identity_fallback_declares_vary():
+    # 压缩后不变小，回退为原文
+    body = b'{"a":1}'
+    headers, payload = _serve(CompressionMiddleware(_app(body, [(b"etag", b'"v1"')]), config=CONFIG))
+    assert b"content-encoding" not in headers
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert headers[b"etag"] == b'"v1"'
+    assert payload == body
+
+
+def test_executor_is_shut_down_with_lifespan():
+    body = b"x" * 4096
+    middleware = CompressionMiddleware(_app(body, []), config=CONFIG)
+    _serve(middleware)
+    executor = middleware._executor
+    assert executor is not None
+
+    async def lifespan_app(scope, receive, send):
+        await receive()
+        await send({"type": "lifespan.shutdown.complete"})
+
+    middleware.app = lifespan_app
+    sent = []
+
+    async def receive():
+        return {"type": "lifespan.shutdown"}
+
+    async def send(message):
+        assert middleware._executor is None
+        sent.append(message["type"])
+
+    asyncio.run(middleware({"type": "lifespan"}, receive, send))
+    assert sent == ["lifespan.shutdown.complete"]
+    assert executor._shutdown
+
+
+def _serve_without_negotiation(app, headers, method="GET"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "headers": headers}
+    asyncio.run(CompressionMiddleware(app, config=CONFIG)(scope, None, send))
+    return messages[0]["headers"], messages[1]["body"]
+
+
+def test_request_without_accept_encoding_still_declares_vary():
+    body = b"x" * 4096
+    headers, payload = _serve_without_negotiation(_app(body, [(b"vary", b"Origin")]), [])
+    assert payload == body
+    assert b"content-encoding" not in dict(headers)
+    assert [value for key, value in headers if key == b"vary"] == [b"Origin", b"Accept-Encoding"]
+
+
+def test_unacceptable_encodings_and_head_still_declare_vary():
+    body = b"x" * 4096
+    for headers, method in (([(b"accept-encoding", b"identity, gzip;q=0")], "GET"), ([], "HEAD")):
+        response_headers, payload = _serve_without_negotiation(_app(body, []), headers, method)
+        assert payload == body
+        assert dict(response_headers)[b"vary"] == b"Accept-Encoding"
+
+
+def test_uncompressible_response_has_no_vary():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"image/png")]})
+        await send({"type": "http.response.body", "body": b"x" * 4096})
+
+    for accept in ([], [(b"accept-encoding", b"gzip")]):
+        headers, _ = _serve_without_negotiation(app, accept)
+        assert b"vary" not in dict(headers)
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from common.config.settings import RetryConfig
+from common.exceptions.api import DeadlineExceeded
+from common.utils.deadline import (
+    DeadlineMiddleware,
+    current_deadline,
+    deadline_scope,
+    parse_timeout_header,
+    retry_async,
+)
+
+NO_BACKOFF = RetryConfig(max_attempts=5, backoff_seconds=0.0, jitter_seconds=None)
+
+
+def test_retry_does_not_start_attempt_after_deadline():
+    attempts = []
+
+    async def flaky(timeout):
+        attempts.append(timeout)
+        await asyncio.sleep(0.03)
+        raise ConnectionError("boom")
+
+    async def run():
+        with deadline_scope(0.05):
+            await retry_async(flaky, NO_BACKOFF, operation="op")
+
+    with pytest.raises(DeadlineExceeded) as info:
+        asyncio.run(run())
+    assert len(attempts) == 2
+    assert isinstance(info.value.__cause__, (TimeoutError, ConnectionError))
+    assert info.value.details == {"operation": "op", "attempts": 2}
+
+
+def test_retry_raises_when_backoff_exceeds_remaining_budget():
+    attempts = []
+
+    async def flaky(timeout):
+        attempts.append(timeout)
+        raise ConnectionError("boom")
+
+    async def run():
+        with deadline_scope(0.1):
+            await retry_async(flaky, RetryConfig(max_attempts=5, backoff_seconds=1.0, jitter_seconds=None))
+
+    with pytest.raises(DeadlineExceeded) as info:
+        asyncio.run(run())
+    assert attempts and len(attempts) == 1
+    assert info.value.details == {"attempts": 1}
+
+
+def test_retry_clamps_attempt_timeout_to_remaining_budget():
+    timeouts = []
+
+    async def flaky(timeout):
+        timeouts.append(timeout)
+        if len(timeouts) < 3:
+            raise TimeoutError
+        return "ok"
+
+    async def run():
+        with deadline_scope(0.5):
+            return await retry_async(flaky, NO_BACKOFF, timeout=10.0)
+
+    assert asyncio.run(run()) == "ok"
+    assert len(timeouts) == 3
+    assert all(0 < timeout <= 0.5 for timeout in timeouts)
+    assert timeouts == sorted(timeouts, reverse=True)
+
+
+def test_retry_cancels_attempt_at_deadline():
+    async def slow(timeout):
+        await asyncio.sleep(1.0)
+
+    async def run():
+        with deadline_scope(0.05):
+            await retry_async(slow, RetryConfig(max_attempts=1), timeout=10.0)
+
+    with pytest.raises((DeadlineExceeded, TimeoutError)):
+        asyncio.run(run())
+
+
+def test_retry_without_deadline_passes_configured_timeout():
+    timeouts = []
+
+    async def call(timeout):
+        timeouts.append(timeout)
+        return timeout
+
+    assert asyncio.run(retry_async(call, NO_BACKOFF, timeout=2.0)) == 2.0
+    assert asyncio.run(retry_async(call, NO_BACKOFF)) is None
+    assert timeouts == [2.0, None]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("2.5", 2.5),
+        (b" 3 ", 3.0),
+        ("0", None),
+        ("-1", None),
+        ("abc", None),
+        (b"", None),
+    ],
+)
+def test_parse_timeout_header(value, expected):
+    assert parse_timeout_header(value) == expected
+
+
+def _serve(middleware_kwargs, headers):
+    seen = []
+
+    async def app(scope, receive, send):
+        deadline = current_deadline()
+        seen.append(None if deadline is None else deadline.remaining())
+
+    middleware = DeadlineMiddleware(app, **middleware_kwargs)
+    scope = {"type": "http", "headers": headers}
+    asyncio.run(middleware(scope, None, None))
+    return seen[0]
+
+
+def test_middleware_uses_shorter_of_header_and_default():
+    kwargs = {"header": "X-Request-Timeout", "default_timeout": 30.0}
+    assert _serve(kwargs, [(b"x-request-timeout", b"2")]) <= 2.0
+    assert 2.0 < _serve(kwargs, [(b"x-request-timeout", b"60")]) <= 30.0
+
+
+def test_middleware_ignores_invalid_header():
+    kwargs = {"header": "X-Request-Timeout", "default_timeout": 5.0}
+    assert 4.0 < _serve(kwargs, [(b"x-request-timeout", b"soon")]) <= 5.0
+    assert 4.0 < _serve(kwargs, [(b"x-request-timeout", b"-3")]) <= 5.0
+    assert 4.0 < _serve(kwargs, []) <= 5.0
+
+
+def test_middleware_header_name_is_case_insensitive():
+    kwargs = {"header": "X-Budget", "default_timeout": 30.0}
+    assert _serve(kwargs, [(b"x-budget", b"1.5")]) <= 1.5
+    assert _serve(kwargs, [(b"x-request-timeout", b"1.5")]) > 1.5
@@ -0,0 +1,144 @@
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from common.config.env_overrides import apply_env_overrides, build_env_bindings
+from common.config.exceptions import ConfigError
+from common.config.loader import ENV_KEY_ALIASES
+from common.config.settings import Settings
+
+
+def _apply(environ, config=None, aliases=None):
+    return apply_env_overrides(config or {}, Settings, aliases=aliases, environ=environ)
+
+
+class Inner(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    b: int = 0
+
+
+class Colliding(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    a: Inner = Field(default_factory=Inner)
+    a_b: int = 0
+
+
+def test_colliding_env_names_raise():
+    with pytest.raises(ConfigError, match="A_B"):
+        build_env_bindings(Colliding)
+
+
+def test_settings_bindings_have_no_collisions():
+    bindings = build_env_bindings(Settings)
+    assert bindings["RDF_TIMEOUT_DEFAULT"].path == ("rdf", "timeout", "default")
+    assert len({binding.path for binding in bindings.values()}) == len(bindings)
+
+
+def test_alias_applies_when_canonical_missing():
+    result = _apply({"LOG_LEVEL": "DEBUG"}, aliases=ENV_KEY_ALIASES)
+    assert result["logging"]["level"] == "DEBUG"
+
+
+def test_canonical_name_wins_over_alias():
+    result = _apply({"LOG_LEVEL": "DEBUG", "LOGGING_LEVEL": "WARNING"}, aliases=ENV_KEY_ALIASES)
+    assert result["logging"]["level"] == "WARNING"
+
+
+def test_alias_to_unknown_name_raises():
+    with pytest.raises(ConfigError, match="未知"):
+        _apply({}, aliases={"OLD_NAME": "NOT_A_FIELD"})
+
+
+def test_alias_shadowing_canonical_name_raises():
+    with pytest.raises(ConfigError, match="重名"):
+        _apply({}, aliases={"LOGGING_LEVEL": "LOGGING_FORMAT"})
+
+
+@pytest.mark.parametrize(
+    ("env", "value", "path", "expected"),
+    [
+        ("SECURITY_REQUIRE_API_KEY", "Yes", ("security", "require_api_key"), True),
+        ("SECURITY_REQUIRE_API_KEY", "off", ("security", "require_api_key"), False),
+        ("RDF_RETRIES_MAX_ATTEMPTS", " 5 ", ("rdf", "retries", "max_attempts"), 5),
+        ("RDF_RETRIES_BACKOFF_SECONDS", "0.25", ("rdf", "retries", "backoff_seconds"), 0.25),
+        ("RDF_RETRIES_JITTER_SECONDS", "null", ("rdf", "retries", "jitter_seconds"), None),
+        ("COMPRESSION_ENCODINGS", "gzip, br", ("compression", "encodings"), ["gzip", "br"]),
+        ("COMPRESSION_ENCODINGS", '["zstd"]', ("compression", "encodings"), ["zstd"]),
+        (
+            "SECURITY_RATE_LIMIT_CLIENTS",
+            '{"svc": {"rate": 10, "burst": 20}}',
+            ("security", "rate_limit", "clients"),
+            {"svc": {"rate": 10, "burst": 20}},
+        ),
+    ],
+)
+def test_type_coercion(env, value, path, expected):
+    result = _apply({env: value})
+    for key in path:
+        result = result[key]
+    assert result == expected
+
+
+def test_coerced_values_validate():
+    settings = Settings.model_validate(
+        _apply({"SECURITY_RATE_LIMIT_CLIENTS": '{"svc": {"rate": 10, "burst": 20}}', "COMPRESSION_ENCODINGS": "gzip"})
+    )
+    assert settings.security.rate_limit.clients["svc"].burst == 20
+    assert settings.compression.encodings == ["gzip"]
+
+
+@pytest.mark.parametrize(
+    ("env", "value"),
+    [
+        ("SECURITY_REQUIRE_API_KEY", "maybe"),
+        ("RDF_RETRIES_MAX_ATTEMPTS", "three"),
+        ("SECURITY_RATE_LIMIT_CLIENTS", "svc=10"),
+    ],
+)
+def test_invalid_values_raise_config_error(env, value):
+    with pytest.raises(ConfigError, match=env):
+        _apply({env: value})
+
+
+def test_overrides_do_not_mutate_input():
+    config = {"rdf": {"timeout": {"default": 5}}}
+    result = _apply({"RDF_TIMEOUT_DEFAULT": "9"}, config=config)
+    assert result["rdf"]["timeout"]["default"] == 9
+    assert config == {"rdf": {"timeout": {"default": 5}}}
+
+
+class Lists(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    numbers: list[int] = Field(default_factory=list)
+    flags: list[bool] = Field(default_factory=list)
+    port: int = 0
+
+
+@pytest.mark.parametrize("raw", ['[1, "2", " 3 "]', "1, 2,3"])
+def test_list_items_are_converted_in_both_forms(raw):
+    result = apply_env_overrides({}, Lists, environ={"NUMBERS": raw, "FLAGS": '["yes", false, "0"]'})
+    assert result == {"numbers": [1, 2, 3], "flags": [True, False, False]}
+
+
+def test_json_list_items_are_validated():
+    with pytest.raises(ConfigError, match="NUMBERS"):
+        apply_env_overrides({}, Lists, environ={"NUMBERS": '[1, "x"]'})
+
+
+def test_int_fields_reject_decimal_notation():
+    assert apply_env_overrides({}, Lists, environ={"PORT": " 8000 "}) == {"port": 8000}
+    with pytest.raises(ConfigError, match="PORT"):
+        apply_env_overrides({}, Lists, environ={"PORT": "8000.0"})
+
+
+def test_compression_encodings_from_json_list():
+    result = _apply({"COMPRESSION_ENCODINGS": '["gzip", " br "]'})
+    assert Settings.model_validate(result).compression.encodings == ["gzip", "br"]
+
+
+def test_aliases_target_known_fields():
+    assert "DEADLINE_HEADER" not in ENV_KEY_ALIASES
+    bindings = build_env_bindings(Settings)
+    assert all(canonical in bindings for canonical in ENV_KEY_ALIASES.values())
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from common.exceptions.api import APIError
+from common.exceptions.catalog import ErrorCatalog
+from common.exceptions.codes import ERROR_SPECS, ErrorCode, register_message, reset_messages, spec_for
+
+
+@pytest.fixture(autouse=True)
+def _reset_overrides():
+    yield
+    reset_messages()
+
+
+def test_every_code_has_spec_with_encoded_message():
+    assert set(ERROR_SPECS) == set(ErrorCode)
+    for spec in ERROR_SPECS.values():
+        assert json.loads(spec.message_json) == spec.default_message
+
+
+def test_error_specs_is_read_only():
+    with pytest.raises(TypeError):
+        ERROR_SPECS[ErrorCode.NOT_FOUND] = ERROR_SPECS[ErrorCode.OK]  # type: ignore[index]
+
+
+def test_register_message_overrides_without_touching_defaults():
+    default = ERROR_SPECS[ErrorCode.NOT_FOUND]
+    register_message(ErrorCode.NOT_FOUND, '找不到 "资源"\n')
+
+    spec = spec_for(ErrorCode.NOT_FOUND)
+    assert spec.default_message == '找不到 "资源"\n'
+    assert spec.http_status == default.http_status
+    assert json.loads(spec.message_json) == spec.default_message
+    assert ERROR_SPECS[ErrorCode.NOT_FOUND] is default
+    assert APIError(ErrorCode.NOT_FOUND).message == '找不到 "资源"\n'
+    assert ErrorCatalog.get_message(ErrorCode.NOT_FOUND) == '找不到 "资源"\n'
+
+
+def test_reset_messages_restores_defaults():
+    register_message(ErrorCode.NOT_FOUND, "a")
+    register_message(ErrorCode.FORBIDDEN, "b")
+
+    reset_messages(ErrorCode.NOT_FOUND)
+    assert spec_for(ErrorCode.NOT_FOUND) is ERROR_SPECS[ErrorCode.NOT_FOUND]
+    assert spec_for(ErrorCode.FORBIDDEN).default_message == "b"
+
+    ErrorCatalog.reset()
+    assert spec_for(ErrorCode.FORBIDDEN) is ERROR_SPECS[ErrorCode.FORBIDDEN]
+
+
+def test_unknown_code_falls_back_to_default_spec():
+    assert spec_for(9999) is ERROR_SPECS[ErrorCode.INTERNAL_ERROR]
+    assert ErrorCatalog.get_message(9999) == "未知错误，请联系管理员"  # type: ignore[arg-type]
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from common.config.registry import ConfigManager
+from common.config.settings import Settings
+from common.exceptions.api import ExternalServiceError
+from common.exceptions.codes import ErrorCode
+from common.rdf.memory import InMemorySparqlStore
+from common.utils.lifecycle import AdmissionMiddleware, ResourceContainer
+from common.utils.tracing import TraceIdMiddleware
+
+
+def _store_factory(delay):
+    async def factory():
+        await asyncio.sleep(delay)
+        return InMemorySparqlStore()
+
+    return factory
+
+
+async def _ping(store):
+    await store.ping()
+
+
+def test_resources_start_concurrently():
+    container = ResourceContainer(startup_timeout=1.0)
+    for name in ("a", "b", "c"):
+        container.register(name, _store_factory(0.1), check=_ping)
+
+    started = time.perf_counter()
+    asyncio.run(container.start())
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.25
+    assert container.accepting
+    assert all(isinstance(container[name], InMemorySparqlStore) for name in ("a", "b", "c"))
+    assert all(timing.ok for timing in container.timings.values())
+
+
+def test_startup_timeout_closes_started_resources():
+    closed = []
+
+    async def close(store):
+        closed.append(store)
+
+    container = ResourceContainer(startup_timeout=1.0)
+    container.register("fast", _store_factory(0), check=_ping, close=close)
+    container.register("slow", _store_factory(1.0), close=close, timeout=0.05)
+
+    with pytest.raises(ExternalServiceError) as info:
+        asyncio.run(container.start())
+
+    assert info.value.code == ErrorCode.UPSTREAM_TIMEOUT
+    assert list(info.value.details["failed"]) == ["slow"]
+    assert len(closed) == 1 and isinstance(closed[0], InMemorySparqlStore)
+    assert "fast" not in container
+    assert not container.accepting
+
+
+def test_drain_waits_for_tracked_work():
+    container = ResourceContainer()
+    finished = []
+
+    async def work():
+        async with container.track():
+            await asyncio.sleep(0.05)
+            finished.append(True)
+
+    async def run():
+        task = asyncio.create_task(work())
+        await asyncio.sleep(0)
+        assert container.inflight == 1
+        assert await container.drain(timeout=1.0)
+        assert finished
+        await task
+
+    asyncio.run(run())
+
+
+def test_drain_reports_timeout():
+    container = ResourceContainer()
+
+    async def run():
+        async with container.track():
+            return await container.drain(timeout=0.01)
+
+    assert asyncio.run(run()) is False
+
+
+def _settings(version):
+    base = Settings()
+    return base.model_copy(update={"contract": base.contract.model_copy(update={"envelope_version": version})})
+
+
+def test_rejects_with_503_after_drain(monkeypatch):
+    monkeypatch.setattr(ConfigManager, "_instance", ConfigManager(_settings("v1")))
+    container = ResourceContainer()
+    container.register("rdf", _store_factory(0), check=_ping)
+    served = []
+
+    async def app(scope, receive, send):
+        served.append(scope)
+
+    middleware = TraceIdMiddleware(AdmissionMiddleware(app, container=container))
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    def request():
+        messages.clear()
+        asyncio.run(middleware({"type": "http", "headers": [(b"x-trace-id", b"abc")]}, None, send))
+
+    asyncio.run(container.start())
+    request()
+    assert len(served) == 1 and not messages
+
+    asyncio.run(container.drain())
+    request()
+    assert len(served) == 1
+    assert messages[0]["status"] == 503
+    headers = dict(messages[0]["headers"])
+    assert headers[b"retry-after"] == b"1"
+    assert headers[b"x-trace-id"] == b"abc"
+    body = json.loads(messages[1]["body"])
+    assert body["code"] == int(ErrorCode.SERVICE_UNAVAILABLE)
+    assert body["traceId"] == "abc"
+    assert body["meta"]["version"] == "v1"
+
+    # 配置重载后 503 Envelope 随之更新
+    monkeypatch.setattr(ConfigManager, "_instance", ConfigManager(_settings("v2")))
+    request()
+    assert json.loads(messages[1]["body"])["meta"]["version"] == "v2"
@@ -0,0 +1,91 @@
+import pytest
+
+from common.config.exceptions import ConfigError
+from common.rdf.naming import GraphNaming, UrnTemplate
+
+GRAPH = "urn:sf:{model}:{version}:{env}"
+SNAPSHOT = "urn:sf:{model}:{version}:{env}:snapshot:{ts}"
+
+
+def test_graph_template_does_not_match_snapshot_urns():
+    naming = GraphNaming(GRAPH, SNAPSHOT)
+    snapshot = naming.snapshot_urn(model="m", version="v1", env="prod", ts="20240101T000000Z")
+
+    assert not naming.graph.match(snapshot)
+    assert not naming.snapshot.match(naming.graph_urn(model="m", version="v1", env="prod"))
+    assert naming.graph.parse("urn:sf:m:v1.2:prod") == {"model": "m", "version": "v1.2", "env": "prod"}
+
+
+def test_snapshot_timestamp_may_contain_separators():
+    naming = GraphNaming(GRAPH, SNAPSHOT)
+    urn = naming.snapshot_urn(model="m", version="v1", env="prod", ts="2024-01-01T00:00:00Z")
+
+    assert naming.snapshot.parse(urn)["ts"] == "2024-01-01T00:00:00Z"
+
+
+def test_placeholders_stop_at_separators_unless_greedy():
+    template = UrnTemplate("urn:{a}:{b}")
+    with pytest.raises(ValueError):
+        template.parse("urn:x:y:z")
+
+    greedy = UrnTemplate("urn:{a}:{b}", greedy=("a",))
+    assert greedy.parse("urn:x:y:z") == {"a": "x:y", "b": "z"}
+
+
+def test_repeated_placeholder_must_match_same_value():
+    template = UrnTemplate("urn:{a}:{b}:{a}")
+    assert template.parse("urn:x:y:x") == {"a": "x", "b": "y"}
+    assert not template.match("urn:x:y:z")
+
+
+def test_greedy_field_must_exist():
+    with pytest.raises(ConfigError):
+        UrnTemplate(GRAPH, greedy=("ts",))
+
+
+@pytest.mark.parametrize("cache_size", [0, 16])
+def test_build_parse_round_trip(cache_size):
+    template = UrnTemplate(SNAPSHOT, greedy=("ts",), cache_size=cache_size)
+    values = {"model": "ontology", "version": "v3", "env": "production", "ts": "20240101T000000Z"}
+
+    assert template.parse(template.build(**values)) == values
+    template.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"model": "a:b", "version": "v1", "env": "prod"},
+        {"model": "a", "version": "", "env": "prod"},
+        {"model": "a", "version": "v1", "env": "prod:snapshot:x"},
+    ],
+)
+def test_build_rejects_values_that_would_not_round_trip(values):
+    template = UrnTemplate(GRAPH)
+
+    with pytest.raises(ValueError, match="分隔符"):
+        template.build(**values)
+    with pytest.raises(ValueError, match="分隔符"):
+        template.build_row([values[name] for name in template.fields])
+    with pytest.raises(ValueError, match="分隔符"):
+        template.build_many({name: [value, "ok"] for name, value in values.items()})
+
+
+def test_greedy_values_round_trip():
+    template = UrnTemplate(SNAPSHOT, greedy=("ts",))
+    values = {"model": "m", "version": "v1.2", "env": "prod", "ts": "2024-01-01T00:00:00Z"}
+
+    assert template.parse(template.build(**values)) == values
+    assert [template.parse(urn)["ts"] for urn in template.build_many({**values, "ts": ["a:b", "c\nd"]})] == ["a:b", "c\nd"]
+
+
+def test_build_cache_is_lru():
+    template = UrnTemplate(GRAPH, cache_size=2)
+    first = template.build(model="a", version="v1", env="prod")
+    second = template.build(model="b", version="v1", env="prod")
+
+    # 再次使用 first 使其成为最近使用，随后加入的条目淘汰 second 而不是清空整个缓存
+    assert template.build(model="a", version="v1", env="prod") is first
+    template.build(model="c", version="v1", env="prod")
+    assert template.build(model="a", version="v1", env="prod") is first
+    assert template.build(model="b", version="v1", env="prod") is not second
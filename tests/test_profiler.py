@@ -0,0 +1,89 @@
+import asyncio
+import os
+import signal
+import time
+
+import pytest
+
+from common.exceptions.api import APIError
+from common.exceptions.codes import ErrorCode
+from common.observability.profiler import (
+    MIN_INTERVAL_SECONDS,
+    ProfilerBusyError,
+    SamplingProfiler,
+    get_profiler,
+    install_profiler_signal,
+)
+
+
+def test_duration_is_at_least_clamped_interval():
+    result = SamplingProfiler().profile(0.0, interval=0.0)
+    assert result.interval_seconds == MIN_INTERVAL_SECONDS
+    assert result.samples >= 1
+
+
+def test_second_session_is_rejected():
+    profiler = SamplingProfiler()
+    session = profiler.start(1.0)
+    try:
+        with pytest.raises(ProfilerBusyError):
+            profiler.start(1.0)
+    finally:
+        session.stop()
+    assert not profiler.running
+
+
+def test_session_keeps_its_own_result():
+    profiler = SamplingProfiler()
+    first = profiler.start(0.01)
+    first_result = first.wait(2.0)
+    second = profiler.start(0.01)
+    second_result = second.wait(2.0)
+    assert first_result is not None and second_result is not None
+    assert first.result is first_result
+    assert first_result is not second_result
+
+
+def _wait_for_profile(directory, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        files = list(directory.glob("sf-profile-*.folded"))
+        if files:
+            return files
+        time.sleep(0.01)
+    return []
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="requires SIGUSR2")
+def test_signal_starts_session_outside_handler(tmp_path):
+    previous = signal.getsignal(signal.SIGUSR2)
+    install_profiler_signal(duration=0.05, output_dir=tmp_path)
+    try:
+        os.kill(os.getpid(), signal.SIGUSR2)
+        assert _wait_for_profile(tmp_path)
+    finally:
+        signal.signal(signal.SIGUSR2, previous)
+        get_profiler().wait(2.0)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="requires SIGUSR2")
+def test_signal_uses_running_event_loop(tmp_path):
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        install_profiler_signal(duration=0.05, output_dir=tmp_path)
+        try:
+            os.kill(os.getpid(), signal.SIGUSR2)
+            await asyncio.sleep(0.01)
+            assert get_profiler().running
+            await asyncio.to_thread(get_profiler().wait, 2.0)
+        finally:
+            loop.remove_signal_handler(signal.SIGUSR2)
+
+    asyncio.run(scenario())
+    assert _wait_for_profile(tmp_path)
+
+
+def test_busy_is_reported_as_conflict():
+    exc = APIError(ErrorCode.RESOURCE_BUSY, "busy")
+    assert exc.http_status == 409
+    assert exc.as_dict()["code"] == int(ErrorCode.RESOURCE_BUSY)
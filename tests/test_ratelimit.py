@@ -0,0 +1,155 @@
+import asyncio
+import json
+import logging
+
+import pytest
+
+from common.config.registry import ConfigManager
+from common.config.settings import RateLimitConfig, RateLimitRule, Settings
+from common.utils import ratelimit
+from common.utils.ratelimit import RateLimitMiddleware, RedisSlidingWindowLimiter, TokenBucketLimiter
+from common.utils.tracing import TraceIdMiddleware
+
+
+def _limiter(clock, **kwargs):
+    config = RateLimitConfig(default=RateLimitRule(rate=1.0, burst=2), max_clients=100, **kwargs)
+    return TokenBucketLimiter(config, clock=clock)
+
+
+def test_full_table_evicts_only_refilled_buckets(clock):
+    limiter = _limiter(clock)
+    for i in range(100):
+        limiter.take(f"client-{i}")
+    clock.now = 1.0
+    assert limiter.take("new").allowed
+    assert len(limiter) == 1
+    assert "new" in limiter._slots
+
+
+def test_rotating_clients_share_overflow_bucket_when_table_is_busy(clock):
+    limiter = _limiter(clock)
+    for i in range(100):
+        limiter.take(f"client-{i}", 2)
+    decisions = [limiter.take(f"rotating-{i}") for i in range(10)]
+    assert [decision.allowed for decision in decisions] == [True, True] + [False] * 8
+    assert len(limiter) == 100
+    assert not limiter.take("client-0").allowed
+
+
+def test_overflow_clients_get_own_bucket_after_refill(clock):
+    limiter = _limiter(clock)
+    for i in range(100):
+        limiter.take(f"client-{i}", 2)
+    limiter.take("late")
+    clock.now = 2.0
+    assert limiter.take("late").allowed
+    assert "late" in limiter._slots
+
+
+class FailingRedis:
+    def __init__(self):
+        self.closed = False
+
+    async def eval(self, *args):
+        raise ConnectionError("down")
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_redis_unavailable_warning_is_throttled(caplog):
+    limiter = RedisSlidingWindowLimiter(FailingRedis(), RateLimitConfig(), namespace="test")
+
+    async def run():
+        for _ in range(50):
+            assert (await limiter.acquire("client")).allowed
+
+    with caplog.at_level(logging.WARNING, logger=ratelimit.__name__):
+        asyncio.run(run())
+    assert len(caplog.records) == 1
+
+
+def test_redis_client_closed_only_when_owned():
+    shared, owned = FailingRedis(), FailingRedis()
+    asyncio.run(RedisSlidingWindowLimiter(shared, RateLimitConfig(), namespace="test").aclose())
+    asyncio.run(RedisSlidingWindowLimiter(owned, RateLimitConfig(), namespace="test", owns_redis=True).aclose())
+    assert not shared.closed
+    assert owned.closed
+
+
+@pytest.fixture
+def settings_manager():
+    previous = ConfigManager._instance
+    yield lambda settings: setattr(ConfigManager, "_instance", ConfigManager(settings))
+    ConfigManager._instance = previous
+
+
+def test_middleware_closes_previous_backend_on_switch(settings_manager, monkeypatch):
+    created = []
+
+    def fake_create(settings):
+        limiter = (
+            RedisSlidingWindowLimiter(FailingRedis(), settings.security.rate_limit, namespace="t", owns_redis=True)
+            if settings.security.rate_limit.backend == "redis"
+            else TokenBucketLimiter(settings.security.rate_limit)
+        )
+        created.append(limiter)
+        return limiter
+
+    monkeypatch.setattr(ratelimit, "create_rate_limiter", fake_create)
+
+    async def app(scope, receive, send):
+        pass
+
+    middleware = RateLimitMiddleware(app)
+    scope = {"type": "http", "headers": [], "client": ("127.0.0.1", 1)}
+    base = Settings()
+    for backend in ("redis", "memory"):
+        security = base.security.model_copy(
+            update={"rate_limit": base.security.rate_limit.model_copy(update={"backend": backend, "enabled": True})}
+        )
+        settings_manager(base.model_copy(update={"security": security}))
+        asyncio.run(middleware(scope, None, None))
+
+    assert [limiter.backend for limiter in created] == ["redis", "memory"]
+    assert created[0]._redis.closed
+
+
+def _enabled_settings(**rule):
+    base = Settings()
+    rate_limit = base.security.rate_limit.model_copy(
+        update={"enabled": True, "backend": "memory", "default": RateLimitRule(**rule)}
+    )
+    security = base.security.model_copy(update={"rate_limit": rate_limit})
+    return base.model_copy(update={"security": security})
+
+
+@pytest.mark.parametrize(("sent", "valid"), [(b"abc", True), (b"bad id!", False)])
+def test_rejection_uses_bound_trace_id(settings_manager, sent, valid):
+    settings = _enabled_settings(rate=0.001, burst=1)
+    settings_manager(settings)
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    limiter = TokenBucketLimiter(settings.security.rate_limit)
+    middleware = TraceIdMiddleware(RateLimitMiddleware(app, limiter=limiter))
+    scope = {"type": "http", "headers": [(b"x-trace-id", sent)], "client": ("127.0.0.1", 1)}
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        await middleware(dict(scope), None, send)
+        messages.clear()
+        await middleware(dict(scope), None, send)
+
+    asyncio.run(run())
+    assert messages[0]["status"] == 429
+    headers = dict(messages[0]["headers"])
+    body = json.loads(messages[1]["body"])
+    assert headers[b"x-trace-id"].decode() == body["traceId"]
+    assert (body["traceId"] == "abc") is valid
+    assert body["traceId"] != "bad id!"
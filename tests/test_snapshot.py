@@ -0,0 +1,104 @@
+import asyncio
+import logging
+
+import pytest
+
+from common.rdf.memory import InMemorySparqlStore
+from common.rdf.naming import GraphNaming
+from common.rdf.snapshot import SnapshotManager
+
+NAMING = GraphNaming("urn:sf:{model}:{version}:{env}", "urn:sf:{model}:{version}:{env}:snapshot:{ts}")
+GRAPH = NAMING.graph_urn(model="m", version="v1", env="prod")
+KEY = {"model": "m", "version": "v1", "env": "prod"}
+
+
+def _triples(*ids):
+    return {f"<urn:s:{i}> <urn:p> <urn:o:{i}> ." for i in ids}
+
+
+def _snapshot(manager, ts):
+    return asyncio.run(manager.take_snapshot(ts=ts, **KEY))
+
+
+def _manager(store, **kwargs):
+    # run_size 与 chunk_bytes 取小值，覆盖外部排序落盘与分块提交
+    kwargs.setdefault("run_size", 3)
+    kwargs.setdefault("chunk_bytes", 64)
+    return SnapshotManager(store, NAMING, **kwargs)
+
+
+def test_incremental_snapshot_applies_exact_diff(tmp_path):
+    store = InMemorySparqlStore()
+    store.load(GRAPH, _triples(*range(10)))
+    manager = _manager(store, tmp_dir=tmp_path)
+
+    first = _snapshot(manager, "t1")
+    assert first.created and first.base is None
+    assert (first.inserted, first.deleted) == (10, 0)
+    assert store.graphs[first.urn] == _triples(*range(10))
+
+    store.graphs[GRAPH] = _triples(*range(3, 15))
+    second = _snapshot(manager, "t2")
+    assert second.base == first.urn
+    assert (second.inserted, second.deleted) == (5, 3)
+    assert store.graphs[second.urn] == store.graphs[GRAPH]
+    assert store.graphs[first.urn] == _triples(*range(10))
+    assert not list(tmp_path.iterdir())
+
+
+def test_unchanged_graph_creates_no_snapshot():
+    store = InMemorySparqlStore()
+    store.load(GRAPH, _triples(1, 2))
+    manager = _manager(store)
+    first = _snapshot(manager, "t1")
+    updates = store.update_count
+
+    result = _snapshot(manager, "t2")
+    assert not result.created
+    assert result.urn == result.base == first.urn
+    assert store.update_count == updates
+    assert [item.ts for item in asyncio.run(manager.list_snapshots(**KEY))] == ["t1"]
+
+
+def test_retention_prunes_oldest_snapshots():
+    store = InMemorySparqlStore()
+    manager = _manager(store, retention=2)
+    pruned = []
+    for i in range(4):
+        store.graphs[GRAPH] = _triples(i)
+        pruned.extend(_snapshot(manager, f"t{i}").pruned)
+
+    assert [item.ts for item in asyncio.run(manager.list_snapshots(**KEY))] == ["t2", "t3"]
+    assert pruned == [NAMING.snapshot_urn(ts=f"t{i}", **KEY) for i in (0, 1)]
+
+
+class FailingStore(InMemorySparqlStore):
+    def __init__(self, fail_after, *, fail_drop=False):
+        super().__init__()
+        self.fail_after = fail_after
+        self.fail_drop = fail_drop
+
+    async def update(self, sparql, *, timeout=None):
+        if sparql.startswith("DROP"):
+            if self.fail_drop:
+                raise ConnectionError("drop failed")
+        elif self.update_count >= self.fail_after:
+            raise ConnectionError("store down")
+        await super().update(sparql, timeout=timeout)
+
+
+@pytest.mark.parametrize("fail_drop", [False, True])
+def test_failure_mid_apply_drops_partial_snapshot(fail_drop, caplog):
+    store = FailingStore(fail_after=2, fail_drop=fail_drop)
+    store.load(GRAPH, _triples(*range(20)))
+    manager = _manager(store)
+    target = NAMING.snapshot_urn(ts="t1", **KEY)
+
+    with caplog.at_level(logging.ERROR), pytest.raises(ConnectionError, match="store down"):
+        _snapshot(manager, "t1")
+
+    if fail_drop:
+        assert "failed to drop partial snapshot" in caplog.text
+    else:
+        assert target not in store.graphs
+        assert not caplog.records
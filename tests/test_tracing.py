@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import time
+
+from common.logging.context import bind_trace_id, get_trace_id
+from common.observability.loop_monitor import EventLoopMonitor
+from common.utils.tracing import TraceIdMiddleware, parse_traceparent
+
+TRACEPARENT = b"00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+def _serve(headers):
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["trace_id"] = get_trace_id()
+        seen["state"] = scope["state"]["trace_id"]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        seen["headers"] = message["headers"]
+
+    middleware = TraceIdMiddleware(app, header="X-Trace-Id")
+    asyncio.run(middleware({"type": "http", "headers": headers}, None, send))
+    assert seen["trace_id"] == seen["state"]
+    assert (b"X-Trace-Id", seen["trace_id"].encode()) in seen["headers"]
+    return seen["trace_id"]
+
+
+def test_trace_header_takes_precedence():
+    assert _serve([(b"traceparent", TRACEPARENT), (b"x-trace-id", b"abc-123")]) == "abc-123"
+
+
+def test_traceparent_is_used_when_trace_header_missing():
+    assert _serve([(b"traceparent", TRACEPARENT)]) == "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def test_invalid_headers_generate_new_trace_id():
+    generated = _serve([(b"x-trace-id", b"bad id\n"), (b"traceparent", b"00-zz-00-01")])
+    assert len(generated) == 36
+    assert get_trace_id() is None
+
+
+def test_parse_traceparent_rejects_zero_trace_id():
+    assert parse_traceparent(b"00-" + b"0" * 32 + b"-00f067aa0ba902b7-01") is None
+
+
+def test_loop_monitor_reports_blocking_task_and_trace_id():
+    records = []
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger = logging.getLogger("test.loop_monitor")
+    logger.addHandler(Collect())
+
+    async def blocker():
+        bind_trace_id("trace-1")
+        time.sleep(0.3)
+        await asyncio.sleep(0.1)
+
+    async def run():
+        async with EventLoopMonitor(interval=0.02, block_threshold=0.05, logger=logger):
+            await asyncio.sleep(0.05)
+            await asyncio.create_task(blocker(), name="blocker")
+
+    asyncio.run(run())
+    assert records
+    record = records[0]
+    assert record.task == "blocker"
+    assert record.trace_id == "trace-1"
+    assert record.coroutine == "test_loop_monitor_reports_blocking_task_and_trace_id.<locals>.blocker"
+    assert record.blocked_seconds >= 0.2
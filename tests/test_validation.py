@@ -0,0 +1,74 @@
+import pytest
+from pydantic import BaseModel, Field
+
+from common.exceptions.api import ContractViolation
+from common.models.validation import BATCH_TOO_LARGE_MESSAGE, BatchValidator, list_adapter, validate_batch
+
+
+class Item(BaseModel):
+    id: str = Field(min_length=1)
+    score: float = Field(ge=0, le=1)
+
+
+def _items(count, invalid=()):
+    return [{"id": f"urn:sf:{i}", "score": 2.0 if i in invalid else i / count} for i in range(count)]
+
+
+def test_valid_batch_returns_models():
+    result = BatchValidator(Item).validate(_items(5))
+
+    assert [item.id for item in result] == [f"urn:sf:{i}" for i in range(5)]
+    assert all(isinstance(item, Item) for item in result)
+
+
+def test_invalid_items_are_merged_with_their_indexes():
+    items = _items(10, invalid={2, 7})
+    items[4]["id"] = ""
+
+    with pytest.raises(ContractViolation) as info:
+        BatchValidator(Item).validate(items)
+
+    details = info.value.details
+    assert details["total"] == 3
+    assert not details["truncated"]
+    assert [(error["loc"][0], error["loc"][1]) for error in details["errors"]] == [(2, "score"), (4, "id"), (7, "score")]
+    assert all(set(error) == {"loc", "msg", "type"} for error in details["errors"])
+
+
+def test_error_limit_truncates_details():
+    with pytest.raises(ContractViolation) as info:
+        BatchValidator(Item, error_limit=2).validate(_items(10, invalid=set(range(10))))
+
+    details = info.value.details
+    assert len(details["errors"]) == 2
+    assert details["total"] == 10
+    assert details["truncated"]
+
+
+def test_max_items_is_enforced():
+    validator = BatchValidator(Item, max_items=3)
+
+    with pytest.raises(ContractViolation, match=BATCH_TOO_LARGE_MESSAGE) as info:
+        validator.validate(_items(4))
+    assert info.value.details == {"size": 4, "max_size": 3}
+
+    with pytest.raises(ContractViolation, match=BATCH_TOO_LARGE_MESSAGE):
+        validator.validate_json(b'[{"id": "a", "score": 0}, {"id": "b", "score": 0}, {"id": "c", "score": 0}, {"id": "d", "score": 0}]')
+
+
+def test_validate_json_reports_indexes():
+    with pytest.raises(ContractViolation) as info:
+        BatchValidator(Item).validate_json(b'[{"id": "a", "score": 0.5}, {"id": "b", "score": 5}]')
+
+    assert tuple(info.value.details["errors"][0]["loc"]) == (1, "score")
+
+
+def test_type_adapter_is_compiled_once_per_schema():
+    first, second = BatchValidator(Item), BatchValidator(Item, max_items=10)
+
+    assert first._adapter is second._adapter is list_adapter(Item)
+
+    hits = list_adapter.cache_info().hits
+    validate_batch(Item, _items(2), max_items=10)
+    validate_batch(Item, _items(3), max_items=10)
+    assert list_adapter.cache_info().hits == hits + 1